@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+from libcapella.organization import CapellaOrganization
+from libcapella.project import CapellaProject
+from libcapella.database import CapellaDatabase
+from libcapella.columnar import CapellaColumnar
+from libcapella.database_credentials import CapellaDatabaseCredentials
+from libcapella.database_allowed_cidr import CapellaAllowedCIDR
+from libcapella.network_peers import CapellaNetworkPeers
+from libcapella.app_service import CapellaAppService
+from libcapella.user import CapellaUser
+
+rounds = 10
+
+
+def resolve(config):
+    org = CapellaOrganization(config)
+    project = CapellaProject(org)
+    return CapellaDatabase(project)
+
+
+def test_organization(benchmark, mock_config, cold_cache):
+    org = benchmark.pedantic(CapellaOrganization, args=(mock_config,), setup=cold_cache, rounds=rounds)
+    assert org.id is not None
+
+
+def test_resolve_chain_cold(benchmark, mock_config, cold_cache):
+    database = benchmark.pedantic(resolve, args=(mock_config,), setup=cold_cache, rounds=rounds)
+    assert database.id is not None
+
+
+def test_resolve_chain_cached(benchmark, mock_config, cold_cache):
+    resolve(mock_config)
+    database = benchmark.pedantic(resolve, args=(mock_config,), rounds=rounds)
+    assert database.id is not None
+
+
+def test_project_list(benchmark, mock_config):
+    project = CapellaProject(CapellaOrganization(mock_config))
+    assert len(benchmark.pedantic(project.list, rounds=rounds)) == 5
+
+
+def test_user_list(benchmark, mock_config):
+    user = CapellaUser(CapellaOrganization(mock_config))
+    assert len(benchmark.pedantic(user.list, rounds=rounds)) == 500
+
+
+def test_user_iter(benchmark, mock_config):
+    user = CapellaUser(CapellaOrganization(mock_config))
+    assert benchmark.pedantic(lambda: sum(1 for _ in user.iter_users(prefetch=True)), rounds=rounds) == 500
+
+
+def test_database_list(benchmark, mock_config):
+    database = resolve(mock_config)
+    assert len(benchmark.pedantic(database.list, rounds=rounds)) == 4
+
+
+def test_columnar_list(benchmark, mock_config):
+    columnar = CapellaColumnar(CapellaProject(CapellaOrganization(mock_config)))
+    assert len(benchmark.pedantic(columnar.list, rounds=rounds)) == 2
+
+
+def test_allowed_cidr_list(benchmark, mock_config):
+    cidrs = CapellaAllowedCIDR(resolve(mock_config))
+    assert len(benchmark.pedantic(cidrs.list, rounds=rounds)) == 300
+
+
+def test_credentials_list(benchmark, mock_config):
+    credentials = CapellaDatabaseCredentials(resolve(mock_config))
+    assert len(benchmark.pedantic(credentials.list, rounds=rounds)) == 120
+
+
+def test_network_peers_list(benchmark, mock_config):
+    peers = CapellaNetworkPeers(resolve(mock_config))
+    assert len(benchmark.pedantic(peers.list, rounds=rounds)) == 20
+
+
+def test_app_service_list(benchmark, mock_config):
+    app_service = CapellaAppService(resolve(mock_config))
+    assert len(benchmark.pedantic(app_service.list, rounds=rounds)) == 20
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import os
+import time
+import tempfile
+from libcapella.config import CapellaConfig
+from libcapella.config_cache import config_cache
+from libcapella.config_profile import CapellaProfileConfig
+
+
+def write_profiles(directory: str, count: int):
+    os.makedirs(os.path.join(directory, ".capella"))
+    with open(os.path.join(directory, ".capella", "credentials"), "w") as config_file:
+        config_file.write("[default]\ntoken_file = default-api-key-token.txt\naccount_email = user@example.com\n")
+        for n in range(count):
+            config_file.write(f"\n[profile-{n}]\nproject = project-{n}\napi_host = api-{n}.example.com\nrate_limit = 10\nlazy = true\n")
+    with open(os.path.join(directory, ".capella", "default-api-key-token.txt"), "w") as token_file:
+        token_file.write("APIKeyId: id\nAPIKeyToken: token\n")
+
+
+def measure(label: str, function, iterations: int):
+    start = time.perf_counter()
+    for n in range(iterations):
+        function(n)
+    elapsed = (time.perf_counter() - start) * 1000000 / iterations
+    print(f"{label:>24} {elapsed:>10.1f}")
+
+
+def main():
+    iterations = 2000
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["HOME"] = directory
+        write_profiles(directory, 50)
+        print(f"{'config':>24} {'us/config':>10}")
+        measure("profile, no cache", lambda n: (config_cache.clear(), CapellaConfig(profile=f"profile-{n % 50}")), iterations)
+        config_cache.clear()
+        measure("profile, cached", lambda n: CapellaConfig(profile=f"profile-{n % 50}"), iterations)
+        measure("load_all (50 profiles)", lambda n: CapellaProfileConfig.load_all(), 20)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+import pytest
+from libcapella.mock_api import MockCapellaAPI
+from libcapella.config import CapellaConfig
+from libcapella.cache import resolution_cache
+from libcapella.user_directory import CapellaUserDirectory
+from libcapella.pool import session_pool
+
+
+def pytest_configure(config):
+    config.addinivalue_line("python_files", "bench_*.py")
+
+
+@pytest.fixture(scope="session")
+def mock_api():
+    api = MockCapellaAPI(latency=0.002)
+    ids = api.populate(projects=5, databases=4, columnar=2, users=500, allowed_cidrs=300, credentials=120, network_peers=20, app_services=True)
+    api.start()
+    api.ids = ids
+    yield api
+    api.stop()
+    session_pool.close()
+
+
+@pytest.fixture(scope="session")
+def mock_config(mock_api):
+    return CapellaConfig(config_dict=mock_api.config(account_email=mock_api.ids["account_email"], project_name="default", database_name="database-0"))
+
+
+@pytest.fixture()
+def cold_cache():
+    def clear():
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+    clear()
+    yield clear
+    clear()
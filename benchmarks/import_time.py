@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+import sys
+import subprocess
+from typing import Dict, Tuple
+
+entry_points = ("libcapella",
+                "libcapella.config",
+                "libcapella.logic.database",
+                "libcapella.logic.inventory",
+                "libcapella.organization",
+                "libcapella.database",
+                "libcapella.inventory")
+
+
+def import_profile(module: str) -> Dict[str, Tuple[int, int]]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True)
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(own), int(cumulative))
+    return profile
+
+
+def main():
+    print(f"{'module':>28} {'total ms':>9} {'libcapella ms':>14} {'modules':>8}")
+    for module in entry_points:
+        profile = import_profile(module)
+        own = sum(t for name, (t, _) in profile.items() if name.startswith("libcapella"))
+        print(f"{module:>28} {profile[module][1] / 1000:>9.1f} {own / 1000:>14.1f} {len(profile):>8}")
+    profile = import_profile("libcapella.database")
+    print("slowest third party imports under libcapella.database:")
+    heavy = sorted(((c, n) for n, (_, c) in profile.items() if "." not in n and n != "site" and not n.startswith("libcapella")), reverse=True)[:5]
+    for cumulative, name in heavy:
+        print(f"{name:>28} {cumulative / 1000:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
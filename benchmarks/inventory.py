@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import time
+from libcapella.mock_api import MockCapellaAPI
+from libcapella.config import CapellaConfig
+from libcapella.organization import CapellaOrganization
+from libcapella.project import CapellaProject
+from libcapella.database import CapellaDatabase
+from libcapella.columnar import CapellaColumnar
+from libcapella.app_service import CapellaAppService
+from libcapella.database_allowed_cidr import CapellaAllowedCIDR
+from libcapella.columnar_allowed_cidr import ColumnarAllowedCIDR
+from libcapella.database_credentials import CapellaDatabaseCredentials
+from libcapella.network_peers import CapellaNetworkPeers
+from libcapella.user import CapellaUser
+from libcapella.inventory import CapellaInventory
+from libcapella.cache import resolution_cache
+from libcapella.user_directory import CapellaUserDirectory
+
+
+def nested(org: CapellaOrganization) -> int:
+    count = len(CapellaUser(org).list())
+    for project in CapellaProject(org).list():
+        capella_project = CapellaProject(org, project.name)
+        count += 1
+        for database in CapellaDatabase(capella_project).list():
+            capella_database = CapellaDatabase(capella_project, database.name)
+            count += 1 + len(CapellaAllowedCIDR(capella_database).list()) + len(CapellaDatabaseCredentials(capella_database).list())
+            count += len(CapellaNetworkPeers(capella_database).list()) + (1 if CapellaAppService(capella_database).app_service else 0)
+        for columnar in CapellaColumnar(capella_project).list():
+            count += 1 + len(ColumnarAllowedCIDR(CapellaColumnar(capella_project, columnar.name)).list())
+    return count
+
+
+def measure(api: MockCapellaAPI, function) -> tuple:
+    resolution_cache.clear()
+    CapellaUserDirectory.reset()
+    api.reset_counts()
+    start = time.perf_counter()
+    count = function()
+    return count, api.request_count, (time.perf_counter() - start) * 1000
+
+
+def main():
+    with MockCapellaAPI(latency=0.01) as api:
+        ids = api.populate(projects=4, databases=5, columnar=2, users=50, allowed_cidrs=3, credentials=2, network_peers=1, app_services=True)
+        org = CapellaOrganization(CapellaConfig(config_dict=api.config(account_email=ids["account_email"])))
+        print(f"latency {api.latency * 1000:.0f} ms per request")
+        print(f"{'method':>20} {'items':>6} {'requests':>9} {'ms':>8}")
+        previous = CapellaInventory(org).crawl()
+        for label, function in (("nested resources", lambda: nested(org)),
+                                ("inventory 1 worker", lambda: len(CapellaInventory(org, workers=1).crawl().items)),
+                                ("inventory 8 workers", lambda: len(CapellaInventory(org, workers=8).crawl().items)),
+                                ("inventory refresh", lambda: len(CapellaInventory(org, workers=8).refresh(previous)[0].items))):
+            count, requests, elapsed = measure(api, function)
+            print(f"{label:>20} {count:>6} {requests:>9} {elapsed:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
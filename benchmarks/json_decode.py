@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+import json
+import timeit
+from libcapella.codec import backends, get_backend
+from libcapella.logic.database import Database
+from benchmarks.model_decode import samples
+
+
+def page(count: int) -> bytes:
+    data = []
+    for n in range(count):
+        record = dict(samples[Database])
+        record.update(id=f"cluster-{n:06d}", name=f"cluster-{n}")
+        data.append(record)
+    return json.dumps(dict(data=data, cursor=dict(pages=dict(page=1, last=1, perPage=count, totalItems=count), hrefs={}))).encode()
+
+
+def pages_per_second(decode, body: bytes, count: int = 200, repeat: int = 5) -> float:
+    return count / min(timeit.repeat(lambda: decode(body), number=count, repeat=repeat))
+
+
+def main():
+    body = page(1000)
+    print(f"page size {len(body) / 1024:.0f} KiB, 1000 records")
+    print(f"{'backend':>16} {'pages/s':>9} {'MB/s':>8} {'records/s':>11}")
+    rows = [("restfull (text)", lambda b: json.loads(b.decode("utf-8")))]
+    for name in backends:
+        try:
+            codec = get_backend(name)
+        except ImportError:
+            continue
+        rows.append((name, codec.loads))
+    for label, decode in rows:
+        rate = pages_per_second(decode, body)
+        print(f"{label:>16} {rate:>9,.0f} {rate * len(body) / 1e6:>8,.0f} {rate * 1000:>11,.0f}")
+
+
+if __name__ == '__main__':
+    main()
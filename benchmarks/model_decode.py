@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+import timeit
+from libcapella.logic import database, columnar, network_peers, credentials
+from libcapella.logic.common import Audit
+from libcapella.logic.database import Database
+from libcapella.logic.columnar import Columnar
+from libcapella.logic.app_service import AppService
+from libcapella.logic.user import User
+from libcapella.logic.network_peers import NetworkPeers
+from libcapella.logic.credentials import DatabaseCredentials
+
+audit = dict(createdBy="user", createdAt="2024-01-01T00:00:00Z", modifiedBy="user", modifiedAt="2024-01-02T00:00:00Z", version=3)
+
+samples = {
+    Database: dict(
+        id="c1", name="cluster", description="cluster", configurationType="multiNode", connectionString="couchbases://cb.example.com",
+        cloudProvider=dict(type="aws", region="us-east-1", cidr="10.0.0.0/23"),
+        couchbaseServer=dict(version="7.6"),
+        serviceGroups=[dict(node=dict(compute=dict(cpu=4, ram=16), disk=dict(storage=256, type="gp3", iops=3000)), numOfNodes=3, services=["data", "query", "index"])] * 3,
+        availability=dict(type="multi"), support=dict(plan="enterprise", timezone="ET"), currentState="healthy", audit=audit),
+    Columnar: dict(
+        id="a1", name="columnar", description="columnar", cloudProvider="aws", region="us-east-1", nodes=2, currentState="healthy",
+        support=dict(plan="enterprise", timezone="ET"), compute=dict(cpu=4, ram=32), availability=dict(type="single")),
+    AppService: dict(
+        id="s1", name="appservice", description="app service", cloudProvider="aws", nodes=2, compute=dict(cpu=2, ram=4),
+        clusterId="c1", currentState="healthy", version="3.1", audit=audit),
+    User: dict(
+        id="u1", name="User", email="user@example.com", status="verified", inactive=False, organizationId="o1",
+        organizationRoles=["organizationMember"], lastLogin="2024-01-01T00:00:00Z", region="us", timeZone="PT", enableNotifications=True,
+        expiresAt="2025-01-01T00:00:00Z", resources=[dict(type="project", id=f"p{n}", roles=["projectOwner"]) for n in range(4)], audit=audit),
+    NetworkPeers: dict(
+        id="n1", name="peer", providerType="aws", status=dict(state="complete", reasoning=""), commands=["aws ec2 accept"],
+        providerConfig=dict(providerId="pcx-1", AWSConfig=dict(accountId="123", vpcId="vpc-1", region="us-east-1", cidr="10.1.0.0/23")), audit=audit),
+    DatabaseCredentials: dict(
+        id="d1", name="app", audit=audit,
+        access=[dict(privileges=["data_reader"], resources=dict(buckets=[dict(name="b", scopes=[dict(name="s", collections=["c1", "c2"])])]))]),
+}
+
+
+def baseline_audit(data: dict) -> Audit:
+    return Audit(
+        data.get("audit", {}).get("createdBy"),
+        data.get("audit", {}).get("createdAt"),
+        data.get("audit", {}).get("modifiedBy"),
+        data.get("audit", {}).get("modifiedAt"),
+        data.get("audit", {}).get("version")
+    )
+
+
+def baseline_database(data: dict) -> Database:
+    return Database(
+        data.get("id"),
+        data.get("appServiceId"),
+        data.get("name"),
+        data.get("description"),
+        data.get("configurationType"),
+        data.get("connectionString"),
+        database.CloudProvider(
+            data.get("cloudProvider", {}).get("type"),
+            data.get("cloudProvider", {}).get("region"),
+            data.get("cloudProvider", {}).get("cidr"),
+        ),
+        database.CouchbaseServer(
+            data.get("couchbaseServer", {}).get("version"),
+        ),
+        [
+            database.ServiceGroup(
+                database.NodeConfig(
+                    database.ComputeConfig(
+                        g.get("node", {}).get("compute", {}).get("cpu"),
+                        g.get("node", {}).get("compute", {}).get("ram"),
+                    ),
+                    database.StorageConfig(
+                        g.get("node", {}).get("disk", {}).get("storage"),
+                        g.get("node", {}).get("disk", {}).get("type"),
+                        g.get("node", {}).get("disk", {}).get("iops"),
+                    )
+                ),
+                g.get("numOfNodes"),
+                g.get("services"),
+            ) for g in data.get("serviceGroups", [])
+        ],
+        database.Availability(
+            database.NodeAvailability(data.get("availability", {}).get("type", "multi"))
+        ),
+        database.Support(
+            database.SupportPlan(data.get("support", {}).get("plan", "developer pro")),
+            database.SupportTZ(data.get("support", {}).get("timezone", "PT"))
+        ),
+        data.get("currentState"),
+        baseline_audit(data),
+        data.get("cmekId"),
+    )
+
+
+def baseline_columnar(data: dict) -> Columnar:
+    return Columnar(
+        data.get("id"),
+        data.get("name"),
+        data.get("description"),
+        data.get("cloudProvider"),
+        data.get("region"),
+        data.get("nodes"),
+        data.get("currentState"),
+        columnar.Support(
+            columnar.SupportPlan(data.get("support", {}).get("plan", "developer pro")),
+            columnar.SupportTZ(data.get("support", {}).get("timezone", "PT"))
+        ),
+        columnar.ComputeConfig(
+            data.get("compute", {}).get("cpu"),
+            data.get("compute", {}).get("ram"),
+        ),
+        columnar.Availability(
+            columnar.NodeAvailability(data.get("availability", {}).get("type", "multi"))
+        )
+    )
+
+
+def baseline_network_peers(data: dict) -> NetworkPeers:
+    return NetworkPeers(
+        data.get("id"),
+        data.get("name"),
+        data.get("providerType"),
+        network_peers.NetworkPeerStatus(
+            data.get("status", {}).get("state"),
+            data.get("status", {}).get("reasoning"),
+        ),
+        data.get("commands", []),
+        network_peers.ProviderConfig(
+            data.get("providerConfig", {}).get("providerId"),
+            network_peers.AWSConfig(
+                data.get("providerConfig").get("AWSConfig").get("accountId"),
+                data.get("providerConfig").get("AWSConfig").get("vpcId"),
+                data.get("providerConfig").get("AWSConfig").get("region"),
+                data.get("providerConfig").get("AWSConfig").get("cidr"),
+            ) if data.get("providerConfig", {}).get("AWSConfig") else None,
+            network_peers.GCPConfig(
+                data.get("providerConfig").get("GCPConfig").get("networkName"),
+                data.get("providerConfig").get("GCPConfig").get("cidr"),
+                data.get("providerConfig").get("GCPConfig").get("projectId"),
+                data.get("providerConfig").get("GCPConfig").get("serviceAccountId"),
+            ) if data.get("providerConfig", {}).get("GCPConfig") else None,
+            network_peers.AzureConfig(
+                data.get("providerConfig").get("AzureConfig").get("azureTenantId"),
+                data.get("providerConfig").get("AzureConfig").get("subscriptionId"),
+                data.get("providerConfig").get("AzureConfig").get("resourceGroup"),
+                data.get("providerConfig").get("AzureConfig").get("vnetId"),
+                data.get("providerConfig").get("AzureConfig").get("cidr"),
+            ) if data.get("providerConfig", {}).get("AzureConfig") else None,
+        ),
+        baseline_audit(data)
+    )
+
+
+def baseline_credentials(data: dict) -> DatabaseCredentials:
+    return DatabaseCredentials(
+        data.get("id"),
+        data.get("name"),
+        data.get("password"),
+        baseline_audit(data),
+        [
+            credentials.Access(
+                a.get("privileges", []),
+                credentials.ResourceBucket(
+                    [
+                        credentials.BucketAccessSpec(
+                            b.get("name"),
+                            [
+                                credentials.ResourceScope(
+                                    s.get("name"),
+                                    s.get("collections", []),
+                                ) for s in b.get("scopes", [])
+                            ]
+                        ) for b in a.get("resources", {}).get("buckets", [])
+                    ]
+                )
+            ) for a in data.get("access", [])
+        ]
+    )
+
+
+baseline = {
+    Database: baseline_database,
+    Columnar: baseline_columnar,
+    NetworkPeers: baseline_network_peers,
+    DatabaseCredentials: baseline_credentials,
+}
+
+
+def objects_per_second(create, data: dict, count: int = 20000, repeat: int = 7) -> float:
+    timeit.timeit(lambda: create(data), number=count)
+    return count / min(timeit.repeat(lambda: create(data), number=count, repeat=repeat))
+
+
+def main():
+    print(f"{'model':>20} {'baseline/s':>12} {'create/s':>12} {'speedup':>8}")
+    for model, data in samples.items():
+        if model not in baseline:
+            continue
+        assert baseline[model](data) == model.create(data), f"{model.__name__}: baseline decoder differs"
+        before = objects_per_second(baseline[model], data)
+        after = objects_per_second(model.create, data)
+        print(f"{model.__name__:>20} {before:>12,.0f} {after:>12,.0f} {after / before:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
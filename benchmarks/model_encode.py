@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+import json
+import attrs
+import timeit
+from libcapella.logic.common import not_none, serialize, serialize_bytes, no_audit
+from benchmarks.model_decode import samples
+
+
+def asdict_striped(model) -> bytes:
+    result = not_none(attrs.asdict(model))
+    result.pop("audit", None)
+    return json.dumps(result).encode()
+
+
+def objects_per_second(encode, model, count: int = 20000, repeat: int = 5) -> float:
+    return count / min(timeit.repeat(lambda: encode(model), number=count, repeat=repeat))
+
+
+def main():
+    print(f"{'model':>20} {'asdict+not_none':>16} {'serialize':>12} {'bytes':>12}")
+    for model, data in samples.items():
+        obj = model.create(data)
+        rates = [objects_per_second(asdict_striped, obj),
+                 objects_per_second(lambda o: json.dumps(serialize(o, filter=no_audit)).encode(), obj),
+                 objects_per_second(lambda o: serialize_bytes(o, filter=no_audit), obj)]
+        print(f"{model.__name__:>20} {rates[0]:>16,.0f} {rates[1]:>12,.0f} {rates[2]:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+import gc
+import json
+import tracemalloc
+from libcapella.logic.user import User, UserTable
+from libcapella.logic.database import Database
+from benchmarks.model_decode import samples
+
+
+def users(count: int) -> list:
+    result = []
+    for n in range(count):
+        record = dict(samples[User])
+        record.update(id=f"user-{n:06d}", email=f"user{n}@example.com", name=f"User {n}",
+                      resources=[dict(type="project", id=f"project-{n % 50}", roles=["projectOwner"])])
+        result.append(record)
+    return result
+
+
+def databases(count: int) -> list:
+    result = []
+    for n in range(count):
+        record = dict(samples[Database])
+        record.update(id=f"cluster-{n:06d}", name=f"cluster-{n}")
+        result.append(record)
+    return result
+
+
+def measure(build, records: list) -> float:
+    payload = json.dumps(records)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(json.loads(payload))
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return used / len(records)
+
+
+def main():
+    count = 20000
+    user_records = users(count)
+    database_records = databases(count)
+    rows = [
+        ("user dict records", lambda r: r, user_records),
+        ("User objects", lambda r: [User.create(u) for u in r], user_records),
+        ("UserTable", lambda r: UserTable.from_records(r), user_records),
+        ("database dict records", lambda r: r, database_records),
+        ("Database objects", lambda r: [Database.create(d) for d in r], database_records),
+    ]
+    print(f"{'representation':>24} {'bytes/object':>13}")
+    for label, build, records in rows:
+        print(f"{label:>24} {measure(build, records):>13,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import os
+import time
+import random
+import tempfile
+import ipaddress
+from typing import List, Union
+from libcapella.network_util import NetworkDriver
+from libcapella.network_allocator import NetworkAllocator
+
+
+def legacy_next_network(ip_space: List[ipaddress.IPv4Network], super_net: ipaddress.IPv4Network) -> Union[str, None]:
+    candidates = list(super_net.subnets(new_prefix=16))
+    for network in ip_space:
+        available = []
+        for candidate in candidates:
+            try:
+                if network.prefixlen < 16:
+                    list(network.address_exclude(candidate))
+                else:
+                    list(candidate.address_exclude(network))
+            except ValueError:
+                available.append(candidate)
+        candidates = available
+    return candidates[0].exploded if candidates else None
+
+
+def existing_networks(count: int, seed: int = 1) -> List[str]:
+    rng = random.Random(seed)
+    networks = set()
+    while len(networks) < count:
+        prefix = rng.choice((16, 20, 24, 24, 24))
+        address = (10 << 24) | (rng.randrange(200) << 16) | rng.getrandbits(16)
+        networks.add(ipaddress.ip_network((address, prefix), strict=False).exploded)
+    return sorted(networks)
+
+
+def main():
+    print(f"{'networks':>9} {'legacy ms':>10} {'driver ms':>10} {'alloc us':>9} {'free us':>8}")
+    for count in (100, 1000, 5000):
+        networks = existing_networks(count)
+        ip_space = [ipaddress.ip_network(n) for n in networks]
+        start = time.perf_counter()
+        expected = legacy_next_network(ip_space, ipaddress.ip_network("10.0.0.0/8")) if count <= 1000 else None
+        legacy = (time.perf_counter() - start) * 1000 if count <= 1000 else float("nan")
+
+        driver = NetworkDriver()
+        for cidr in networks:
+            driver.add_network(cidr)
+        start = time.perf_counter()
+        result = driver.get_next_network()
+        elapsed = (time.perf_counter() - start) * 1000
+        assert expected is None or result == expected
+
+        allocator = driver.allocator
+        start = time.perf_counter()
+        allocated = [allocator.allocate(24) for _ in range(1000)]
+        allocate = (time.perf_counter() - start) * 1000000 / 1000
+        start = time.perf_counter()
+        for cidr in allocated:
+            allocator.release(cidr)
+        release = (time.perf_counter() - start) * 1000000 / 1000
+        print(f"{count:>9} {legacy:>10.1f} {elapsed:>10.1f} {allocate:>9.1f} {release:>8.1f}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "networks.json")
+        allocator.save(filename)
+        start = time.perf_counter()
+        restored = NetworkAllocator.load(filename)
+        print(f"reload {len(restored.reserved)} reservations: {(time.perf_counter() - start) * 1000:.1f} ms")
+        assert restored.reserved == allocator.reserved
+
+
+if __name__ == '__main__':
+    main()
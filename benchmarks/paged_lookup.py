@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+import json
+import time
+import asyncio
+from urllib.parse import urlparse, parse_qs
+from restfull.restapi import RestAPI
+from restfull.bearer_auth import BearerAuth
+from libcapella.paging import CapellaPager
+
+
+class MemoryRestAPI(RestAPI):
+
+    def __init__(self, records: list):
+        super().__init__(BearerAuth("benchmark"), "localhost")
+        self.collection = records
+        self.requests = 0
+
+    def page(self, endpoint: str) -> str:
+        query = parse_qs(urlparse(endpoint).query)
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("perPage", ["10"])[0])
+        last = max(1, -(-len(self.collection) // per_page))
+        self.requests += 1
+        return json.dumps({
+            "data": self.collection[(page - 1) * per_page:page * per_page],
+            "cursor": {"pages": {"page": page, "last": last, "perPage": per_page, "totalItems": len(self.collection)}}
+        })
+
+    def get(self, endpoint: str):
+        self.reset()
+        self.response_text = self.page(endpoint)
+        self.response_code = 200
+        return self
+
+    def get_by_page(self, endpoint: str, page_tag: str = "page", page: int = 1, per_page_tag=None, per_page: int = 10):
+        return self.get(self.paged_endpoint(endpoint, page_tag, page, per_page_tag, per_page))
+
+    async def get_data_async(self, endpoint: str, data_key=None):
+        await asyncio.sleep(0)
+        return json.loads(self.page(endpoint)).get(data_key)
+
+
+def full_scan(rest: MemoryRestAPI, name: str):
+    return rest.get_paged("/clusters",
+                          total_tag="totalItems",
+                          pages_tag="last",
+                          per_page_tag="perPage",
+                          per_page=50,
+                          cursor="cursor",
+                          category="pages").validate().filter("name", name).list_item(0)
+
+
+def streaming(rest: MemoryRestAPI, name: str):
+    return CapellaPager(rest, "/clusters", per_page=50).find("name", name)
+
+
+def measure(function, rest: MemoryRestAPI, name: str, rounds: int = 20):
+    rest.requests = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function(rest, name)
+    elapsed = (time.perf_counter() - start) / rounds
+    return rest.requests / rounds, elapsed * 1000
+
+
+def main():
+    print(f"{'items':>6} {'match':>8} {'scan pages':>11} {'scan ms':>8} {'stream pages':>13} {'stream ms':>10}")
+    for size in (100, 1000, 5000):
+        records = [dict(id=f"id-{n}", name=f"cluster-{n}") for n in range(size)]
+        rest = MemoryRestAPI(records)
+        for label, position in (("first", 0), ("middle", size // 2), ("last", size - 1), ("missing", None)):
+            name = f"cluster-{position}" if position is not None else "no-such-cluster"
+            scan_pages, scan_ms = measure(full_scan, rest, name)
+            stream_pages, stream_ms = measure(streaming, rest, name)
+            print(f"{size:>6} {label:>8} {scan_pages:>11.0f} {scan_ms:>8.2f} {stream_pages:>13.0f} {stream_ms:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
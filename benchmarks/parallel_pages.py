@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import time
+from restfull.restapi import RestAPI
+from restfull.bearer_auth import BearerAuth
+from libcapella.paging import CapellaPager
+from libcapella.pool import session_pool
+from libcapella.mock_api import MockCapellaAPI
+
+
+def measure(function, rounds: int = 3) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    api = MockCapellaAPI(latency=0.05).start()
+    rest = RestAPI(BearerAuth("benchmark"), api.host, use_ssl=False, port=api.port)
+    rest.session = session_pool.session(api.host, "benchmark", max_connections=16)
+    endpoint = "/v4/organizations/org/projects/project/clusters"
+
+    print(f"latency {api.latency * 1000:.0f} ms per request")
+    print(f"{'pages':>6} {'sequential ms':>14} {'get_paged ms':>13} {'parallel ms':>12} {'speedup':>8}")
+    for pages in (5, 20, 40):
+        api.state.collections.pop(endpoint, None)
+        for n in range(pages * 50):
+            api.state.add(endpoint, dict(id=f"id-{n}", name=f"cluster-{n}"))
+        sequential = measure(lambda: CapellaPager(rest, endpoint, per_page=50).fetch_all(workers=1))
+        get_paged = measure(lambda: rest.get_paged(endpoint,
+                                                   total_tag="totalItems",
+                                                   pages_tag="last",
+                                                   per_page_tag="perPage",
+                                                   per_page=50,
+                                                   cursor="cursor",
+                                                   category="pages").validate().json_list())
+        parallel = measure(lambda: CapellaPager(rest, endpoint, per_page=50).fetch_all(workers=8))
+        print(f"{pages:>6} {sequential:>14.1f} {get_paged:>13.1f} {parallel:>12.1f} {sequential / parallel:>7.1f}x")
+    api.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import os
+import time
+import tempfile
+from libcapella.mock_api import MockCapellaAPI
+from libcapella.config import CapellaConfig
+from libcapella.organization import CapellaOrganization
+from libcapella.project import CapellaProject
+from libcapella.database import CapellaDatabase
+from libcapella.pool import session_pool
+from libcapella.cache import resolution_cache
+from libcapella.user_directory import CapellaUserDirectory
+
+
+def startup(api: MockCapellaAPI, ids: dict, **kwargs) -> tuple:
+    resolution_cache.clear()
+    CapellaUserDirectory.reset()
+    session_pool.close()
+    api.reset_counts()
+    start = time.perf_counter()
+    org = CapellaOrganization(CapellaConfig(config_dict=api.config(account_email=ids["account_email"], project_name="project-1", database_name="database-0", **kwargs)))
+    CapellaDatabase(CapellaProject(org))
+    return api.request_count, api.not_modified, (time.perf_counter() - start) * 1000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory, MockCapellaAPI(latency=0.02) as api:
+        ids = api.populate(projects=3, databases=3, users=300)
+        cache_path = os.path.join(directory, "responses.db")
+        print(f"latency {api.latency * 1000:.0f} ms per request")
+        print(f"{'startup':>20} {'requests':>9} {'304':>5} {'ms':>8}")
+        for label, options in (("no cache", dict()),
+                               ("cold cache", dict(cache_responses=True, cache_path=cache_path)),
+                               ("revalidate", dict(cache_responses=True, cache_path=cache_path)),
+                               ("max_age 300", dict(cache_responses=True, cache_path=cache_path, cache_max_age=300))):
+            requests, not_modified, elapsed = startup(api, ids, **options)
+            print(f"{label:>20} {requests:>9} {not_modified:>5} {elapsed:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
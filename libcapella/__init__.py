@@ -1,4 +1,44 @@
 import os
+import importlib
 
 _ROOT = os.path.abspath(os.path.dirname(__file__))
 __version__ = "1.0.20"
+
+_exports = dict(
+    CapellaConfig="libcapella.config",
+    CapellaOrganization="libcapella.organization",
+    CapellaProject="libcapella.project",
+    CapellaUser="libcapella.user",
+    CapellaDatabase="libcapella.database",
+    CapellaColumnar="libcapella.columnar",
+    CapellaAppService="libcapella.app_service",
+    CapellaAllowedCIDR="libcapella.database_allowed_cidr",
+    ColumnarAllowedCIDR="libcapella.columnar_allowed_cidr",
+    CapellaDatabaseCredentials="libcapella.database_credentials",
+    CapellaNetworkPeers="libcapella.network_peers",
+    CapellaInventory="libcapella.inventory",
+    CapellaPager="libcapella.paging",
+    CapellaClientRegistry="libcapella.registry",
+    ResponseCache="libcapella.response_cache",
+    MockCapellaAPI="libcapella.mock_api"
+)
+
+__all__ = ["__version__"] + list(_exports)
+
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+        globals()[name] = value
+        return value
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as err:
+        if err.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
@@ -0,0 +1,89 @@
+##
+##
+
+import asyncio
+import logging
+from typing import List, Union
+from restfull.restapi import NotFoundError
+from libcapella.aio.base import AsyncCapellaResource
+from libcapella.aio.database import AsyncCapellaDatabase
+from libcapella.logic.app_service import AppService
+
+logger = logging.getLogger('libcapella.aio.app_service')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaAppService(AsyncCapellaResource):
+
+    def __init__(self, database: AsyncCapellaDatabase):
+        self._endpoint = f"{database.endpoint}/{database.id}/appservices"
+        self._list_endpoint = f"{database.project.org.id_endpoint}/appservices"
+        self.database = database
+        self.rest = database.rest
+        self.app_service = None
+
+    async def initialize(self):
+        if not self.app_service:
+            self.app_service = await self.get_by_db(self.database.id)
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id(self):
+        if not self.app_service:
+            return None
+        return self.app_service.id
+
+    async def list(self) -> List[AppService]:
+        result = await self.rest.get_paged(self._list_endpoint, per_page=100)
+        logger.debug(f"app service list: found {len(result)}")
+        return [AppService.create(a) for a in result]
+
+    async def get(self, app_service_id: str) -> Union[AppService, None]:
+        if not app_service_id:
+            return None
+        endpoint = f"{self._endpoint}/{app_service_id}"
+        try:
+            result = await self.rest.get(endpoint)
+            return AppService.create(result)
+        except NotFoundError:
+            return None
+
+    async def get_by_db(self, database_id: str) -> Union[AppService, None]:
+        if not database_id:
+            return None
+        result = next((r for r in await self.rest.get_paged(self._list_endpoint, per_page=100) if r.get("clusterId") == database_id), None)
+        if not result:
+            return None
+        return AppService.create(result)
+
+    async def create(self, app_service: AppService):
+        result = await self.rest.post(self._endpoint, app_service.as_dict_striped)
+        app_service.id = result.get("id")
+        self.app_service = app_service
+
+    async def wait(self, state, until: bool = False, retry_count: int = 90):
+        if not self.app_service:
+            return True
+        for retry_number in range(retry_count + 1):
+            check = await self.get(self.app_service.id)
+            logger.debug(f"Checking app service state {check.currentState if check else None} with state {state} until {until}")
+            if not until and check and check.currentState != state:
+                return True
+            elif until and check and check.currentState == state:
+                return True
+            elif not check:
+                return True
+            else:
+                if retry_number == retry_count:
+                    return False
+                logger.debug(f"Waiting for app service {self.app_service.name} to reach state {state}")
+                await asyncio.sleep(10)
+
+    async def delete(self):
+        if self.app_service.id:
+            endpoint = f"{self._endpoint}/{self.app_service.id}"
+            await self.rest.delete(endpoint)
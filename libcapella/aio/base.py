@@ -0,0 +1,42 @@
+##
+##
+
+import logging
+from typing import Union
+from libcapella.config import CapellaConfig
+from libcapella.aio.rest import AsyncRestAPI
+from restfull.bearer_auth import BearerAuth
+
+logger = logging.getLogger('libcapella.aio.base')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaResource(object):
+
+    async def initialize(self):
+        return self
+
+    def __await__(self):
+        return self.initialize().__await__()
+
+
+class AsyncCouchbaseCapella(AsyncCapellaResource):
+
+    def __init__(self, config: CapellaConfig, max_connections: Union[int, None] = None):
+        self.config = config.config
+        self.auth_token = self.config.token
+        self.api_host = self.config.api_host
+
+        auth = BearerAuth(self.auth_token)
+        self.rest = AsyncRestAPI(auth, self.api_host, use_ssl=self.config.use_ssl, port=self.config.api_port, max_connections=max_connections if max_connections else self.config.max_connections,
+                                 json_backend=self.config.json_backend)
+        self.rest.retry_server_errors()
+
+    async def close(self):
+        await self.rest.close()
+
+    async def __aenter__(self):
+        return await self.initialize()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,92 @@
+##
+##
+
+import asyncio
+import logging
+from typing import List, Union
+from restfull.restapi import NotFoundError
+from libcapella.aio.base import AsyncCapellaResource
+from libcapella.aio.project import AsyncCapellaProject
+from libcapella.logic.columnar import Columnar
+
+logger = logging.getLogger('libcapella.aio.columnar')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaColumnar(AsyncCapellaResource):
+
+    def __init__(self, project: AsyncCapellaProject, cluster: Union[str, None] = None):
+        self._endpoint = f"{project.endpoint}/{project.id}/analyticsClusters"
+        self.rest = project.rest
+        self.project = project
+        self.cluster_name = cluster if cluster else project.org.config.columnar_name
+        self.cluster = None
+
+    async def initialize(self):
+        if self.cluster_name and not self.cluster:
+            self.cluster = await self.get_by_name(self.cluster_name)
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id(self):
+        if not self.cluster:
+            return None
+        return self.cluster.id
+
+    @property
+    def this(self) -> Columnar:
+        return self.cluster
+
+    async def refresh(self):
+        self.cluster = await self.get(self.cluster.id)
+
+    async def list(self) -> List[Columnar]:
+        result = await self.rest.get_paged(self._endpoint, per_page=50)
+        logger.debug(f"columnar list: found {len(result)}")
+        return [Columnar.create(r) for r in result]
+
+    async def get(self, columnar_id: str) -> Union[Columnar, None]:
+        if not columnar_id:
+            return None
+        endpoint = f"{self._endpoint}/{columnar_id}"
+        try:
+            result = await self.rest.get(endpoint)
+            return Columnar.create(result)
+        except NotFoundError:
+            return None
+
+    async def get_by_name(self, name: str) -> Union[Columnar, None]:
+        result = next((r for r in await self.rest.get_paged(self._endpoint, per_page=50) if r.get("name") == name), None)
+        if not result:
+            return None
+        return Columnar.create(result)
+
+    async def create(self, columnar: Columnar):
+        result = await self.rest.post(self._endpoint, columnar.as_dict_striped)
+        columnar.id = result.get("id")
+        self.cluster = columnar
+
+    async def wait(self, state, retry_count: int = 90):
+        if not self.cluster:
+            return True
+        for retry_number in range(retry_count + 1):
+            check = await self.get(self.cluster.id)
+            logger.debug(f"Checking cluster state {check.currentState if check else None} with state {state}")
+            if check and check.currentState != state:
+                return True
+            elif not check:
+                return True
+            else:
+                if retry_number == retry_count:
+                    return False
+                logger.debug(f"Waiting for cluster {self.cluster.name} to reach state {state}")
+                await asyncio.sleep(10)
+
+    async def delete(self):
+        if self.cluster.id:
+            endpoint = f"{self._endpoint}/{self.cluster.id}"
+            await self.rest.delete(endpoint)
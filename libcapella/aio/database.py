@@ -0,0 +1,98 @@
+##
+##
+
+import asyncio
+import logging
+from typing import List, Union
+from restfull.restapi import NotFoundError, UnprocessableEntityError, RateLimitError
+from pytoolbase.retry import retry
+from libcapella.aio.base import AsyncCapellaResource
+from libcapella.aio.project import AsyncCapellaProject
+from libcapella.logic.database import Database
+
+logger = logging.getLogger('libcapella.aio.database')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaDatabase(AsyncCapellaResource):
+
+    def __init__(self, project: AsyncCapellaProject, database: Union[str, None] = None):
+        self._endpoint = f"{project.endpoint}/{project.id}/clusters"
+        self.rest = project.rest
+        self.project = project
+        self.database_name = database if database else project.org.config.database_name
+        self.database = None
+
+    async def initialize(self):
+        if self.database_name and not self.database:
+            self.database = await self.get_by_name(self.database_name)
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id(self):
+        if not self.database:
+            return None
+        return self.database.id
+
+    @property
+    def this(self) -> Database:
+        return self.database
+
+    async def refresh(self):
+        self.database = await self.get(self.database.id)
+
+    async def list(self) -> List[Database]:
+        result = await self.rest.get_paged(self._endpoint, per_page=50)
+        logger.debug(f"database list: found {len(result)}")
+        return [Database.create(r) for r in result]
+
+    async def get(self, database_id: str) -> Union[Database, None]:
+        if not database_id:
+            return None
+        endpoint = f"{self._endpoint}/{database_id}"
+        try:
+            result = await self.rest.get(endpoint)
+            return Database.create(result)
+        except NotFoundError:
+            return None
+
+    async def get_by_name(self, name: str) -> Union[Database, None]:
+        result = next((r for r in await self.rest.get_paged(self._endpoint, per_page=50) if r.get("name") == name), None)
+        if not result:
+            return None
+        return Database.create(result)
+
+    @retry(retry_count=5, factor=0.5, allow_list=(UnprocessableEntityError, RateLimitError))
+    async def create(self, database: Database):
+        if self.database_name:
+            database.name = self.database_name
+        config = database.as_dict_striped
+        logger.debug(f"creating database {database.name}:\n{config}")
+        result = await self.rest.post(self._endpoint, config)
+        database.id = result.get("id")
+        self.database = database
+
+    async def wait(self, state, retry_count: int = 90):
+        if not self.database:
+            return True
+        for retry_number in range(retry_count + 1):
+            check = await self.get(self.database.id)
+            logger.debug(f"Checking cluster state {check.currentState if check else None} with state {state}")
+            if check and check.currentState != state:
+                return True
+            elif not check:
+                return True
+            else:
+                if retry_number == retry_count:
+                    return False
+                logger.debug(f"Waiting for cluster {self.database.name} to reach state {state}")
+                await asyncio.sleep(10)
+
+    async def delete(self):
+        if self.database.id:
+            endpoint = f"{self._endpoint}/{self.database.id}"
+            await self.rest.delete(endpoint)
@@ -0,0 +1,65 @@
+##
+##
+
+import logging
+from typing import List, Union
+from restfull.restapi import NotFoundError
+from libcapella.aio.base import AsyncCapellaResource
+from libcapella.aio.database import AsyncCapellaDatabase
+from libcapella.logic.allowed_cidr import AllowedCIDR
+
+logger = logging.getLogger('libcapella.aio.database_allowed_cidr')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaAllowedCIDR(AsyncCapellaResource):
+
+    def __init__(self, database: AsyncCapellaDatabase, cidr: str = None):
+        self._endpoint = f"{database.endpoint}/{database.id}/allowedcidrs"
+        self.rest = database.rest
+        self.cidr = cidr
+        self.allowed_cidr = None
+
+    async def initialize(self):
+        if self.cidr and not self.allowed_cidr:
+            self.allowed_cidr = await self.get_by_name(self.cidr)
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id(self):
+        if not self.allowed_cidr:
+            return None
+        return self.allowed_cidr.id
+
+    async def list(self) -> List[AllowedCIDR]:
+        result = await self.rest.get_paged(self._endpoint, per_page=100)
+        logger.debug(f"allowed CIDR list: found {len(result)}")
+        return [AllowedCIDR.create(a) for a in result]
+
+    async def get(self, allowed_cidr_id: str) -> Union[AllowedCIDR, None]:
+        endpoint = f"{self._endpoint}/{allowed_cidr_id}"
+        try:
+            result = await self.rest.get(endpoint)
+            return AllowedCIDR.create(result)
+        except NotFoundError:
+            return None
+
+    async def get_by_name(self, cidr: str) -> Union[AllowedCIDR, None]:
+        result = next((r for r in await self.rest.get_paged(self._endpoint, per_page=100) if r.get("cidr") == cidr), None)
+        if not result:
+            return None
+        return AllowedCIDR.create(result)
+
+    async def create(self, allowed_cidr: AllowedCIDR):
+        result = await self.rest.post(self._endpoint, allowed_cidr.as_dict_striped)
+        allowed_cidr.id = result.get("id")
+        self.allowed_cidr = allowed_cidr
+
+    async def delete(self):
+        if self.allowed_cidr.id:
+            endpoint = f"{self._endpoint}/{self.allowed_cidr.id}"
+            await self.rest.delete(endpoint)
@@ -0,0 +1,65 @@
+##
+##
+
+import logging
+from typing import List, Union
+from restfull.restapi import NotFoundError
+from libcapella.aio.base import AsyncCapellaResource
+from libcapella.aio.database import AsyncCapellaDatabase
+from libcapella.logic.credentials import DatabaseCredentials
+
+logger = logging.getLogger('libcapella.aio.database_credentials')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaDatabaseCredentials(AsyncCapellaResource):
+
+    def __init__(self, database: AsyncCapellaDatabase, username: str = None):
+        self._endpoint = f"{database.endpoint}/{database.id}/users"
+        self.rest = database.rest
+        self.username = username
+        self.db_credentials = None
+
+    async def initialize(self):
+        if self.username and not self.db_credentials:
+            self.db_credentials = await self.get_by_name(self.username)
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id(self):
+        if not self.db_credentials:
+            return None
+        return self.db_credentials.id
+
+    async def list(self) -> List[DatabaseCredentials]:
+        result = await self.rest.get_paged(self._endpoint, per_page=100)
+        logger.debug(f"database credentials list: found {len(result)}")
+        return [DatabaseCredentials.create(a) for a in result]
+
+    async def get(self, db_user_id: str) -> Union[DatabaseCredentials, None]:
+        endpoint = f"{self._endpoint}/{db_user_id}"
+        try:
+            result = await self.rest.get(endpoint)
+            return DatabaseCredentials.create(result)
+        except NotFoundError:
+            return None
+
+    async def get_by_name(self, username: str) -> Union[DatabaseCredentials, None]:
+        result = next((r for r in await self.rest.get_paged(self._endpoint, per_page=100) if r.get("name") == username), None)
+        if not result:
+            return None
+        return DatabaseCredentials.create(result)
+
+    async def create(self, db_user: DatabaseCredentials):
+        result = await self.rest.post(self._endpoint, db_user.as_dict_striped)
+        db_user.id = result.get("id")
+        self.db_credentials = db_user
+
+    async def delete(self):
+        if self.db_credentials.id:
+            endpoint = f"{self._endpoint}/{self.db_credentials.id}"
+            await self.rest.delete(endpoint)
@@ -0,0 +1,97 @@
+##
+##
+
+import re
+import logging
+from typing import List, Union
+from restfull.restapi import NotFoundError
+from libcapella.aio.base import AsyncCapellaResource
+from libcapella.aio.database import AsyncCapellaDatabase
+from libcapella.logic.network_peers import NetworkPeers
+
+logger = logging.getLogger('libcapella.aio.network_peers')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaNetworkPeers(AsyncCapellaResource):
+
+    def __init__(self, database: AsyncCapellaDatabase, name: str = "NetworkPeer"):
+        self._endpoint = f"{database.endpoint}/{database.id}/networkPeers"
+        self.rest = database.rest
+        self.name = name
+        self.network_peer = None
+
+    async def initialize(self):
+        if not self.network_peer:
+            self.network_peer = await self.get_by_name(self.name)
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id(self):
+        if not self.network_peer:
+            return None
+        return self.network_peer.id
+
+    @property
+    def this(self) -> NetworkPeers:
+        return self.network_peer
+
+    @property
+    def provider_id(self):
+        return self.network_peer.providerConfig.providerId
+
+    @property
+    def hosted_zone_id(self):
+        cmd_list = self.network_peer.commands if self.network_peer.commands else []
+        return next((re.search('--hosted-zone-id=(.+?) ', z).group(1) for z in cmd_list if re.search('--hosted-zone-id', z)), None)
+
+    @property
+    def peer_project(self):
+        cmd_list = self.network_peer.commands if self.network_peer.commands else []
+        return next((re.search(r'--peer-project\s+(.+?) ', z).group(1) for z in cmd_list if re.search('--peer-project', z)), None)
+
+    @property
+    def peer_network(self):
+        cmd_list = self.network_peer.commands if self.network_peer.commands else []
+        return next((re.search(r'--peer-network\s+(.+?)$', z).group(1) for z in cmd_list if re.search('--peer-network', z)), None)
+
+    @property
+    def managed_zone(self):
+        cmd_list = self.network_peer.commands if self.network_peer.commands else []
+        return next((re.search('--dns-name=(.+?) ', z).group(1) for z in cmd_list if re.search('--dns-name', z)), None)
+
+    async def refresh(self):
+        self.network_peer = await self.get(self.network_peer.id)
+
+    async def list(self) -> List[NetworkPeers]:
+        result = await self.rest.get_paged(self._endpoint, per_page=100)
+        logger.debug(f"network peer list: found {len(result)}")
+        return [NetworkPeers.create(a) for a in result]
+
+    async def get(self, peer_id: str) -> Union[NetworkPeers, None]:
+        endpoint = f"{self._endpoint}/{peer_id}"
+        try:
+            result = await self.rest.get(endpoint)
+            return NetworkPeers.create(result)
+        except NotFoundError:
+            return None
+
+    async def get_by_name(self, name: str) -> Union[NetworkPeers, None]:
+        result = next((r for r in await self.rest.get_paged(self._endpoint, per_page=100) if r.get("name") == name), None)
+        if not result:
+            return None
+        return NetworkPeers.create(result)
+
+    async def create(self, network_peer: NetworkPeers):
+        result = await self.rest.post(self._endpoint, network_peer.as_dict_striped)
+        network_peer.id = result.get("id")
+        self.network_peer = network_peer
+
+    async def delete(self):
+        if self.network_peer.id:
+            endpoint = f"{self._endpoint}/{self.network_peer.id}"
+            await self.rest.delete(endpoint)
@@ -0,0 +1,70 @@
+##
+##
+
+import logging
+from typing import List
+from libcapella.aio.base import AsyncCouchbaseCapella
+from libcapella.exceptions import CapellaNotFoundError
+from libcapella.logic.organization import Organization
+
+logger = logging.getLogger('libcapella.aio.organization')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaOrganization(AsyncCouchbaseCapella):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._endpoint = "/v4/organizations"
+        self.organization = None
+
+    async def initialize(self):
+        if self.organization is not None:
+            return self
+        if self.config.organization_name is not None:
+            logger.debug(f"using organization name {self.config.organization_name}")
+            self.organization = await self.get_by_name(self.config.organization_name)
+        elif self.config.organization_id is not None:
+            logger.debug(f"using organization id {self.config.organization_id}")
+            self.organization = await self.get(self.config.organization_id)
+        else:
+            logger.debug("locating the default organization")
+            self.organization = await self.get_default()
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id_endpoint(self):
+        return f"{self.endpoint}/{self.id}"
+
+    @property
+    def id(self):
+        if not self.organization:
+            return None
+        return self.organization.id
+
+    async def list(self) -> List[Organization]:
+        result = await self.rest.get(self._endpoint)
+        logger.debug(f"organization list: found {len(result.get('data', []))}")
+        return [Organization.create(r) for r in result.get("data", [])]
+
+    async def get(self, org_id: str) -> Organization:
+        endpoint = self._endpoint + f"/{org_id}"
+        result = await self.rest.get(endpoint)
+        return Organization.create(result)
+
+    async def get_by_name(self, name: str) -> Organization:
+        result = await self.list()
+        for org in result:
+            if org.name == name:
+                return org
+        raise CapellaNotFoundError(f"Organization {name} not found")
+
+    async def get_default(self) -> Organization:
+        result = await self.list()
+        if not len(result) >= 1:
+            raise RuntimeError("No organizations found")
+        return result[0]
@@ -0,0 +1,88 @@
+##
+##
+
+import logging
+from typing import List, Union
+from restfull.restapi import NotFoundError
+from libcapella.exceptions import CapellaNotFoundError
+from libcapella.aio.base import AsyncCapellaResource
+from libcapella.aio.organization import AsyncCapellaOrganization
+from libcapella.aio.user import AsyncCapellaUser
+from libcapella.logic.project import Project
+from libcapella.logic.project import CapellaProjectBuilder
+
+logger = logging.getLogger('libcapella.aio.project')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaProject(AsyncCapellaResource):
+
+    def __init__(self, org: AsyncCapellaOrganization, project: str = None, email: str = None):
+        self._endpoint = f"{org.endpoint}/{org.id}/projects"
+        self.rest = org.rest
+        self.user = AsyncCapellaUser(org, email)
+        self.org = org
+        self.project_name = project if project else org.config.project_name if org.config.project_name is not None else "default"
+        self._project_arg = project
+        self.project = None
+
+    async def initialize(self):
+        if self.project is not None:
+            return self
+        await self.user
+        try:
+            if self._project_arg is not None:
+                self.project = await self.get_by_name(self._project_arg)
+            elif self.org.config.project_name is not None:
+                self.project = await self.get_by_name(self.org.config.project_name)
+            elif self.org.config.project_id is not None:
+                self.project = await self.get(self.org.config.project_id)
+        except CapellaNotFoundError:
+            pass
+
+        if not self.project:
+            builder = CapellaProjectBuilder()
+            builder = builder.name(self.project_name)
+            self.project = builder.build()
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id(self):
+        if not self.project:
+            return None
+        return self.project.id
+
+    async def list(self) -> List[Project]:
+        result = await self.rest.get_paged(self._endpoint, per_page=50)
+        logger.debug(f"project list: found {len(result)}")
+        return [Project.create(r) for r in result]
+
+    def owned_by_user(self, project_id: str) -> bool:
+        user_projects = self.user.projects_by_owner()
+        return project_id in user_projects
+
+    async def get(self, project_id: str) -> Union[Project, None]:
+        endpoint = self._endpoint + f"/{project_id}"
+        try:
+            result = await self.rest.get(endpoint)
+            return Project.create(result)
+        except NotFoundError:
+            return None
+
+    async def get_by_name(self, name: str) -> Project:
+        result = await self.list()
+        for p in result:
+            if p.name == name and self.owned_by_user(p.id):
+                return p
+        raise CapellaNotFoundError(f"Project {name} not found")
+
+    async def create(self, project: Project):
+        result = await self.rest.post(self._endpoint, project.as_dict_striped)
+        project_id = result.get("id")
+        await self.user.set_project_owner(project_id)
+        project.id = project_id
+        self.project = project
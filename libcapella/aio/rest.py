@@ -0,0 +1,165 @@
+##
+##
+
+import ssl
+import asyncio
+import logging
+import certifi
+from typing import Union
+from aiohttp import ClientSession, TCPConnector
+from restfull.base_auth import RestAuthBase
+from libcapella.codec import JsonBackend, get_backend
+from libcapella.rest import json_headers
+from restfull.restapi import (BadRequestError, PermissionDeniedError, NotFoundError, UnprocessableEntityError, RateLimitError, InternalServerError, RetryableError,
+                              NonRetryableError)
+
+logger = logging.getLogger('libcapella.aio.rest')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncRestAPI(object):
+
+    def __init__(self,
+                 auth_class: RestAuthBase,
+                 hostname: str = '127.0.0.1',
+                 use_ssl: bool = True,
+                 verify: bool = True,
+                 port: Union[int, None] = None,
+                 max_connections: int = 32,
+                 retry_count: int = 10,
+                 factor: float = 0.01,
+                 json_backend: Union[str, JsonBackend, None] = None):
+        self.hostname = hostname
+        self.auth_class = auth_class
+        self.ssl = use_ssl
+        self.verify = verify
+        self.max_connections = max_connections
+        self.retry_count = retry_count
+        self.factor = factor
+        self.codec = json_backend if isinstance(json_backend, JsonBackend) else get_backend(json_backend)
+        self.scheme = 'https' if self.ssl else 'http'
+        self.port = port if port else 443 if use_ssl else 80
+        self.url_prefix = f"{self.scheme}://{self.hostname}:{self.port}"
+        self.request_headers = self.auth_class.get_header()
+        self._retry_server_errors = False
+        self._session: Union[ClientSession, None] = None
+
+        self.ssl_context = ssl.create_default_context()
+        self.ssl_context.load_verify_locations(certifi.where())
+        if not self.verify:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+
+    def retry_server_errors(self):
+        self._retry_server_errors = True
+
+    @property
+    def session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            connector = TCPConnector(limit_per_host=self.max_connections, ssl=self.ssl_context if self.ssl else False)
+            self._session = ClientSession(headers=self.request_headers, connector=connector)
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def build_url(self, endpoint: str) -> str:
+        return f"{self.url_prefix}{endpoint}"
+
+    def validate(self, code: int, text: str):
+        if 200 <= code < 299:
+            return
+        elif code == 400:
+            raise BadRequestError(text)
+        elif code == 403:
+            raise PermissionDeniedError(text)
+        elif code == 404:
+            raise NotFoundError(text)
+        elif code == 422:
+            raise UnprocessableEntityError(text)
+        elif code == 429:
+            raise RateLimitError(text)
+        elif code == 500:
+            if self._retry_server_errors:
+                raise RetryableError(f"code: {code} response: {text}")
+            else:
+                raise InternalServerError(text)
+        elif 400 <= code < 500:
+            raise RetryableError(f"code: {code} response: {text}")
+        elif 500 <= code < 600:
+            if self._retry_server_errors:
+                raise RetryableError(f"code: {code} response: {text}")
+            else:
+                raise NonRetryableError(f"code: {code} response: {text}")
+        else:
+            raise RuntimeError(f"unknown response code: {code} response: {text}")
+
+    async def request(self, method: str, endpoint: str, body: Union[dict, list, None] = None) -> Union[dict, list]:
+        url = self.build_url(endpoint)
+        for retry_number in range(self.retry_count + 1):
+            logger.debug(f"{method} {url}")
+            try:
+                if body is None:
+                    request = self.session.request(method, url)
+                else:
+                    request = self.session.request(method, url, data=self.codec.dumps(body), headers=json_headers)
+                async with request as response:
+                    data = await response.read()
+                    if not 200 <= response.status < 299:
+                        self.validate(response.status, data.decode("utf-8", errors="replace"))
+                    if not data:
+                        return {}
+                    return self.codec.loads(data)
+            except (RetryableError, RateLimitError) as err:
+                if retry_number == self.retry_count:
+                    logger.debug(f"{method} {url} retry limit exceeded")
+                    raise
+                logger.debug(f"{method} {url} will retry, number {retry_number + 1}: {err}")
+                await asyncio.sleep(self.factor * (2 ** (retry_number + 1)))
+
+    async def get(self, endpoint: str) -> Union[dict, list]:
+        return await self.request("GET", endpoint)
+
+    async def post(self, endpoint: str, body: Union[dict, list]) -> Union[dict, list]:
+        return await self.request("POST", endpoint, body)
+
+    async def patch(self, endpoint: str, body: Union[dict, list]) -> Union[dict, list]:
+        return await self.request("PATCH", endpoint, body)
+
+    async def put(self, endpoint: str, body: Union[dict, list]) -> Union[dict, list]:
+        return await self.request("PUT", endpoint, body)
+
+    async def delete(self, endpoint: str) -> Union[dict, list]:
+        return await self.request("DELETE", endpoint)
+
+    async def get_paged(self,
+                        endpoint: str,
+                        page_tag: str = "page",
+                        total_tag: str = "totalItems",
+                        pages_tag: str = "last",
+                        per_page_tag: str = "perPage",
+                        per_page: int = 50,
+                        data_key: str = "data",
+                        cursor: str = "cursor",
+                        category: str = "pages") -> list:
+        first = await self.get(self.paged_endpoint(endpoint, page_tag, 1, per_page_tag, per_page))
+        data = first.get(data_key) or []
+        record = first.get(cursor, {}).get(category, {}) if cursor else first
+        pages = record.get(pages_tag) or 1
+        logger.debug(f"{endpoint}: {record.get(total_tag)} items in {pages} pages")
+
+        if pages > 1:
+            blocks = await asyncio.gather(*[self.get(self.paged_endpoint(endpoint, page_tag, page, per_page_tag, per_page)) for page in range(2, pages + 1)])
+            for block in blocks:
+                data.extend(block.get(data_key) or [])
+
+        return data
+
+    @staticmethod
+    def paged_endpoint(endpoint: str, page_tag: str = "page", page: int = 1, per_page_tag: Union[str, None] = None, per_page: int = 10) -> str:
+        _endpoint = f"{endpoint}?{page_tag}={page}"
+        if per_page_tag:
+            _endpoint += f"&{per_page_tag}={per_page}"
+        return _endpoint
@@ -0,0 +1,73 @@
+##
+##
+
+import logging
+from typing import List, Union
+from restfull.restapi import NotFoundError
+from libcapella.aio.base import AsyncCapellaResource
+from libcapella.aio.organization import AsyncCapellaOrganization
+from libcapella.logic.user import User, ProjectOwnership
+
+logger = logging.getLogger('libcapella.aio.user')
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCapellaUser(AsyncCapellaResource):
+
+    def __init__(self, org: AsyncCapellaOrganization, email: Union[str, None] = None):
+        self._endpoint = f"{org.endpoint}/{org.id}/users"
+        self.rest = org.rest
+        self.org = org
+        self.email = email
+        self.user_record = None
+
+    async def initialize(self):
+        if self.user_record is not None:
+            return self
+        if self.email is not None:
+            self.user_record = await self.get_by_email(self.email)
+        elif self.org.config.account_email is not None:
+            self.user_record = await self.get_by_email(self.org.config.account_email)
+        elif self.org.config.account_id is not None:
+            self.user_record = await self.get(self.org.config.account_id)
+        return self
+
+    @property
+    def endpoint(self):
+        return self._endpoint
+
+    @property
+    def id(self):
+        if not self.user_record:
+            return None
+        return self.user_record.id
+
+    async def list(self) -> List[User]:
+        return [User.create(r) for r in await self.get_all_users()]
+
+    async def get_all_users(self) -> List[dict]:
+        return await self.rest.get_paged(self._endpoint, per_page=100)
+
+    async def get(self, user_id: str) -> Union[User, None]:
+        endpoint = self._endpoint + f"/{user_id}"
+        try:
+            result = await self.rest.get(endpoint)
+            return User.create(result)
+        except NotFoundError:
+            return None
+
+    async def get_by_email(self, email: str) -> Union[User, None]:
+        return next((u for u in await self.list() if u.email == email), None)
+
+    async def set_project_owner(self, project_id: str):
+        user_id = self.id
+        endpoint = self._endpoint + f"/{user_id}"
+        user_op = ProjectOwnership()
+        user_op.add(project_id)
+        await self.rest.patch(endpoint, user_op.as_dict)
+
+    def projects_by_owner(self):
+        if self.user_record:
+            return [resource.id for resource in self.user_record.resources if resource.type == "project"]
+        else:
+            return []
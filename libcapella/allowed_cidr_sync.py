@@ -0,0 +1,68 @@
+##
+##
+
+import logging
+import ipaddress
+from typing import List, Dict, Iterable, Union
+from restfull.restapi import RestAPI
+from libcapella.batch import run_batch
+from libcapella.logic.allowed_cidr import AllowedCIDR, AllowedCIDRBuilder, AllowedCIDRSync
+
+logger = logging.getLogger('libcapella.allowed_cidr_sync')
+logger.addHandler(logging.NullHandler())
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def collapse_cidrs(cidrs: Iterable[str]) -> List[Network]:
+    by_version: Dict[int, List[Network]] = {}
+    for cidr in cidrs:
+        network = ipaddress.ip_network(cidr.strip(), strict=False)
+        by_version.setdefault(network.version, []).append(network)
+    result = []
+    for version in sorted(by_version):
+        result.extend(ipaddress.collapse_addresses(by_version[version]))
+    return result
+
+
+def plan_cidr_sync(current: List[AllowedCIDR], desired_cidrs: Iterable[str], prune: bool = True) -> AllowedCIDRSync:
+    desired = collapse_cidrs(desired_cidrs)
+    wanted = set(desired)
+    plan = AllowedCIDRSync()
+    present = set()
+    for entry in current:
+        try:
+            network = ipaddress.ip_network(entry.cidr, strict=False)
+        except ValueError:
+            network = None
+        if network in wanted and network not in present:
+            present.add(network)
+            plan.keep.append(entry)
+        elif prune:
+            plan.remove.append(entry)
+        else:
+            plan.keep.append(entry)
+    plan.add = [str(n) for n in desired if n not in present]
+    logger.debug(f"allowed CIDR sync: keep {len(plan.keep)} add {len(plan.add)} remove {len(plan.remove)}")
+    return plan
+
+
+def apply_cidr_sync(rest: RestAPI, endpoint: str, plan: AllowedCIDRSync, comment: Union[str, None] = None, concurrency: int = 8) -> AllowedCIDRSync:
+    def remove(client: RestAPI, entry: AllowedCIDR):
+        client.delete(f"{endpoint}/{entry.id}").validate()
+        return entry.id
+
+    def add(client: RestAPI, cidr: str):
+        builder = AllowedCIDRBuilder(cidr=cidr)
+        if comment:
+            builder = builder.comment(comment)
+        allowed_cidr = builder.build()
+        allowed_cidr.id = client.post(endpoint, allowed_cidr.as_dict_striped).validate().as_json().json_key("id")
+        return allowed_cidr
+
+    plan.results = run_batch(rest, plan.add, add, concurrency=concurrency)
+    if not all(r.ok for r in plan.results):
+        logger.warning(f"allowed CIDR sync: {len([r for r in plan.results if not r.ok])} of {len(plan.add)} additions failed, keeping {len(plan.remove)} entries")
+        return plan
+    plan.results.extend(run_batch(rest, plan.remove, remove, concurrency=concurrency))
+    return plan
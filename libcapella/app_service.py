@@ -1,12 +1,14 @@
 ##
 ##
 
-import time
 import logging
-from typing import List, Union
+from typing import List, Union, Iterator
 from restfull.restapi import NotFoundError
 from libcapella.logic.app_service import AppService
 from libcapella.database import CapellaDatabase
+from libcapella.wait import wait_for
+from libcapella.paging import CapellaPager
+from libcapella.cache import resolution_cache
 
 logger = logging.getLogger('libcapella.app_service')
 logger.addHandler(logging.NullHandler())
@@ -19,12 +21,17 @@ class CapellaAppService(object):
         self._list_endpoint = f"{database.project.org.id_endpoint}/appservices"
         self.database = database
         self.rest = database.rest
+        self.api_host = database.api_host
         self.app_service = self.get_by_db(database.id)
 
     @property
     def endpoint(self):
         return self._endpoint
 
+    @property
+    def list_endpoint(self):
+        return self._list_endpoint
+
     @property
     def id(self):
         if not self.app_service:
@@ -32,15 +39,13 @@ class CapellaAppService(object):
         return self.app_service.id
 
     def list(self) -> List[AppService]:
-        result = self.rest.get_paged(self._list_endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().json_list()
-        logger.debug(f"app service list: found {result.size}")
-        return [AppService.create(a) for a in result.as_list]
+        result = CapellaPager(self.rest, self._list_endpoint, per_page=100).fetch_all()
+        logger.debug(f"app service list: found {len(result)}")
+        return [AppService.create(a) for a in result]
+
+    def iter_app_services(self, prefetch: bool = False) -> Iterator[AppService]:
+        for record in CapellaPager(self.rest, self._list_endpoint, per_page=100, prefetch=prefetch).records():
+            yield AppService.create(record)
 
     def get(self, app_service_id: str) -> Union[AppService, None]:
         if not app_service_id:
@@ -50,46 +55,36 @@ class CapellaAppService(object):
             result = self.rest.get(endpoint).validate().as_json().json_object()
             return AppService.create(result.as_dict)
         except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._list_endpoint, app_service_id)
             return None
 
     def get_by_db(self, database_id: str) -> Union[AppService, None]:
         if not database_id:
             return None
-        result = self.rest.get_paged(self._list_endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().filter("clusterId", database_id).list_item(0)
+        key = resolution_cache.key(self.api_host, self._list_endpoint, database_id, field="clusterId")
+        app_service_id = resolution_cache.get(key)
+        if app_service_id is not None:
+            app_service = self.get(app_service_id)
+            if app_service is not None and app_service.clusterId == database_id:
+                return app_service
+            resolution_cache.invalidate(key)
+        result = CapellaPager(self.rest, self._list_endpoint, per_page=100).find("clusterId", database_id)
         if not result:
             return None
+        resolution_cache.put(key, self._list_endpoint, result.get("id"))
         return AppService.create(result)
 
     def create(self, app_service: AppService):
         app_service_id = self.rest.post(self._endpoint, app_service.as_dict_striped).validate().as_json().json_key("id")
         app_service.id = app_service_id
+        resolution_cache.invalidate(resolution_cache.key(self.api_host, self._list_endpoint, self.database.id, field="clusterId"))
         self.app_service = app_service
 
     def wait(self, state, until: bool = False, retry_count: int = 90):
-        if not self.app_service:
-            return True
-        for retry_number in range(retry_count + 1):
-            check = self.get(self.app_service.id)
-            logger.debug(f"Checking app service state {check.currentState if check else None} with state {state} until {until}")
-            if not until and check and check.currentState != state:
-                return True
-            elif until and check and check.currentState == state:
-                return True
-            elif not check:
-                return True
-            else:
-                if retry_number == retry_count:
-                    return False
-                logger.debug(f"Waiting for app service {self.app_service.name} to reach state {state}")
-                time.sleep(10)
+        return wait_for(self, state, until=until, timeout=retry_count * 10)
 
     def delete(self):
         if self.app_service.id:
             endpoint = f"{self._endpoint}/{self.app_service.id}"
             self.rest.delete(endpoint)
+            resolution_cache.invalidate_scope(self.api_host, self._list_endpoint, self.app_service.id)
@@ -1,8 +1,14 @@
 ##
 ##
 
+import copy
 import logging
+from typing import Union
 from libcapella.config import CapellaConfig
+from libcapella.pool import session_pool
+from libcapella.rate_limit import RateLimiter
+from libcapella.response_cache import ResponseCache, open_cache
+from libcapella.rest import CapellaRestAPI
 from restfull.restapi import RestAPI
 from restfull.bearer_auth import BearerAuth
 
@@ -10,13 +16,43 @@ logger = logging.getLogger('libcapella.base')
 logger.addHandler(logging.NullHandler())
 
 
+def clone_rest(rest: RestAPI) -> RestAPI:
+    clone = copy.copy(rest)
+    clone.reset()
+    clone.response_text = None
+    clone.response_code = 200
+    return clone
+
+
 class CouchbaseCapella(object):
 
     def __init__(self, config: CapellaConfig):
         self.config = config.config
         self.auth_token = self.config.token
         self.api_host = self.config.api_host
+        self.tenant = ResponseCache.scope(self.api_host, self.auth_token)
 
         auth = BearerAuth(self.auth_token)
-        self.rest = RestAPI(auth, self.api_host)
+        cache = open_cache(self.config.cache_path, self.config.cache_max_bytes, self.config.cache_max_age) if self.config.cache_responses else None
+        self.rest = CapellaRestAPI(auth, self.api_host, use_ssl=self.config.use_ssl, port=self.config.api_port, json_backend=self.config.json_backend)
+        self.rest.session = session_pool.session(self.api_host,
+                                                 self.auth_token,
+                                                 self.config.max_connections,
+                                                 self.config.rate_limit,
+                                                 self.config.rate_burst,
+                                                 cache)
         self.rest.retry_server_errors()
+
+    @property
+    def pool_stats(self) -> dict:
+        return session_pool.stats(self.api_host, self.auth_token).get(self.api_host, {})
+
+    @property
+    def response_cache(self) -> Union[ResponseCache, None]:
+        adapter = session_pool.adapter(self.rest.session)
+        return adapter.cache if adapter else None
+
+    @property
+    def rate_limiter(self) -> Union[RateLimiter, None]:
+        adapter = session_pool.adapter(self.rest.session)
+        return adapter.limiter if adapter else None
@@ -0,0 +1,65 @@
+##
+##
+
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Union
+from restfull.restapi import RestAPI, RateLimitError, RetryableError, InternalServerError, NonRetryableError
+from libcapella.base import clone_rest
+from libcapella.pool import session_pool
+from libcapella.rate_limit import TokenBucket
+from libcapella.logic.batch import BatchResult
+
+logger = logging.getLogger('libcapella.batch')
+logger.addHandler(logging.NullHandler())
+
+
+def run_batch(rest: RestAPI,
+              items: List[Any],
+              function: Callable[[RestAPI, Any], Any],
+              concurrency: int = 4,
+              bucket: Union[TokenBucket, None] = None,
+              retry_count: int = 5,
+              factor: float = 0.5) -> List[BatchResult]:
+    local = threading.local()
+    adapter = session_pool.adapter(rest.session) if getattr(rest, "session", None) is not None else None
+    limiter = adapter.limiter if adapter is not None else None
+    if bucket is None and limiter is None:
+        bucket = TokenBucket(rate=max(1, concurrency) * 2, capacity=max(1, concurrency))
+
+    def client() -> RestAPI:
+        if not hasattr(local, "rest"):
+            local.rest = clone_rest(rest)
+        return local.rest
+
+    def submit(index: int, item: Any) -> BatchResult:
+        batch_result = BatchResult(index, item)
+        for retry_number in range(retry_count + 1):
+            if bucket is not None:
+                bucket.acquire()
+            batch_result.attempts += 1
+            try:
+                batch_result.result = function(client(), item)
+                batch_result.error = None
+                return batch_result
+            except RateLimitError as err:
+                batch_result.error = err
+                (bucket if bucket is not None else limiter.bucket).pause(factor * (2 ** retry_number))
+            except (RetryableError, InternalServerError, NonRetryableError) as err:
+                batch_result.error = err
+                if not 500 <= (client().response_code or 0) < 600:
+                    return batch_result
+                time.sleep(factor * (2 ** retry_number))
+            except Exception as err:
+                batch_result.error = err
+                return batch_result
+        logger.debug(f"batch item {index} failed after {batch_result.attempts} attempts: {batch_result.error}")
+        return batch_result
+
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(items)))) as executor:
+        futures = [executor.submit(submit, n, item) for n, item in enumerate(items)]
+        return [f.result() for f in futures]
@@ -0,0 +1,154 @@
+##
+##
+
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from collections import OrderedDict
+from typing import Union, Tuple
+
+logger = logging.getLogger('libcapella.cache')
+logger.addHandler(logging.NullHandler())
+
+CacheKey = Tuple[str, Union[str, None], Union[str, None], str, Union[str, None]]
+
+
+class ResolutionCache(object):
+
+    def __init__(self, ttl: float = 300, max_entries: int = 1024, filename: Union[str, None] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.filename = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        if filename:
+            self.persist(filename)
+
+    @staticmethod
+    def key(api_host: str, endpoint: str, value: Union[str, None], field: str = "name") -> CacheKey:
+        parts = endpoint.strip("/").split("/")
+        organization = None
+        project = None
+        remainder = parts[1:]
+        if len(parts) > 2 and parts[1] == "organizations":
+            organization = parts[2]
+            remainder = parts[3:]
+            if len(remainder) > 1 and remainder[0] == "projects":
+                project = remainder[1]
+                remainder = remainder[2:]
+        resource_type = "/".join(remainder) if remainder else parts[-1]
+        if field != "name":
+            resource_type = f"{resource_type}@{field}"
+        return api_host, organization, project, resource_type, value
+
+    def configure(self, ttl: Union[float, None] = None, max_entries: Union[int, None] = None, filename: Union[str, None] = None):
+        with self._lock:
+            if ttl is not None:
+                self.ttl = ttl
+            if max_entries is not None:
+                self.max_entries = max_entries
+                self._evict()
+        if filename:
+            self.persist(filename)
+
+    def get(self, key: CacheKey) -> Union[str, None]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, endpoint, resource_id = entry
+            if expires < time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return resource_id
+
+    def put(self, key: CacheKey, endpoint: str, resource_id: Union[str, None]):
+        if not resource_id or self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, endpoint, resource_id)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def invalidate(self, key: CacheKey):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_scope(self, api_host: str, endpoint: str, resource_id: Union[str, None] = None):
+        scope = f"{endpoint}/{resource_id}" if resource_id else endpoint
+        with self._lock:
+            for key in [k for k, v in self._entries.items() if k[0] == api_host and (self.in_scope(v[1], scope) or (resource_id and v[2] == resource_id))]:
+                del self._entries[key]
+
+    @staticmethod
+    def in_scope(endpoint: str, scope: str) -> bool:
+        return endpoint == scope or endpoint.startswith(scope + "/")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        return dict(hits=self.hits, misses=self.misses, evictions=self.evictions, size=self.size)
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def persist(self, filename: str):
+        with self._lock:
+            if self.filename is None:
+                atexit.register(self.save)
+            self.filename = filename
+        self.load()
+
+    def load(self):
+        if not self.filename or not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, "r") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError) as err:
+            logger.debug(f"ignoring unreadable cache file {self.filename}: {err}")
+            return
+        now = time.time()
+        with self._lock:
+            for key, expires, endpoint, resource_id in entries:
+                if expires > now and isinstance(resource_id, str):
+                    self._entries[tuple(key)] = (expires, endpoint, resource_id)
+            self._evict()
+
+    def save(self):
+        if not self.filename:
+            return
+        now = time.time()
+        with self._lock:
+            entries = [[list(k), v[0], v[1], v[2]] for k, v in self._entries.items() if v[0] > now]
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.filename)), exist_ok=True)
+            with open(self.filename, "w") as cache_file:
+                json.dump(entries, cache_file)
+        except OSError as err:
+            logger.debug(f"can not write cache file {self.filename}: {err}")
+
+
+resolution_cache = ResolutionCache()
@@ -0,0 +1,73 @@
+##
+##
+
+import json
+import logging
+from typing import Any, Callable, Dict, Tuple, Union
+
+logger = logging.getLogger('libcapella.codec')
+logger.addHandler(logging.NullHandler())
+
+
+class JsonBackend(object):
+
+    def __init__(self, name: str, loads: Callable[[Union[bytes, str]], Any], dumps: Callable[[Any], bytes], errors: Tuple[type, ...] = (ValueError,)):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+        self.errors = errors
+
+    def __repr__(self):
+        return f"JsonBackend({self.name})"
+
+
+def orjson_backend() -> JsonBackend:
+    import orjson
+    return JsonBackend("orjson", orjson.loads, orjson.dumps, (orjson.JSONDecodeError,))
+
+
+def msgspec_backend() -> JsonBackend:
+    import msgspec
+    return JsonBackend("msgspec", msgspec.json.decode, msgspec.json.encode, (msgspec.DecodeError,))
+
+
+def ujson_backend() -> JsonBackend:
+    import ujson
+    return JsonBackend("ujson", ujson.loads, lambda data: ujson.dumps(data, ensure_ascii=False).encode(), (ValueError,))
+
+
+def stdlib_backend() -> JsonBackend:
+    return JsonBackend("json", json.loads, lambda data: json.dumps(data, separators=(",", ":")).encode(), (ValueError,))
+
+
+backends: Dict[str, Callable[[], JsonBackend]] = dict(orjson=orjson_backend, msgspec=msgspec_backend, ujson=ujson_backend, json=stdlib_backend)
+preference = ("orjson", "msgspec", "ujson", "json")
+_loaded: Dict[str, JsonBackend] = {}
+
+
+def register_backend(name: str, factory: Callable[[], JsonBackend]):
+    backends[name] = factory
+    _loaded.pop(name, None)
+
+
+def get_backend(name: Union[str, None] = None) -> JsonBackend:
+    if name and name != "auto":
+        if name not in backends:
+            raise ValueError(f"unknown JSON backend {name}, available: {', '.join(backends)}")
+        names = (name,)
+    else:
+        names = preference
+    for candidate in names:
+        backend = _loaded.get(candidate)
+        if backend is not None:
+            return backend
+        try:
+            backend = backends[candidate]()
+        except ImportError:
+            if len(names) == 1:
+                raise
+            continue
+        logger.debug(f"using JSON backend {candidate}")
+        _loaded[candidate] = backend
+        return backend
+    return stdlib_backend()
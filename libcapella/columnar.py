@@ -1,12 +1,14 @@
 ##
 ##
 
-import time
 import logging
-from typing import List, Union
+from typing import List, Union, Iterator
 from restfull.restapi import NotFoundError
 from libcapella.project import CapellaProject
+from libcapella.wait import wait_for
 from libcapella.logic.columnar import Columnar
+from libcapella.paging import CapellaPager
+from libcapella.cache import resolution_cache
 
 logger = logging.getLogger('libcapella.columnar')
 logger.addHandler(logging.NullHandler())
@@ -14,22 +16,55 @@ logger.addHandler(logging.NullHandler())
 
 class CapellaColumnar(object):
 
-    def __init__(self, project: CapellaProject, cluster: Union[str, None] = None):
+    def __init__(self, project: CapellaProject, cluster: Union[str, None] = None, cluster_id: Union[str, None] = None):
         self._endpoint = f"{project.endpoint}/{project.id}/analyticsClusters"
         self.rest = project.rest
+        self.api_host = project.api_host
         self.project = project
         self.cluster_name = cluster if cluster else project.org.config.columnar_name
-        if self.cluster_name:
-            self.cluster = self.get_by_name(self.cluster_name)
+        self._cluster_id = cluster_id if cluster_id else project.org.config.columnar_id if project.org.config.lazy and cluster is None else None
+        self._cluster = None
+        self._resolved = False
+        if not project.org.config.lazy and cluster_id is None:
+            self.resolve()
+
+    def resolve(self):
+        if self._cluster_id:
+            self._cluster = self.get(self._cluster_id)
+        elif self.cluster_name:
+            self._cluster = self.get_by_name(self.cluster_name)
         else:
-            self.cluster = None
+            self._cluster = None
+        self._resolved = True
+        return self
+
+    @property
+    def resolved(self) -> bool:
+        return self._resolved
+
+    @property
+    def cluster(self) -> Union[Columnar, None]:
+        if not self._resolved:
+            self.resolve()
+        return self._cluster
+
+    @cluster.setter
+    def cluster(self, cluster: Union[Columnar, None]):
+        self._cluster = cluster
+        self._resolved = True
 
     @property
     def endpoint(self):
         return self._endpoint
 
+    @property
+    def list_endpoint(self):
+        return self._endpoint
+
     @property
     def id(self):
+        if not self._resolved and self._cluster_id:
+            return self._cluster_id
         if not self.cluster:
             return None
         return self.cluster.id
@@ -42,15 +77,13 @@ class CapellaColumnar(object):
         self.cluster = self.get(self.cluster.id)
 
     def list(self) -> List[Columnar]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=50,
-                                     cursor="cursor",
-                                     category="pages").validate().json_list()
-        logger.debug(f"database list: found {result.size}")
-        return [Columnar.create(r) for r in result.as_list]
+        result = CapellaPager(self.rest, self._endpoint, per_page=50).fetch_all()
+        logger.debug(f"database list: found {len(result)}")
+        return [Columnar.create(r) for r in result]
+
+    def iter_columnar(self, prefetch: bool = False) -> Iterator[Columnar]:
+        for record in CapellaPager(self.rest, self._endpoint, per_page=50, prefetch=prefetch).records():
+            yield Columnar.create(record)
 
     def get(self, columnar_id: str) -> Union[Columnar, None]:
         if not columnar_id:
@@ -60,42 +93,34 @@ class CapellaColumnar(object):
             result = self.rest.get(endpoint).validate().as_json().json_object()
             return Columnar.create(result.as_dict)
         except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, columnar_id)
             return None
 
     def get_by_name(self, name: str) -> Union[Columnar, None]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=50,
-                                     cursor="cursor",
-                                     category="pages").validate().filter("name", name).list_item(0)
+        key = resolution_cache.key(self.api_host, self._endpoint, name)
+        columnar_id = resolution_cache.get(key)
+        if columnar_id is not None:
+            columnar = self.get(columnar_id)
+            if columnar is not None and columnar.name == name:
+                return columnar
+            resolution_cache.invalidate(key)
+        result = CapellaPager(self.rest, self._endpoint, per_page=50).find("name", name)
         if not result:
             return None
+        resolution_cache.put(key, self._endpoint, result.get("id"))
         return Columnar.create(result)
 
     def create(self, columnar: Columnar):
         cluster_id = self.rest.post(self._endpoint, columnar.as_dict_striped).validate().as_json().json_key("id")
         columnar.id = cluster_id
+        resolution_cache.invalidate(resolution_cache.key(self.api_host, self._endpoint, columnar.name))
         self.cluster = columnar
 
     def wait(self, state, retry_count: int = 90):
-        if not self.cluster:
-            return True
-        for retry_number in range(retry_count + 1):
-            check = self.get(self.cluster.id)
-            logger.debug(f"Checking cluster state {check.currentState if check else None} with state {state}")
-            if check and check.currentState != state:
-                return True
-            elif not check:
-                return True
-            else:
-                if retry_number == retry_count:
-                    return False
-                logger.debug(f"Waiting for cluster {self.cluster.name} to reach state {state}")
-                time.sleep(10)
+        return wait_for(self, state, timeout=retry_count * 10)
 
     def delete(self):
         if self.cluster.id:
             endpoint = f"{self._endpoint}/{self.cluster.id}"
             self.rest.delete(endpoint)
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, self.cluster.id)
@@ -12,7 +12,6 @@ logger.addHandler(logging.NullHandler())
 
 
 class CapellaConfig(object):
-    config = CapellaConfigData()
 
     def __init__(self,
                  token: Union[str, None] = None,
@@ -20,8 +19,12 @@ class CapellaConfig(object):
                  email: Union[str, None] = None,
                  profile: Union[str, None] = None,
                  config_file: Union[str, None] = None,
-                 config_dict: Union[dict, None] = None):
-        if config_file:
+                 config_dict: Union[dict, None] = None,
+                 config_data: Union[CapellaConfigData, None] = None):
+        if config_data is not None:
+            logger.debug(f"initializing with existing config data")
+            self.config = config_data
+        elif config_file:
             logger.debug(f"initializing with config file: {config_file}")
             self.config = CapellaTomlConfig(config_file)
         elif config_dict:
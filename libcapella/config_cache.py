@@ -0,0 +1,56 @@
+##
+##
+
+import os
+import logging
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger('libcapella.config_cache')
+logger.addHandler(logging.NullHandler())
+
+FileKey = Tuple[int, int]
+
+
+class ConfigFileCache(object):
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[str, Callable], Tuple[FileKey, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, filename: str, loader: Callable[[str], Any]) -> Any:
+        filename = os.path.abspath(filename)
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return loader(filename)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = (filename, loader)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                return entry[1]
+        value = loader(filename)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (stamp, value)
+        logger.debug(f"config cache: loaded {filename}")
+        return value
+
+    def invalidate(self, filename: str):
+        filename = os.path.abspath(filename)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == filename]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+config_cache = ConfigFileCache()
@@ -2,15 +2,99 @@
 ##
 
 import logging
+from typing import Any, Callable, Dict, Iterable, Mapping, Tuple, Union
 
 logger = logging.getLogger('libcapella.config_data')
 logger.addHandler(logging.NullHandler())
 
+boolean_states = {"1": True, "yes": True, "true": True, "on": True, "0": False, "no": False, "false": False, "off": False}
+
+
+def boolean(value: Any) -> bool:
+    if isinstance(value, str):
+        if value.lower() not in boolean_states:
+            raise ValueError(f"Not a boolean: {value}")
+        return boolean_states[value.lower()]
+    return bool(value)
+
+
+class ConfigField(object):
+    __slots__ = ("attribute", "toml", "ini", "convert", "flag")
+
+    def __init__(self, attribute: str, toml: Union[Tuple[str, ...], None], ini: Union[str, None], convert: Callable[[Any], Any] = str, flag: bool = False):
+        self.attribute = attribute
+        self.toml = toml
+        self.ini = ini
+        self.convert = convert
+        self.flag = flag
+
+    def present(self, value: Any) -> bool:
+        if self.flag:
+            return value is not None and value != ""
+        return bool(value)
+
+
+schema = (
+    ConfigField("_api_host", ("api", "host"), "api_host"),
+    ConfigField("_api_port", ("api", "port"), "api_port", int),
+    ConfigField("_use_ssl", ("api", "ssl"), "use_ssl", boolean, flag=True),
+    ConfigField("_token", ("token",), None),
+    ConfigField("_organization_name", ("organization", "name"), "organization"),
+    ConfigField("_organization_id", ("organization", "id"), None),
+    ConfigField("_project_name", ("project", "name"), "project"),
+    ConfigField("_project_id", ("project", "id"), None),
+    ConfigField("_account_email", ("user", "email"), "account_email"),
+    ConfigField("_account_id", ("user", "id"), None),
+    ConfigField("_database_name", ("database", "name"), None),
+    ConfigField("_columnar_name", ("columnar", "name"), None),
+    ConfigField("_database_id", ("database", "id"), "database_id"),
+    ConfigField("_columnar_id", ("columnar", "id"), "columnar_id"),
+    ConfigField("_lazy", ("lazy",), "lazy", boolean, flag=True),
+    ConfigField("_max_connections", ("api", "max_connections"), "max_connections", int),
+    ConfigField("_rate_limit", ("api", "rate_limit"), "rate_limit", float),
+    ConfigField("_rate_burst", ("api", "rate_burst"), "rate_burst", float),
+    ConfigField("_json_backend", ("api", "json_backend"), "json_backend"),
+    ConfigField("_cache_responses", ("cache", "enabled"), "cache_responses", boolean, flag=True),
+    ConfigField("_cache_path", ("cache", "path"), "cache_path"),
+    ConfigField("_cache_max_bytes", ("cache", "max_bytes"), "cache_max_bytes", int),
+    ConfigField("_cache_max_age", ("cache", "max_age"), "cache_max_age", float)
+)
+toml_fields: Dict[Tuple[str, ...], ConfigField] = {f.toml: f for f in schema if f.toml}
+ini_fields: Dict[str, ConfigField] = {f.ini: f for f in schema if f.ini}
+
+
+def map_toml(document: dict, fields: Dict[Tuple[str, ...], ConfigField] = None) -> Dict[str, Any]:
+    fields = fields if fields is not None else toml_fields
+    values = {}
+    stack = [((), document.get("capella") or {})]
+    while stack:
+        path, table = stack.pop()
+        for key, value in table.items():
+            if isinstance(value, dict):
+                stack.append((path + (key,), value))
+                continue
+            field = fields.get(path + (key,))
+            if field is not None and field.present(value):
+                values[field.attribute] = field.convert(value)
+    return values
+
+
+def map_ini(section: Union[Mapping[str, str], Iterable[Tuple[str, str]]], fields: Dict[str, ConfigField] = None) -> Dict[str, Any]:
+    fields = fields if fields is not None else ini_fields
+    values = {}
+    for key, value in (section.items() if isinstance(section, Mapping) else section):
+        field = fields.get(key)
+        if field is not None and field.present(value):
+            values[field.attribute] = field.convert(value)
+    return values
+
 
 class CapellaConfigData(object):
 
     def __init__(self):
         self._api_host = "cloudapi.cloud.couchbase.com"
+        self._api_port = None
+        self._use_ssl = True
         self._token = None
         self._organization_name = None
         self._organization_id = None
@@ -20,9 +104,22 @@ class CapellaConfigData(object):
         self._account_id = None
         self._database_name = None
         self._columnar_name = None
+        self._database_id = None
+        self._columnar_id = None
+        self._lazy = False
+        self._max_connections = 32
+        self._rate_limit = 0.0
+        self._rate_burst = 10.0
+        self._json_backend = None
+        self._cache_responses = False
+        self._cache_path = None
+        self._cache_max_bytes = 64 * 1024 * 1024
+        self._cache_max_age = 0.0
 
     def from_dict(self, data: dict):
         self._api_host = data.get("api_host", self._api_host)
+        self._api_port = data.get("api_port", self._api_port)
+        self._use_ssl = data.get("use_ssl", self._use_ssl)
         self._token = data.get("token", self._token)
         self._organization_name = data.get("organization_name", self._organization_name)
         self._organization_id = data.get("organization_id", self._organization_id)
@@ -32,10 +129,29 @@ class CapellaConfigData(object):
         self._account_id = data.get("account_id", self._account_id)
         self._database_name = data.get("database_name", self._database_name)
         self._columnar_name = data.get("columnar_name", self._columnar_name)
+        self._database_id = data.get("database_id", self._database_id)
+        self._columnar_id = data.get("columnar_id", self._columnar_id)
+        self._lazy = bool(data.get("lazy", self._lazy))
+        self._max_connections = int(data.get("max_connections", self._max_connections))
+        self._rate_limit = float(data.get("rate_limit", self._rate_limit))
+        self._rate_burst = float(data.get("rate_burst", self._rate_burst))
+        self._json_backend = data.get("json_backend", self._json_backend)
+        self._cache_responses = bool(data.get("cache_responses", self._cache_responses))
+        self._cache_path = data.get("cache_path", self._cache_path)
+        self._cache_max_bytes = int(data.get("cache_max_bytes", self._cache_max_bytes))
+        self._cache_max_age = float(data.get("cache_max_age", self._cache_max_age))
+
+    def apply(self, values: Dict[str, Any]):
+        for attribute, value in values.items():
+            setattr(self, attribute, value)
 
     def set_api_host(self, api_host: str):
         self._api_host = api_host
 
+    def set_api_port(self, api_port: Union[int, None], use_ssl: bool = True):
+        self._api_port = api_port
+        self._use_ssl = use_ssl
+
     def set_token(self, token: str):
         self._token = token
 
@@ -63,10 +179,46 @@ class CapellaConfigData(object):
     def set_columnar_name(self, columnar_name: str):
         self._columnar_name = columnar_name
 
+    def set_database_id(self, database_id: str):
+        self._database_id = database_id
+
+    def set_columnar_id(self, columnar_id: str):
+        self._columnar_id = columnar_id
+
+    def set_lazy(self, lazy: bool = True):
+        self._lazy = lazy
+
+    def set_max_connections(self, max_connections: int):
+        self._max_connections = max_connections
+
+    def set_rate_limit(self, rate_limit: float, rate_burst: Union[float, None] = None):
+        self._rate_limit = rate_limit
+        if rate_burst is not None:
+            self._rate_burst = rate_burst
+
+    def set_json_backend(self, json_backend: Union[str, None]):
+        self._json_backend = json_backend
+
+    def set_response_cache(self, enabled: bool = True, path: Union[str, None] = None, max_bytes: Union[int, None] = None, max_age: Union[float, None] = None):
+        self._cache_responses = enabled
+        self._cache_path = path
+        if max_bytes is not None:
+            self._cache_max_bytes = max_bytes
+        if max_age is not None:
+            self._cache_max_age = max_age
+
     @property
     def api_host(self):
         return self._api_host
 
+    @property
+    def api_port(self):
+        return self._api_port
+
+    @property
+    def use_ssl(self):
+        return self._use_ssl
+
     @property
     def token(self):
         return self._token
@@ -103,8 +255,54 @@ class CapellaConfigData(object):
     def columnar_name(self):
         return self._columnar_name
 
+    @property
+    def database_id(self):
+        return self._database_id
+
+    @property
+    def columnar_id(self):
+        return self._columnar_id
+
+    @property
+    def lazy(self):
+        return self._lazy
+
+    @property
+    def max_connections(self):
+        return self._max_connections
+
+    @property
+    def rate_limit(self):
+        return self._rate_limit
+
+    @property
+    def rate_burst(self):
+        return self._rate_burst
+
+    @property
+    def json_backend(self):
+        return self._json_backend
+
+    @property
+    def cache_responses(self):
+        return self._cache_responses
+
+    @property
+    def cache_path(self):
+        return self._cache_path
+
+    @property
+    def cache_max_bytes(self):
+        return self._cache_max_bytes
+
+    @property
+    def cache_max_age(self):
+        return self._cache_max_age
+
     def __str__(self):
         return (f"api_host={self.api_host}\n"
+                f"api_port={self.api_port}\n"
+                f"use_ssl={self.use_ssl}\n"
                 f"token={self.token}\n"
                 f"organization_name={self.organization_name}\n"
                 f"organization_id={self.organization_id}\n"
@@ -113,4 +311,15 @@ class CapellaConfigData(object):
                 f"account_email={self.account_email}\n"
                 f"account_id={self.account_id}\n"
                 f"database_name={self.database_name}\n"
-                f"columnar_name={self.columnar_name}\n")
+                f"columnar_name={self.columnar_name}\n"
+                f"database_id={self.database_id}\n"
+                f"columnar_id={self.columnar_id}\n"
+                f"lazy={self.lazy}\n"
+                f"max_connections={self.max_connections}\n"
+                f"rate_limit={self.rate_limit}\n"
+                f"rate_burst={self.rate_burst}\n"
+                f"json_backend={self.json_backend}\n"
+                f"cache_responses={self.cache_responses}\n"
+                f"cache_path={self.cache_path}\n"
+                f"cache_max_bytes={self.cache_max_bytes}\n"
+                f"cache_max_age={self.cache_max_age}\n")
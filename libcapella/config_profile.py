@@ -6,11 +6,32 @@ import os
 import configparser
 from configparser import SectionProxy
 from pathlib import Path
-from libcapella.config_data import CapellaConfigData
+from typing import Dict, List, Union
+from libcapella.config_data import CapellaConfigData, ConfigField, ini_fields, map_ini
+from libcapella.config_cache import config_cache
 
 logger = logging.getLogger('libcapella.config_profile')
 logger.addHandler(logging.NullHandler())
 
+profile_fields = dict(ini_fields, token_file=ConfigField("_token_file", None, "token_file"))
+
+
+def default_config_file() -> str:
+    return os.path.join(Path.home(), '.capella', 'credentials')
+
+
+def read_profiles(filename: str) -> Dict[str, Dict[str, str]]:
+    config_data = configparser.ConfigParser()
+    config_data.read(filename)
+    return {name: dict(config_data[name]) for name in config_data.sections()}
+
+
+def read_token(filename: str) -> Union[str, None]:
+    with open(filename) as token_file:
+        credential_data = dict(line.split(':', 1) for line in token_file)
+    token = credential_data.get('APIKeyToken')
+    return token.strip() if token is not None else None
+
 
 class CapellaProfileConfig(CapellaConfigData):
 
@@ -29,37 +50,35 @@ class CapellaProfileConfig(CapellaConfigData):
         self.read_token_file()
 
     def read_config_file(self):
-        config_data = configparser.ConfigParser()
         try:
-            config_data.read(self.filename)
-            default_config = config_data['default']
-            self.read_config(default_config)
+            sections = config_cache.load(self.filename, read_profiles)
+            self.read_config(sections['default'])
             if self.profile != 'default':
-                profile_config = config_data[self.profile]
-                self.read_config(profile_config)
+                self.read_config(sections[self.profile])
         except KeyError:
             raise RuntimeError(f"profile {self.profile} does not exist in config file {self.config_file}")
         except Exception as err:
             raise RuntimeError(f"can not read config file {self.config_file}: {err}")
 
-    def read_config(self, profile_config: SectionProxy):
-        if profile_config.get('api_host'):
-            self._api_host = profile_config.get('api_host')
-        if profile_config.get('token_file'):
-            self._token_file = profile_config.get('token_file')
+    def read_config(self, profile_config: Union[SectionProxy, Dict[str, str]]):
+        self.apply(map_ini(profile_config, profile_fields))
+        if self._token_file:
             self._token_file_path = os.path.join(self.config_directory, self._token_file)
-        if profile_config.get('organization'):
-            self._organization_name = profile_config.get('organization')
-        if profile_config.get('project'):
-            self._project_name = profile_config.get('project')
-        if profile_config.get('account_email'):
-            self._account_email = profile_config.get('account_email')
+
+    @classmethod
+    def profiles(cls, filename: Union[str, None] = None) -> List[str]:
+        return list(config_cache.load(filename if filename else default_config_file(), read_profiles))
+
+    @classmethod
+    def load_all(cls, filename: Union[str, None] = None) -> Dict[str, "CapellaProfileConfig"]:
+        return {profile: cls(filename, profile) for profile in cls.profiles(filename)}
 
     def read_token_file(self):
         if os.path.exists(self._token_file_path):
             try:
-                credential_data = dict(line.split(':', 1) for line in open(self._token_file_path))
-                self._token = credential_data.get('APIKeyToken').strip()
+                self._token = config_cache.load(self._token_file_path, read_token)
+                if self._token is None:
+                    raise AttributeError('APIKeyToken')
             except AttributeError:
                 raise RuntimeError(f"token file {self._token_file} does not contain an API key and token")
             except Exception as err:
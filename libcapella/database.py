@@ -1,13 +1,15 @@
 ##
 ##
 
-import time
 import logging
-from typing import List, Union
-from restfull.restapi import NotFoundError, UnprocessableEntityError
+from typing import List, Union, Iterator
+from restfull.restapi import NotFoundError, UnprocessableEntityError, RateLimitError
 from pytoolbase.retry import retry
 from libcapella.project import CapellaProject
+from libcapella.wait import wait_for
 from libcapella.logic.database import Database
+from libcapella.paging import CapellaPager
+from libcapella.cache import resolution_cache
 
 logger = logging.getLogger('libcapella.database')
 logger.addHandler(logging.NullHandler())
@@ -15,22 +17,55 @@ logger.addHandler(logging.NullHandler())
 
 class CapellaDatabase(object):
 
-    def __init__(self, project: CapellaProject, database: Union[str, None] = None):
+    def __init__(self, project: CapellaProject, database: Union[str, None] = None, database_id: Union[str, None] = None):
         self._endpoint = f"{project.endpoint}/{project.id}/clusters"
         self.rest = project.rest
+        self.api_host = project.api_host
         self.project = project
         self.database_name = database if database else project.org.config.database_name
-        if self.database_name:
-            self.database = self.get_by_name(self.database_name)
+        self._database_id = database_id if database_id else project.org.config.database_id if project.org.config.lazy and database is None else None
+        self._database = None
+        self._resolved = False
+        if not project.org.config.lazy and database_id is None:
+            self.resolve()
+
+    def resolve(self):
+        if self._database_id:
+            self._database = self.get(self._database_id)
+        elif self.database_name:
+            self._database = self.get_by_name(self.database_name)
         else:
-            self.database = None
+            self._database = None
+        self._resolved = True
+        return self
+
+    @property
+    def resolved(self) -> bool:
+        return self._resolved
+
+    @property
+    def database(self) -> Union[Database, None]:
+        if not self._resolved:
+            self.resolve()
+        return self._database
+
+    @database.setter
+    def database(self, database: Union[Database, None]):
+        self._database = database
+        self._resolved = True
 
     @property
     def endpoint(self):
         return self._endpoint
 
+    @property
+    def list_endpoint(self):
+        return self._endpoint
+
     @property
     def id(self):
+        if not self._resolved and self._database_id:
+            return self._database_id
         if not self.database:
             return None
         return self.database.id
@@ -43,15 +78,13 @@ class CapellaDatabase(object):
         self.database = self.get(self.database.id)
 
     def list(self) -> List[Database]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=50,
-                                     cursor="cursor",
-                                     category="pages").validate().json_list()
-        logger.debug(f"database list: found {result.size}")
-        return [Database.create(r) for r in result.as_list]
+        result = CapellaPager(self.rest, self._endpoint, per_page=50).fetch_all()
+        logger.debug(f"database list: found {len(result)}")
+        return [Database.create(r) for r in result]
+
+    def iter_databases(self, prefetch: bool = False) -> Iterator[Database]:
+        for record in CapellaPager(self.rest, self._endpoint, per_page=50, prefetch=prefetch).records():
+            yield Database.create(record)
 
     def get(self, database_id: str) -> Union[Database, None]:
         if not database_id:
@@ -61,21 +94,24 @@ class CapellaDatabase(object):
             result = self.rest.get(endpoint).validate().as_json().json_object()
             return Database.create(result.as_dict)
         except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, database_id)
             return None
 
     def get_by_name(self, name: str) -> Union[Database, None]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=50,
-                                     cursor="cursor",
-                                     category="pages").validate().filter("name", name).list_item(0)
+        key = resolution_cache.key(self.api_host, self._endpoint, name)
+        database_id = resolution_cache.get(key)
+        if database_id is not None:
+            database = self.get(database_id)
+            if database is not None and database.name == name:
+                return database
+            resolution_cache.invalidate(key)
+        result = CapellaPager(self.rest, self._endpoint, per_page=50).find("name", name)
         if not result:
             return None
+        resolution_cache.put(key, self._endpoint, result.get("id"))
         return Database.create(result)
 
-    @retry(retry_count=5, factor=0.001, allow_list=(UnprocessableEntityError,))
+    @retry(retry_count=5, factor=0.5, allow_list=(UnprocessableEntityError, RateLimitError))
     def create(self, database: Database):
         if self.database_name:
             database.name = self.database_name
@@ -83,25 +119,14 @@ class CapellaDatabase(object):
         logger.debug(f"creating database {database.name}:\n{config}")
         database_id = self.rest.post(self._endpoint, config).validate().as_json().json_key("id")
         database.id = database_id
+        resolution_cache.invalidate(resolution_cache.key(self.api_host, self._endpoint, database.name))
         self.database = database
 
     def wait(self, state, retry_count: int = 90):
-        if not self.database:
-            return True
-        for retry_number in range(retry_count + 1):
-            check = self.get(self.database.id)
-            logger.debug(f"Checking cluster state {check.currentState if check else None} with state {state}")
-            if check and check.currentState != state:
-                return True
-            elif not check:
-                return True
-            else:
-                if retry_number == retry_count:
-                    return False
-                logger.debug(f"Waiting for cluster {self.database.name} to reach state {state}")
-                time.sleep(10)
+        return wait_for(self, state, timeout=retry_count * 10)
 
     def delete(self):
         if self.database.id:
             endpoint = f"{self._endpoint}/{self.database.id}"
             self.rest.delete(endpoint)
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, self.database.id)
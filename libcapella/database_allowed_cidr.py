@@ -2,10 +2,13 @@
 ##
 
 import logging
-from typing import List, Union
+from typing import List, Union, Iterator
 from restfull.restapi import NotFoundError
-from libcapella.logic.allowed_cidr import AllowedCIDR
+from libcapella.logic.allowed_cidr import AllowedCIDR, AllowedCIDRSync
 from libcapella.database import CapellaDatabase
+from libcapella.paging import CapellaPager
+from libcapella.cache import resolution_cache
+from libcapella.allowed_cidr_sync import plan_cidr_sync, apply_cidr_sync
 
 logger = logging.getLogger('libcapella.database_allowed_cidr')
 logger.addHandler(logging.NullHandler())
@@ -16,6 +19,7 @@ class CapellaAllowedCIDR(object):
     def __init__(self, database: CapellaDatabase, cidr: str = None):
         self._endpoint = f"{database.endpoint}/{database.id}/allowedcidrs"
         self.rest = database.rest
+        self.api_host = database.api_host
         self.cidr = cidr
         if self.cidr:
             self.allowed_cidr = self.get_by_name(self.cidr)
@@ -33,15 +37,13 @@ class CapellaAllowedCIDR(object):
         return self.allowed_cidr.id
 
     def list(self) -> List[AllowedCIDR]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().json_list()
-        logger.debug(f"allowed CIDR list: found {result.size}")
-        return [AllowedCIDR.create(a) for a in result.as_list]
+        result = CapellaPager(self.rest, self._endpoint, per_page=100).fetch_all()
+        logger.debug(f"allowed CIDR list: found {len(result)}")
+        return [AllowedCIDR.create(a) for a in result]
+
+    def iter_allowed_cidrs(self, prefetch: bool = False) -> Iterator[AllowedCIDR]:
+        for record in CapellaPager(self.rest, self._endpoint, per_page=100, prefetch=prefetch).records():
+            yield AllowedCIDR.create(record)
 
     def get(self, allowed_cidr_id: str) -> Union[AllowedCIDR, None]:
         endpoint = f"{self._endpoint}/{allowed_cidr_id}"
@@ -49,26 +51,38 @@ class CapellaAllowedCIDR(object):
             result = self.rest.get(endpoint).validate().as_json().json_object()
             return AllowedCIDR.create(result.as_dict)
         except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, allowed_cidr_id)
             return None
 
     def get_by_name(self, cidr: str) -> Union[AllowedCIDR, None]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().filter("cidr", cidr).list_item(0)
+        key = resolution_cache.key(self.api_host, self._endpoint, cidr, field="cidr")
+        allowed_cidr_id = resolution_cache.get(key)
+        if allowed_cidr_id is not None:
+            allowed_cidr = self.get(allowed_cidr_id)
+            if allowed_cidr is not None and allowed_cidr.cidr == cidr:
+                return allowed_cidr
+            resolution_cache.invalidate(key)
+        result = CapellaPager(self.rest, self._endpoint, per_page=100).find("cidr", cidr)
         if not result:
             return None
+        resolution_cache.put(key, self._endpoint, result.get("id"))
         return AllowedCIDR.create(result)
 
     def create(self, allowed_cidr: AllowedCIDR):
         allowed_cidr_id = self.rest.post(self._endpoint, allowed_cidr.as_dict_striped).validate().as_json().json_key("id")
         allowed_cidr.id = allowed_cidr_id
+        resolution_cache.invalidate(resolution_cache.key(self.api_host, self._endpoint, allowed_cidr.cidr, field="cidr"))
         self.allowed_cidr = allowed_cidr
 
     def delete(self):
         if self.allowed_cidr.id:
             endpoint = f"{self._endpoint}/{self.allowed_cidr.id}"
             self.rest.delete(endpoint)
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, self.allowed_cidr.id)
+
+    def sync(self, desired_cidrs: List[str], comment: Union[str, None] = None, prune: bool = True, concurrency: int = 8) -> AllowedCIDRSync:
+        plan = plan_cidr_sync(self.list(), desired_cidrs, prune)
+        if plan.changes:
+            apply_cidr_sync(self.rest, self._endpoint, plan, comment, concurrency)
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint)
+        return plan
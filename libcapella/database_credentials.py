@@ -2,10 +2,15 @@
 ##
 
 import logging
-from typing import List, Union
-from restfull.restapi import NotFoundError
+from typing import List, Union, Iterator
+from restfull.restapi import RestAPI, NotFoundError
 from libcapella.logic.credentials import DatabaseCredentials
+from libcapella.logic.batch import BatchResult
 from libcapella.database import CapellaDatabase
+from libcapella.paging import CapellaPager
+from libcapella.cache import resolution_cache
+from libcapella.batch import run_batch
+from libcapella.rate_limit import TokenBucket
 
 logger = logging.getLogger('libcapella.database_credentials')
 logger.addHandler(logging.NullHandler())
@@ -16,6 +21,7 @@ class CapellaDatabaseCredentials(object):
     def __init__(self, database: CapellaDatabase, username: str = None):
         self._endpoint = f"{database.endpoint}/{database.id}/users"
         self.rest = database.rest
+        self.api_host = database.api_host
         self.username = username
         if self.username:
             self.db_credentials = self.get_by_name(self.username)
@@ -33,15 +39,13 @@ class CapellaDatabaseCredentials(object):
         return self.db_credentials.id
 
     def list(self) -> List[DatabaseCredentials]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().json_list()
-        logger.debug(f"database credentials list: found {result.size}")
-        return [DatabaseCredentials.create(a) for a in result.as_list]
+        result = CapellaPager(self.rest, self._endpoint, per_page=100).fetch_all()
+        logger.debug(f"database credentials list: found {len(result)}")
+        return [DatabaseCredentials.create(a) for a in result]
+
+    def iter_credentials(self, prefetch: bool = False) -> Iterator[DatabaseCredentials]:
+        for record in CapellaPager(self.rest, self._endpoint, per_page=100, prefetch=prefetch).records():
+            yield DatabaseCredentials.create(record)
 
     def get(self, db_user_id: str) -> Union[DatabaseCredentials, None]:
         endpoint = f"{self._endpoint}/{db_user_id}"
@@ -49,26 +53,41 @@ class CapellaDatabaseCredentials(object):
             result = self.rest.get(endpoint).validate().as_json().json_object()
             return DatabaseCredentials.create(result.as_dict)
         except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, db_user_id)
             return None
 
     def get_by_name(self, username: str) -> Union[DatabaseCredentials, None]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().filter("name", username).list_item(0)
+        key = resolution_cache.key(self.api_host, self._endpoint, username)
+        db_user_id = resolution_cache.get(key)
+        if db_user_id is not None:
+            db_user = self.get(db_user_id)
+            if db_user is not None and db_user.name == username:
+                return db_user
+            resolution_cache.invalidate(key)
+        result = CapellaPager(self.rest, self._endpoint, per_page=100).find("name", username)
         if not result:
             return None
+        resolution_cache.put(key, self._endpoint, result.get("id"))
         return DatabaseCredentials.create(result)
 
     def create(self, db_user: DatabaseCredentials):
         db_user_id = self.rest.post(self._endpoint, db_user.as_dict_striped).validate().as_json().json_key("id")
         db_user.id = db_user_id
+        resolution_cache.invalidate(resolution_cache.key(self.api_host, self._endpoint, db_user.name))
         self.db_credentials = db_user
 
+    def create_many(self, db_users: List[DatabaseCredentials], concurrency: int = 4, bucket: Union[TokenBucket, None] = None) -> List[BatchResult]:
+        def submit(rest: RestAPI, db_user: DatabaseCredentials):
+            db_user.id = rest.post(self._endpoint, db_user.as_dict_striped).validate().as_json().json_key("id")
+            resolution_cache.invalidate(resolution_cache.key(self.api_host, self._endpoint, db_user.name))
+            return db_user
+
+        results = run_batch(self.rest, db_users, submit, concurrency=concurrency, bucket=bucket)
+        logger.debug(f"database credentials create: {len([r for r in results if r.ok])} of {len(results)} created")
+        return results
+
     def delete(self):
         if self.db_credentials.id:
             endpoint = f"{self._endpoint}/{self.db_credentials.id}"
             self.rest.delete(endpoint)
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, self.db_credentials.id)
@@ -0,0 +1,131 @@
+##
+##
+
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Dict, Iterable, List, Tuple, Union
+from restfull.restapi import RestAPI
+from pytoolbase.exceptions import NonFatalError
+from libcapella.base import clone_rest
+from libcapella.organization import CapellaOrganization
+from libcapella.paging import CapellaPager
+from libcapella.logic.inventory import InventorySnapshot, InventoryItem, InventoryError, ChangeSet, models, kinds, audit_stamp
+
+logger = logging.getLogger('libcapella.inventory')
+logger.addHandler(logging.NullHandler())
+
+roots = (("project", "projects"), ("app_service", "appservices"), ("user", "users"))
+children = dict(
+    project=(("database", "clusters"), ("columnar", "analyticsClusters")),
+    database=(("allowed_cidr", "allowedcidrs"), ("credentials", "users"), ("network_peer", "networkPeers")),
+    columnar=(("allowed_cidr", "allowedcidrs"),)
+)
+reusable = frozenset(("database", "columnar"))
+
+Task = Tuple[str, str, Union[str, None], Union[str, None]]
+
+
+class CapellaInventory(object):
+
+    def __init__(self, org: CapellaOrganization, workers: int = 8, include: Union[Iterable[str], None] = None, per_page: int = 100,
+                 max_age: float = 300.0):
+        self.org = org
+        self.rest = org.rest
+        self.workers = workers
+        self.per_page = per_page
+        self.max_age = max_age
+        self.include = frozenset(include) if include else frozenset(kinds)
+        unknown = self.include - set(kinds)
+        if unknown:
+            raise ValueError(f"unknown inventory kinds: {', '.join(sorted(unknown))}")
+        self._local = threading.local()
+
+    def needed(self, kind: str) -> bool:
+        return kind in self.include or any(self.needed(child) for child, _ in children.get(kind, ()))
+
+    def client(self) -> RestAPI:
+        rest = getattr(self._local, "rest", None)
+        if rest is None:
+            rest = clone_rest(self.rest)
+            self._local.rest = rest
+        return rest
+
+    def fetch(self, endpoint: str) -> Tuple[List[dict], int]:
+        pager = CapellaPager(self.client(), endpoint, per_page=self.per_page)
+        return pager.fetch_all(workers=1), pager.pages_fetched
+
+    def crawl(self, previous: Union[InventorySnapshot, None] = None) -> InventorySnapshot:
+        snapshot = InventorySnapshot(self.org.organization, time.time(), include=sorted(self.include))
+        futures: Dict[Future, Task] = {}
+        seen = set()
+        reused = 0
+        start = time.perf_counter()
+        if previous is not None and (previous.organization.id != self.org.id or sorted(previous.include) != snapshot.include):
+            logger.debug("inventory: previous snapshot does not match this crawl, ignoring it")
+            previous = None
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            def submit(kind: str, endpoint: str, parent: Union[str, None], project_id: Union[str, None]):
+                if endpoint in seen or not self.needed(kind):
+                    return
+                seen.add(endpoint)
+                futures[executor.submit(self.fetch, endpoint)] = (kind, endpoint, parent, project_id)
+
+            for kind, path in roots:
+                submit(kind, f"{self.org.id_endpoint}/{path}", self.org.id, None)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, endpoint, parent, project_id = futures.pop(future)
+                    try:
+                        records, pages = future.result()
+                    except NonFatalError as err:
+                        logger.debug(f"inventory: {endpoint}: {err}")
+                        snapshot.errors.append(InventoryError(endpoint, str(err)))
+                        continue
+                    snapshot.requests += pages
+                    snapshot.listed[endpoint] = time.time()
+                    model = models[kind]
+                    for record in records:
+                        resource = model.create(record)
+                        resource_project = resource.id if kind == "project" else project_id
+                        if kind in self.include:
+                            snapshot.add(InventoryItem(kind, resource.id, record.get("clusterId") if kind == "app_service" else parent, resource_project, endpoint, resource))
+                        stamp = audit_stamp(resource)
+                        if stamp is not None and kind in children:
+                            snapshot.stamps[resource.id] = stamp
+                        for child, path in children.get(kind, ()):
+                            child_endpoint = f"{endpoint}/{resource.id}/{path}"
+                            if self.needed(child) and self.reusable(previous, kind, resource.id, stamp, child_endpoint):
+                                for item in previous.children(resource.id, child):
+                                    snapshot.add(item)
+                                snapshot.listed[child_endpoint] = previous.listed[child_endpoint]
+                                reused += 1
+                                continue
+                            submit(child, child_endpoint, resource.id, resource_project)
+
+        for item in snapshot.items:
+            if item.kind == "app_service" and item.project_id is None and item.parent:
+                database = snapshot.get("database", item.parent)
+                item.project_id = database.project_id if database else None
+        snapshot.sort()
+        logger.debug(f"inventory: {len(snapshot.items)} items from {len(seen)} endpoints ({reused} reused) in {snapshot.requests} requests, {time.perf_counter() - start:.3f}s")
+        return snapshot
+
+    def reusable(self, previous: Union[InventorySnapshot, None], kind: str, parent: str, stamp, endpoint: str) -> bool:
+        if previous is None or kind not in reusable or stamp is None or previous.stamps.get(parent) != stamp:
+            return False
+        listed = previous.listed.get(endpoint)
+        return listed is not None and time.time() - listed < self.max_age
+
+    def refresh(self, previous: InventorySnapshot) -> Tuple[InventorySnapshot, ChangeSet]:
+        snapshot = self.crawl(previous)
+        return snapshot, snapshot.diff(previous)
+
+    def write(self, filename: str) -> InventorySnapshot:
+        snapshot = self.crawl()
+        snapshot.to_jsonl(filename, self.org.config.json_backend)
+        return snapshot
@@ -3,10 +3,12 @@
 
 import attr
 import attrs
-from libcapella.logic.common import Audit, not_none
+from typing import List
+from libcapella.logic.common import Audit, serialize, no_audit
+from libcapella.logic.batch import BatchResult
 
 
-@attr.s
+@attr.s(slots=True)
 class AllowedCIDR:
     id: str = attr.ib()
     cidr: str = attr.ib()
@@ -18,20 +20,15 @@ class AllowedCIDR:
 
     @classmethod
     def create(cls, data: dict):
+        get = data.get
         return cls(
-            data.get("id"),
-            data.get("cidr"),
-            data.get("comment"),
-            data.get("expiresAt"),
-            data.get("status"),
-            data.get("type"),
-            Audit(
-                data.get("audit", {}).get("createdBy"),
-                data.get("audit", {}).get("createdAt"),
-                data.get("audit", {}).get("modifiedBy"),
-                data.get("audit", {}).get("modifiedAt"),
-                data.get("audit", {}).get("version")
-            )
+            get("id"),
+            get("cidr"),
+            get("comment"),
+            get("expiresAt"),
+            get("status"),
+            get("type"),
+            Audit.create(get("audit"))
         )
 
     @property
@@ -41,10 +38,23 @@ class AllowedCIDR:
 
     @property
     def as_dict_striped(self):
-        result = not_none(self.as_dict)
-        if 'audit' in result:
-            del result['audit']
-        return result
+        return serialize(self, filter=no_audit)
+
+
+@attr.s(slots=True)
+class AllowedCIDRSync:
+    add: List[str] = attr.ib(factory=list)
+    remove: List[AllowedCIDR] = attr.ib(factory=list)
+    keep: List[AllowedCIDR] = attr.ib(factory=list)
+    results: List[BatchResult] = attr.ib(factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(r.ok for r in self.results)
+
+    @property
+    def changes(self) -> int:
+        return len(self.add) + len(self.remove)
 
 
 class AllowedCIDRBuilder(object):
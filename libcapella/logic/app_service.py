@@ -4,16 +4,16 @@
 import attr
 import attrs
 from typing import Union
-from libcapella.logic.common import Audit, not_none
+from libcapella.logic.common import Audit, serialize, no_audit
 
 
-@attr.s
+@attr.s(slots=True)
 class ComputeConfig:
     cpu: int = attr.ib()
     ram: int = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class AppService:
     id: str = attr.ib()
     name: str = attr.ib()
@@ -57,10 +57,7 @@ class AppService:
 
     @property
     def as_dict_striped(self):
-        result = not_none(self.as_dict)
-        if 'audit' in result:
-            del result['audit']
-        return result
+        return serialize(self, filter=no_audit)
 
 
 class CapellaAppServiceBuilder(object):
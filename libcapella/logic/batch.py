@@ -0,0 +1,18 @@
+##
+##
+
+import attr
+from typing import Any, Optional
+
+
+@attr.s(slots=True)
+class BatchResult:
+    index: int = attr.ib()
+    item: Any = attr.ib()
+    result: Any = attr.ib(default=None)
+    error: Optional[Exception] = attr.ib(default=None)
+    attempts: int = attr.ib(default=0)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -5,10 +5,10 @@ import attr
 import attrs
 from enum import Enum
 from typing import Union
-from libcapella.logic.common import not_none
+from libcapella.logic.common import serialize, no_audit, enum_lookup
 
 
-@attr.s
+@attr.s(slots=True)
 class ComputeConfig:
     cpu: int = attr.ib()
     ram: int = attr.ib()
@@ -31,18 +31,23 @@ class SupportTZ(str, Enum):
     western_us = 'PT'
 
 
-@attr.s
+node_availability = enum_lookup(NodeAvailability)
+support_plan = enum_lookup(SupportPlan)
+support_tz = enum_lookup(SupportTZ)
+
+
+@attr.s(slots=True)
 class Availability:
     type: NodeAvailability = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class Support:
     plan: SupportPlan = attr.ib()
     timezone: SupportTZ = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class Columnar:
     id: str = attr.ib()
     name: str = attr.ib()
@@ -57,25 +62,20 @@ class Columnar:
 
     @classmethod
     def create(cls, data: dict):
+        get = data.get
+        support = get("support") or {}
+        compute = get("compute") or {}
         return cls(
-            data.get("id"),
-            data.get("name"),
-            data.get("description"),
-            data.get("cloudProvider"),
-            data.get("region"),
-            data.get("nodes"),
-            data.get("currentState"),
-            Support(
-                SupportPlan(data.get("support", {}).get("plan", "developer pro")),
-                SupportTZ(data.get("support", {}).get("timezone", "PT"))
-            ),
-            ComputeConfig(
-                data.get("compute", {}).get("cpu"),
-                data.get("compute", {}).get("ram"),
-            ),
-            Availability(
-                NodeAvailability(data.get("availability", {}).get("type", "multi"))
-            )
+            get("id"),
+            get("name"),
+            get("description"),
+            get("cloudProvider"),
+            get("region"),
+            get("nodes"),
+            get("currentState"),
+            Support(support_plan(support.get("plan", "developer pro")), support_tz(support.get("timezone", "PT"))),
+            ComputeConfig(compute.get("cpu"), compute.get("ram")),
+            Availability(node_availability((get("availability") or {}).get("type", "multi")))
         )
 
     @property
@@ -85,10 +85,7 @@ class Columnar:
 
     @property
     def as_dict_striped(self):
-        result = not_none(self.as_dict)
-        if 'audit' in result:
-            del result['audit']
-        return result
+        return serialize(self, filter=no_audit)
 
 
 class CapellaColumnarBuilder(object):
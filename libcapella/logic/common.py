@@ -2,6 +2,15 @@
 ##
 
 import attr
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+from libcapella.codec import get_backend
+
+FieldFilter = Callable[[attr.Attribute, Any], bool]
+
+SCALAR, MODEL, MAPPING, SEQUENCE = range(4)
+_kinds: Dict[type, int] = {dict: MAPPING, list: SEQUENCE, tuple: SEQUENCE, set: SEQUENCE, frozenset: SEQUENCE}
+_plans: Dict[type, Tuple[attr.Attribute, ...]] = {}
 
 
 def not_none(data):
@@ -18,10 +27,109 @@ def not_none(data):
     return data
 
 
-@attr.s
+def value_kind(cls: type) -> int:
+    kind = _kinds.get(cls)
+    if kind is None:
+        if attr.has(cls):
+            kind = MODEL
+            _plans[cls] = attr.fields(cls)
+        elif issubclass(cls, dict):
+            kind = MAPPING
+        elif issubclass(cls, (list, tuple, set, frozenset)):
+            kind = SEQUENCE
+        else:
+            kind = SCALAR
+        _kinds[cls] = kind
+    return kind
+
+
+def field_plan(cls: type) -> Tuple[attr.Attribute, ...]:
+    plan = _plans.get(cls)
+    if plan is None:
+        value_kind(cls)
+        plan = _plans[cls]
+    return plan
+
+
+def no_audit(attribute: attr.Attribute, value: Any) -> bool:
+    return attribute.name != "audit"
+
+
+def serialize(obj, filter: Optional[FieldFilter] = None) -> Union[dict, list]:
+    kinds = _kinds
+    root = [] if value_kind(obj.__class__) == SEQUENCE else {}
+    stack = [(obj, root)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        source, target = pop()
+        kind = kinds[source.__class__]
+        if kind == MODEL:
+            for attribute in _plans[source.__class__]:
+                value = getattr(source, attribute.name)
+                if value is None or (filter is not None and not filter(attribute, value)):
+                    continue
+                kind = kinds.get(value.__class__)
+                if kind is None:
+                    kind = value_kind(value.__class__)
+                if kind != SCALAR:
+                    child = [] if kind == SEQUENCE else {}
+                    push((value, child))
+                    value = child
+                target[attribute.name] = value
+        elif kind == MAPPING:
+            for key, value in source.items():
+                if value is None or key is None:
+                    continue
+                kind = kinds.get(value.__class__)
+                if kind is None:
+                    kind = value_kind(value.__class__)
+                if kind != SCALAR:
+                    child = [] if kind == SEQUENCE else {}
+                    push((value, child))
+                    value = child
+                target[key] = value
+        else:
+            append = target.append
+            for value in source:
+                if value is None:
+                    continue
+                kind = kinds.get(value.__class__)
+                if kind is None:
+                    kind = value_kind(value.__class__)
+                if kind != SCALAR:
+                    child = [] if kind == SEQUENCE else {}
+                    push((value, child))
+                    value = child
+                append(value)
+    return root
+
+
+def serialize_bytes(obj, filter: Optional[FieldFilter] = None, json_backend: Optional[str] = None) -> bytes:
+    return get_backend(json_backend).dumps(serialize(obj, filter))
+
+
+def enum_lookup(enum: Type[Enum]) -> Callable[[Any], Enum]:
+    members = {member.value: member for member in enum}
+
+    def lookup(value):
+        member = members.get(value)
+        return member if member is not None else enum(value)
+
+    return lookup
+
+
+@attr.s(slots=True)
 class Audit:
     createdBy: str = attr.ib()
     createdAt: str = attr.ib()
     modifiedBy: str = attr.ib()
     modifiedAt: str = attr.ib()
     version: int = attr.ib()
+
+    @classmethod
+    def create(cls, data: Union[dict, None]):
+        if not data:
+            return cls(None, None, None, None, None)
+        get = data.get
+        return cls(get("createdBy"), get("createdAt"), get("modifiedBy"), get("modifiedAt"), get("version"))
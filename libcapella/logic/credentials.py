@@ -4,33 +4,33 @@
 import attr
 import attrs
 from typing import List
-from libcapella.logic.common import Audit, not_none
+from libcapella.logic.common import Audit, serialize, no_audit
 
 
-@attr.s
+@attr.s(slots=True)
 class ResourceScope:
     name: str = attr.ib()
     collections: List[str] = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class BucketAccessSpec:
     name: str = attr.ib()
     scopes: List[ResourceScope] = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class ResourceBucket:
     buckets: List[BucketAccessSpec] = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class Access:
     privileges: List[str] = attr.ib()
     resources: ResourceBucket = attr.ib(default={})
 
 
-@attr.s
+@attr.s(slots=True)
 class DatabaseCredentials:
     id: str = attr.ib()
     name: str = attr.ib()
@@ -40,17 +40,12 @@ class DatabaseCredentials:
 
     @classmethod
     def create(cls, data: dict):
+        get = data.get
         return cls(
-            data.get("id"),
-            data.get("name"),
-            data.get("password"),
-            Audit(
-                data.get("audit", {}).get("createdBy"),
-                data.get("audit", {}).get("createdAt"),
-                data.get("audit", {}).get("modifiedBy"),
-                data.get("audit", {}).get("modifiedAt"),
-                data.get("audit", {}).get("version")
-            ),
+            get("id"),
+            get("name"),
+            get("password"),
+            Audit.create(get("audit")),
             [
                 Access(
                     a.get("privileges", []),
@@ -58,16 +53,11 @@ class DatabaseCredentials:
                         [
                             BucketAccessSpec(
                                 b.get("name"),
-                                [
-                                    ResourceScope(
-                                        s.get("name"),
-                                        s.get("collections", []),
-                                    ) for s in b.get("scopes", [])
-                                ]
+                                [ResourceScope(s.get("name"), s.get("collections", [])) for s in b.get("scopes", [])]
                             ) for b in a.get("resources", {}).get("buckets", [])
                         ]
                     )
-                ) for a in data.get("access", [])
+                ) for a in get("access", [])
             ]
         )
 
@@ -78,9 +68,7 @@ class DatabaseCredentials:
 
     @property
     def as_dict_striped(self):
-        result = not_none(self.as_dict)
-        if 'audit' in result:
-            del result['audit']
+        result = serialize(self, filter=no_audit)
         if len(result.get('access')[0].get('resources', {}).get('buckets', [])) == 0:
             del result['access'][0]['resources']
         return result
@@ -5,8 +5,7 @@ import attr
 import attrs
 from enum import Enum
 from typing import List, Union
-from libcapella.logic.common import Audit, not_none
-from libcapella.network_util import NetworkDriver
+from libcapella.logic.common import Audit, serialize, no_audit, enum_lookup
 
 aws_storage_matrix = {
     99: 3000,
@@ -56,43 +55,57 @@ azure_ultra_matrix = {
 }
 
 
-@attr.s
+@attr.s(slots=True)
 class CloudProvider:
     type: str = attr.ib()
     region: str = attr.ib()
     cidr: str = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class CouchbaseServer:
     version: str = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class ComputeConfig:
     cpu: int = attr.ib()
     ram: int = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class StorageConfig:
     storage: int = attr.ib()
     type: str = attr.ib()
     iops: int = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class NodeConfig:
     compute: ComputeConfig = attr.ib()
     disk: StorageConfig = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class ServiceGroup:
     node: NodeConfig = attr.ib()
     numOfNodes: int = attr.ib()
     services: List[str] = attr.ib()
 
+    @classmethod
+    def create(cls, data: dict):
+        node = data.get("node") or {}
+        compute = node.get("compute") or {}
+        disk = node.get("disk") or {}
+        return cls(
+            NodeConfig(
+                ComputeConfig(compute.get("cpu"), compute.get("ram")),
+                StorageConfig(disk.get("storage"), disk.get("type"), disk.get("iops"))
+            ),
+            data.get("numOfNodes"),
+            data.get("services"),
+        )
+
 
 class NodeAvailability(str, Enum):
     single = 'single'
@@ -112,18 +125,23 @@ class SupportTZ(str, Enum):
     western_us = 'PT'
 
 
-@attr.s
+node_availability = enum_lookup(NodeAvailability)
+support_plan = enum_lookup(SupportPlan)
+support_tz = enum_lookup(SupportTZ)
+
+
+@attr.s(slots=True)
 class Availability:
     type: NodeAvailability = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class Support:
     plan: SupportPlan = attr.ib()
     timezone: SupportTZ = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class Database:
     id: str = attr.ib()
     appServiceId: str = attr.ib()
@@ -142,54 +160,24 @@ class Database:
 
     @classmethod
     def create(cls, data: dict):
+        get = data.get
+        cloud = get("cloudProvider") or {}
+        support = get("support") or {}
         return cls(
-            data.get("id"),
-            data.get("appServiceId"),
-            data.get("name"),
-            data.get("description"),
-            data.get("configurationType"),
-            data.get("connectionString"),
-            CloudProvider(
-                data.get("cloudProvider", {}).get("type"),
-                data.get("cloudProvider", {}).get("region"),
-                data.get("cloudProvider", {}).get("cidr"),
-            ),
-            CouchbaseServer(
-                data.get("couchbaseServer", {}).get("version"),
-            ),
-            [
-                ServiceGroup(
-                    NodeConfig(
-                        ComputeConfig(
-                            g.get("node", {}).get("compute", {}).get("cpu"),
-                            g.get("node", {}).get("compute", {}).get("ram"),
-                        ),
-                        StorageConfig(
-                            g.get("node", {}).get("disk", {}).get("storage"),
-                            g.get("node", {}).get("disk", {}).get("type"),
-                            g.get("node", {}).get("disk", {}).get("iops"),
-                        )
-                    ),
-                    g.get("numOfNodes"),
-                    g.get("services"),
-                ) for g in data.get("serviceGroups", [])
-            ],
-            Availability(
-                NodeAvailability(data.get("availability", {}).get("type", "multi"))
-            ),
-            Support(
-                SupportPlan(data.get("support", {}).get("plan", "developer pro")),
-                SupportTZ(data.get("support", {}).get("timezone", "PT"))
-            ),
-            data.get("currentState"),
-            Audit(
-                data.get("audit", {}).get("createdBy"),
-                data.get("audit", {}).get("createdAt"),
-                data.get("audit", {}).get("modifiedBy"),
-                data.get("audit", {}).get("modifiedAt"),
-                data.get("audit", {}).get("version")
-            ),
-            data.get("cmekId"),
+            get("id"),
+            get("appServiceId"),
+            get("name"),
+            get("description"),
+            get("configurationType"),
+            get("connectionString"),
+            CloudProvider(cloud.get("type"), cloud.get("region"), cloud.get("cidr")),
+            CouchbaseServer((get("couchbaseServer") or {}).get("version")),
+            [ServiceGroup.create(g) for g in get("serviceGroups") or ()],
+            Availability(node_availability((get("availability") or {}).get("type", "multi"))),
+            Support(support_plan(support.get("plan", "developer pro")), support_tz(support.get("timezone", "PT"))),
+            get("currentState"),
+            Audit.create(get("audit")),
+            get("cmekId"),
         )
 
     @property
@@ -199,10 +187,7 @@ class Database:
 
     @property
     def as_dict_striped(self):
-        result = not_none(self.as_dict)
-        if 'audit' in result:
-            del result['audit']
-        return result
+        return serialize(self, filter=no_audit)
 
 
 class CapellaDatabaseBuilder(object):
@@ -217,6 +202,7 @@ class CapellaDatabaseBuilder(object):
                  plan='developer',
                  timezone='us_west',
                  version=None):
+        from libcapella.network_util import NetworkDriver
         cidr_util = NetworkDriver()
         self._name = name
         self._description = description
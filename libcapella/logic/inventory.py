@@ -0,0 +1,203 @@
+##
+##
+
+import attr
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+from libcapella.codec import get_backend
+from libcapella.logic.common import serialize
+from libcapella.logic.organization import Organization
+from libcapella.logic.project import Project
+from libcapella.logic.database import Database
+from libcapella.logic.columnar import Columnar
+from libcapella.logic.app_service import AppService
+from libcapella.logic.allowed_cidr import AllowedCIDR
+from libcapella.logic.credentials import DatabaseCredentials
+from libcapella.logic.network_peers import NetworkPeers
+from libcapella.logic.user import User
+
+models = dict(
+    project=Project,
+    database=Database,
+    columnar=Columnar,
+    app_service=AppService,
+    allowed_cidr=AllowedCIDR,
+    credentials=DatabaseCredentials,
+    network_peer=NetworkPeers,
+    user=User
+)
+kinds = tuple(models)
+
+
+def audit_stamp(resource: Any) -> Optional[Tuple[Any, Any]]:
+    audit = getattr(resource, "audit", None)
+    if audit is None or (audit.version is None and audit.modifiedAt is None):
+        return None
+    return audit.version, audit.modifiedAt
+
+
+@attr.s(slots=True)
+class InventoryItem:
+    kind: str = attr.ib()
+    id: str = attr.ib()
+    parent: Optional[str] = attr.ib()
+    project_id: Optional[str] = attr.ib()
+    endpoint: str = attr.ib()
+    resource: Any = attr.ib()
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.kind, self.id
+
+    @property
+    def as_record(self) -> dict:
+        return dict(kind=self.kind, id=self.id, parent=self.parent, project=self.project_id, endpoint=self.endpoint, data=serialize(self.resource))
+
+    @classmethod
+    def create(cls, data: dict):
+        get = data.get
+        return cls(get("kind"), get("id"), get("parent"), get("project"), get("endpoint"), models[get("kind")].create(get("data") or {}))
+
+
+@attr.s(slots=True)
+class InventoryError:
+    endpoint: str = attr.ib()
+    message: str = attr.ib()
+
+
+@attr.s(slots=True)
+class ChangeSet:
+    added: List[Any] = attr.ib(factory=list)
+    removed: List[Any] = attr.ib(factory=list)
+    modified: List[Tuple[Any, Any]] = attr.ib(factory=list)
+    unchanged: int = attr.ib(default=0)
+
+    @property
+    def empty(self) -> bool:
+        return not self.added and not self.removed and not self.modified
+
+    @property
+    def changes(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.modified)
+
+    @classmethod
+    def compare(cls, previous: Iterable[Any], current: Iterable[Any], key: Callable[[Any], Hashable] = lambda r: r.id):
+        before = {key(r): r for r in previous}
+        result = cls()
+        for record in current:
+            old = before.pop(key(record), None)
+            if old is None:
+                result.added.append(record)
+            elif old != record:
+                result.modified.append((old, record))
+            else:
+                result.unchanged += 1
+        result.removed.extend(before.values())
+        return result
+
+
+@attr.s(slots=True)
+class InventorySnapshot:
+    organization: Organization = attr.ib()
+    taken_at: float = attr.ib()
+    items: List[InventoryItem] = attr.ib(factory=list)
+    errors: List[InventoryError] = attr.ib(factory=list)
+    requests: int = attr.ib(default=0)
+    include: List[str] = attr.ib(factory=list)
+    stamps: Dict[str, Tuple[Any, Any]] = attr.ib(factory=dict)
+    listed: Dict[str, float] = attr.ib(factory=dict)
+    _index: Dict[Tuple[str, str], InventoryItem] = attr.ib(factory=dict, init=False, repr=False, eq=False)
+    _by_parent: Dict[str, List[InventoryItem]] = attr.ib(factory=dict, init=False, repr=False, eq=False)
+
+    def add(self, item: InventoryItem):
+        self.items.append(item)
+        self._index[item.key] = item
+        self._by_parent.setdefault(item.parent, []).append(item)
+
+    def get(self, kind: str, resource_id: str) -> Optional[InventoryItem]:
+        return self._index.get((kind, resource_id))
+
+    def of_kind(self, kind: str) -> List[Any]:
+        return [item.resource for item in self.items if item.kind == kind]
+
+    def children(self, parent_id: str, kind: Optional[str] = None) -> List[InventoryItem]:
+        return [item for item in self._by_parent.get(parent_id, ()) if kind is None or item.kind == kind]
+
+    def diff(self, previous: "InventorySnapshot") -> ChangeSet:
+        return ChangeSet.compare(previous.items, self.items, key=lambda i: i.key)
+
+    def sort(self):
+        order = {kind: n for n, kind in enumerate(kinds)}
+        self.items.sort(key=lambda i: (order.get(i.kind, len(order)), i.project_id or "", i.parent or "", i.id or ""))
+
+    @property
+    def projects(self) -> List[Project]:
+        return self.of_kind("project")
+
+    @property
+    def databases(self) -> List[Database]:
+        return self.of_kind("database")
+
+    @property
+    def columnar(self) -> List[Columnar]:
+        return self.of_kind("columnar")
+
+    @property
+    def app_services(self) -> List[AppService]:
+        return self.of_kind("app_service")
+
+    @property
+    def allowed_cidrs(self) -> List[AllowedCIDR]:
+        return self.of_kind("allowed_cidr")
+
+    @property
+    def credentials(self) -> List[DatabaseCredentials]:
+        return self.of_kind("credentials")
+
+    @property
+    def network_peers(self) -> List[NetworkPeers]:
+        return self.of_kind("network_peer")
+
+    @property
+    def users(self) -> List[User]:
+        return self.of_kind("user")
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        result = {}
+        for item in self.items:
+            result[item.kind] = result.get(item.kind, 0) + 1
+        return result
+
+    def records(self) -> Iterator[dict]:
+        yield dict(kind="snapshot", id=self.organization.id, taken_at=self.taken_at, requests=self.requests,
+                   errors=[attr.asdict(e) for e in self.errors], include=self.include,
+                   stamps=self.stamps, listed=self.listed, data=serialize(self.organization))
+        for item in self.items:
+            yield item.as_record
+
+    def to_jsonl(self, filename: str, json_backend: Optional[str] = None):
+        dumps = get_backend(json_backend).dumps
+        with open(filename, "wb") as jsonl_file:
+            for record in self.records():
+                jsonl_file.write(dumps(record) + b"\n")
+
+    @classmethod
+    def from_records(cls, records: Iterator[dict]):
+        snapshot = None
+        for record in records:
+            if record.get("kind") == "snapshot":
+                snapshot = cls(Organization.create(record.get("data") or {}), record.get("taken_at"), requests=record.get("requests", 0),
+                               errors=[InventoryError(e.get("endpoint"), e.get("message")) for e in record.get("errors") or ()],
+                               include=list(record.get("include") or ()),
+                               stamps={k: tuple(v) for k, v in (record.get("stamps") or {}).items()}, listed=dict(record.get("listed") or {}))
+            elif snapshot is not None:
+                snapshot.add(InventoryItem.create(record))
+        if snapshot is None:
+            raise ValueError("inventory data does not start with a snapshot record")
+        return snapshot
+
+    @classmethod
+    def from_jsonl(cls, filename: str, json_backend: Optional[str] = None):
+        loads = get_backend(json_backend).loads
+        with open(filename, "rb") as jsonl_file:
+            return cls.from_records(loads(line) for line in jsonl_file if line.strip())
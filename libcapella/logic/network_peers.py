@@ -4,10 +4,10 @@
 import attr
 import attrs
 from typing import List
-from libcapella.logic.common import Audit, not_none
+from libcapella.logic.common import Audit, serialize, no_audit
 
 
-@attr.s
+@attr.s(slots=True)
 class AzureConfig:
     azureTenantId = attr.ib()
     subscriptionId = attr.ib()
@@ -21,7 +21,7 @@ class AzureConfig:
         return attrs.asdict(self)
 
 
-@attr.s
+@attr.s(slots=True)
 class GCPConfig:
     networkName = attr.ib()
     cidr = attr.ib()
@@ -34,7 +34,7 @@ class GCPConfig:
         return attrs.asdict(self)
 
 
-@attr.s
+@attr.s(slots=True)
 class AWSConfig:
     accountId = attr.ib()
     vpcId = attr.ib()
@@ -47,7 +47,7 @@ class AWSConfig:
         return attrs.asdict(self)
 
 
-@attr.s
+@attr.s(slots=True)
 class ProviderConfig:
     providerId = attr.ib()
     AWSConfig = attr.ib(default=None)
@@ -55,13 +55,13 @@ class ProviderConfig:
     AzureConfig = attr.ib(default=None)
 
 
-@attr.s
+@attr.s(slots=True)
 class NetworkPeerStatus:
     state = attr.ib()
     reasoning = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class NetworkPeers:
     id: str = attr.ib()
     name: str = attr.ib()
@@ -73,44 +73,29 @@ class NetworkPeers:
 
     @classmethod
     def create(cls, data: dict, new: bool = False):
-        return cls(
-            data.get("id"),
-            data.get("name"),
-            data.get("providerType"),
-            NetworkPeerStatus(
-                data.get("status", {}).get("state"),
-                data.get("status", {}).get("reasoning"),
-            ),
-            data.get("commands", []),
-            ProviderConfig(
-                data.get("providerConfig", {}).get("providerId"),
-                AWSConfig(
-                    data.get("providerConfig").get("AWSConfig").get("accountId"),
-                    data.get("providerConfig").get("AWSConfig").get("vpcId"),
-                    data.get("providerConfig").get("AWSConfig").get("region"),
-                    data.get("providerConfig").get("AWSConfig").get("cidr"),
-                ) if data.get("providerConfig", {}).get("AWSConfig") else None,
-                GCPConfig(
-                    data.get("providerConfig").get("GCPConfig").get("networkName"),
-                    data.get("providerConfig").get("GCPConfig").get("cidr"),
-                    data.get("providerConfig").get("GCPConfig").get("projectId"),
-                    data.get("providerConfig").get("GCPConfig").get("serviceAccountId"),
-                ) if data.get("providerConfig", {}).get("GCPConfig") else None,
-                AzureConfig(
-                    data.get("providerConfig").get("AzureConfig").get("azureTenantId"),
-                    data.get("providerConfig").get("AzureConfig").get("subscriptionId"),
-                    data.get("providerConfig").get("AzureConfig").get("resourceGroup"),
-                    data.get("providerConfig").get("AzureConfig").get("vnetId"),
-                    data.get("providerConfig").get("AzureConfig").get("cidr"),
-                ) if data.get("providerConfig", {}).get("AzureConfig") else None,
-            ) if not new else data.get("providerConfig", {}),
-            Audit(
-                data.get("audit", {}).get("createdBy"),
-                data.get("audit", {}).get("createdAt"),
-                data.get("audit", {}).get("modifiedBy"),
-                data.get("audit", {}).get("modifiedAt"),
-                data.get("audit", {}).get("version")
+        get = data.get
+        status = get("status", {})
+        provider = get("providerConfig", {})
+        if new:
+            provider_config = provider
+        else:
+            aws = provider.get("AWSConfig")
+            gcp = provider.get("GCPConfig")
+            azure = provider.get("AzureConfig")
+            provider_config = ProviderConfig(
+                provider.get("providerId"),
+                AWSConfig(aws.get("accountId"), aws.get("vpcId"), aws.get("region"), aws.get("cidr")) if aws else None,
+                GCPConfig(gcp.get("networkName"), gcp.get("cidr"), gcp.get("projectId"), gcp.get("serviceAccountId")) if gcp else None,
+                AzureConfig(azure.get("azureTenantId"), azure.get("subscriptionId"), azure.get("resourceGroup"), azure.get("vnetId"), azure.get("cidr")) if azure else None,
             )
+        return cls(
+            get("id"),
+            get("name"),
+            get("providerType"),
+            NetworkPeerStatus(status.get("state"), status.get("reasoning")),
+            get("commands", []),
+            provider_config,
+            Audit.create(get("audit"))
         )
 
     @property
@@ -120,9 +105,7 @@ class NetworkPeers:
 
     @property
     def as_dict_striped(self):
-        result = not_none(self.as_dict)
-        if 'audit' in result:
-            del result['audit']
+        result = serialize(self, filter=no_audit)
         if 'status' in result and not result['status']:
             del result['status']
         if 'commands' in result and len(result['commands']) == 0:
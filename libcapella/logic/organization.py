@@ -5,12 +5,12 @@ import attr
 from libcapella.logic.common import Audit
 
 
-@attr.s
+@attr.s(slots=True)
 class Preferences:
     sessionDuration: int = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class Organization:
     id: str = attr.ib()
     name: str = attr.ib()
@@ -20,18 +20,11 @@ class Organization:
 
     @classmethod
     def create(cls, data: dict):
+        get = data.get
         return cls(
-            data.get("id"),
-            data.get("name"),
-            data.get("description"),
-            Preferences(
-                data.get("preferences").get("sessionDuration")
-            ),
-            Audit(
-                data.get("audit").get("createdBy"),
-                data.get("audit").get("createdAt"),
-                data.get("audit").get("modifiedBy"),
-                data.get("audit").get("modifiedAt"),
-                data.get("audit").get("version")
-            )
+            get("id"),
+            get("name"),
+            get("description"),
+            Preferences((get("preferences") or {}).get("sessionDuration")),
+            Audit.create(get("audit"))
         )
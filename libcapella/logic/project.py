@@ -3,10 +3,10 @@
 
 import attr
 import attrs
-from libcapella.logic.common import Audit, not_none
+from libcapella.logic.common import Audit, serialize, no_audit
 
 
-@attr.s
+@attr.s(slots=True)
 class Project:
     id: str = attr.ib()
     description: str = attr.ib()
@@ -15,17 +15,12 @@ class Project:
 
     @classmethod
     def create(cls, data: dict):
+        get = data.get
         return cls(
-            data.get("id"),
-            data.get("description"),
-            data.get("name"),
-            Audit(
-                data.get("audit", {}).get("createdBy"),
-                data.get("audit", {}).get("createdAt"),
-                data.get("audit", {}).get("modifiedBy"),
-                data.get("audit", {}).get("modifiedAt"),
-                data.get("audit", {}).get("version")
-            )
+            get("id"),
+            get("description"),
+            get("name"),
+            Audit.create(get("audit"))
         )
 
     @property
@@ -35,10 +30,7 @@ class Project:
 
     @property
     def as_dict_striped(self):
-        result = not_none(self.as_dict)
-        if 'audit' in result:
-            del result['audit']
-        return result
+        return serialize(self, filter=no_audit)
 
 
 class CapellaProjectBuilder(object):
@@ -0,0 +1,17 @@
+##
+##
+
+import attr
+from typing import Any, Optional
+
+
+@attr.s(slots=True)
+class TenantResult:
+    name: str = attr.ib()
+    result: Any = attr.ib(default=None)
+    error: Optional[Exception] = attr.ib(default=None)
+    elapsed: float = attr.ib(default=0.0)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
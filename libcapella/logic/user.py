@@ -3,18 +3,18 @@
 
 import attr
 import attrs
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterator, Iterable, Union
 from libcapella.logic.common import Audit
 
 
-@attr.s
+@attr.s(slots=True)
 class Resources:
     type: str = attr.ib()
     id: str = attr.ib()
     roles: List[str] = attr.ib()
 
 
-@attr.s
+@attr.s(slots=True)
 class User:
     id: str = attr.ib()
     name: str = attr.ib()
@@ -63,23 +63,119 @@ class User:
         )
 
 
-@attr.s
+class UserTable(object):
+    columns = ("id", "name", "email", "status", "inactive", "organizationId", "organizationRoles", "lastLogin", "region", "timeZone",
+               "enableNotifications", "expiresAt", "resources", "createdBy", "createdAt", "modifiedBy", "modifiedAt", "version")
+    shared = frozenset(("status", "inactive", "organizationId", "organizationRoles", "region", "timeZone", "enableNotifications",
+                        "expiresAt", "resources", "createdBy", "modifiedBy", "version"))
+
+    def __init__(self):
+        self._columns: Dict[str, list] = {name: [] for name in self.columns}
+        self._shared: Dict[str, dict] = {name: {} for name in self.shared}
+        self._index: Union[Dict[str, int], None] = None
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "UserTable":
+        table = cls()
+        table.extend(records)
+        return table
+
+    def append(self, data: dict):
+        get = data.get
+        audit = get("audit") or {}
+        values = dict(
+            id=get("id"),
+            name=get("name"),
+            email=get("email"),
+            status=get("status"),
+            inactive=get("inactive"),
+            organizationId=get("organizationId"),
+            organizationRoles=tuple(get("organizationRoles") or ()),
+            lastLogin=get("lastLogin"),
+            region=get("region"),
+            timeZone=get("timeZone"),
+            enableNotifications=get("enableNotifications"),
+            expiresAt=get("expiresAt"),
+            resources=tuple((r.get("type"), r.get("id"), tuple(r.get("roles") or ())) for r in get("resources") or ()),
+            createdBy=audit.get("createdBy"),
+            createdAt=audit.get("createdAt"),
+            modifiedBy=audit.get("modifiedBy"),
+            modifiedAt=audit.get("modifiedAt"),
+            version=audit.get("version")
+        )
+        shared = self._shared
+        for name, value in values.items():
+            if name in shared:
+                value = shared[name].setdefault(value, value)
+            self._columns[name].append(value)
+        if self._index is not None:
+            self._index[values["email"]] = len(self) - 1
+
+    def extend(self, records: Iterable[dict]):
+        for record in records:
+            self.append(record)
+
+    def __len__(self) -> int:
+        return len(self._columns["id"])
+
+    def __iter__(self) -> Iterator[User]:
+        for n in range(len(self)):
+            yield self[n]
+
+    def __getitem__(self, n: int) -> User:
+        c = self._columns
+        return User(
+            c["id"][n],
+            c["name"][n],
+            c["email"][n],
+            c["status"][n],
+            c["inactive"][n],
+            c["organizationId"][n],
+            list(c["organizationRoles"][n]),
+            c["lastLogin"][n],
+            c["region"][n],
+            c["timeZone"][n],
+            c["enableNotifications"][n],
+            c["expiresAt"][n],
+            [Resources(t, i, list(roles)) for t, i, roles in c["resources"][n]],
+            Audit(c["createdBy"][n], c["createdAt"][n], c["modifiedBy"][n], c["modifiedAt"][n], c["version"][n])
+        )
+
+    def column(self, name: str) -> list:
+        return self._columns[name]
+
+    def row(self, n: int) -> dict:
+        c = self._columns
+        result = {name: c[name][n] for name in self.columns[:12]}
+        result["organizationRoles"] = list(result["organizationRoles"])
+        result["resources"] = [dict(type=t, id=i, roles=list(roles)) for t, i, roles in c["resources"][n]]
+        result["audit"] = {name: c[name][n] for name in self.columns[13:]}
+        return result
+
+    def find(self, email: str) -> Union[User, None]:
+        if self._index is None:
+            self._index = {e: n for n, e in enumerate(self._columns["email"])}
+        n = self._index.get(email)
+        return self[n] if n is not None else None
+
+
+@attr.s(slots=True)
 class UserOpValue:
     id: Optional[str] = attr.ib(default=None)
     type: Optional[str] = attr.ib(default=None)
     roles: Optional[List[str]] = attr.ib(default=None)
 
 
-@attr.s
+@attr.s(slots=True)
 class UserOp:
     op: Optional[str] = attr.ib(default=None)
     path: Optional[str] = attr.ib(default=None)
     value: Optional[UserOpValue] = attr.ib(default=None)
 
 
-@attr.s
+@attr.s(slots=True)
 class ProjectOwnership:
-    user_op_list: Optional[List[UserOp]] = attr.ib(default=[])
+    user_op_list: Optional[List[UserOp]] = attr.ib(factory=list)
 
     def add(self, project_id: str):
         opo = UserOp()
@@ -90,4 +186,4 @@ class ProjectOwnership:
 
     @property
     def as_dict(self):
-        return list(attrs.asdict(o) for o in self.__dict__["user_op_list"])
+        return list(attrs.asdict(o) for o in self.user_op_list)
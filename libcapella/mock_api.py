@@ -0,0 +1,316 @@
+##
+##
+
+import json
+import time
+import uuid
+import hashlib
+import random
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from typing import Dict, List, Tuple, Union
+
+logger = logging.getLogger('libcapella.mock_api')
+logger.addHandler(logging.NullHandler())
+
+collections = ("organizations", "projects", "users", "clusters", "analyticsClusters", "allowedcidrs", "networkPeers", "appservices")
+stateful = ("clusters", "analyticsClusters", "appservices")
+
+
+class MockCapellaState(object):
+
+    def __init__(self, max_per_page: int = 100):
+        self.max_per_page = max_per_page
+        self.collections: Dict[str, OrderedDict] = {}
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def audit() -> dict:
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        return dict(createdBy="mock", createdAt=now, modifiedBy="mock", modifiedAt=now, version=1)
+
+    @staticmethod
+    def split(path: str) -> Tuple[str, Union[str, None]]:
+        parts = path.rstrip("/").split("/")
+        if parts[-1] in collections:
+            return path.rstrip("/"), None
+        return "/".join(parts[:-1]), parts[-1]
+
+    def add(self, collection: str, record: dict) -> dict:
+        record = dict(record)
+        record.setdefault("id", str(uuid.uuid4()))
+        record.setdefault("audit", self.audit())
+        name = collection.rsplit("/", 1)[-1]
+        if name in stateful:
+            record.setdefault("currentState", "healthy")
+        if name == "appservices":
+            record.setdefault("clusterId", collection.split("/")[-2])
+        if name == "users" and "/clusters/" not in collection:
+            record.setdefault("resources", [])
+        with self.lock:
+            self.collections.setdefault(collection, OrderedDict())[record["id"]] = record
+        return record
+
+    def records(self, collection: str) -> List[dict]:
+        with self.lock:
+            if collection.endswith("/appservices") and "/clusters/" not in collection:
+                return [r for c, items in self.collections.items() if c.startswith(collection.rsplit("/", 1)[0] + "/") and c.endswith("/appservices") for r in items.values()]
+            return list(self.collections.get(collection, {}).values())
+
+    def find(self, collection: str, record_id: str) -> Union[dict, None]:
+        with self.lock:
+            record = self.collections.get(collection, {}).get(record_id)
+            if record is None and collection.endswith("/appservices"):
+                record = next((r for r in self.records(collection) if r.get("id") == record_id), None)
+            return record
+
+    def update(self, collection: str, record_id: str, operations: Union[list, dict]) -> Union[dict, None]:
+        with self.lock:
+            record = self.find(collection, record_id)
+            if record is None:
+                return None
+            for operation in operations if isinstance(operations, list) else [operations]:
+                path = operation.get("path", "").strip("/").split("/")
+                if operation.get("op") == "add" and path[0] == "resources":
+                    record.setdefault("resources", []).append(operation.get("value"))
+                elif operation.get("op") == "remove" and path[0] == "resources":
+                    record["resources"] = [r for r in record.get("resources", []) if r.get("id") != path[-1]]
+                elif operation.get("op") is None:
+                    record.update(operation)
+            record["audit"]["version"] = record["audit"].get("version", 1) + 1
+            return record
+
+    def delete(self, collection: str, record_id: str) -> bool:
+        with self.lock:
+            if record_id not in self.collections.get(collection, {}):
+                return False
+            del self.collections[collection][record_id]
+            prefix = f"{collection}/{record_id}/"
+            for child in [c for c in self.collections if c.startswith(prefix)]:
+                del self.collections[child]
+            return True
+
+    def page(self, collection: str, page: int, per_page: int) -> dict:
+        records = self.records(collection)
+        per_page = max(1, min(per_page, self.max_per_page))
+        last = max(1, -(-len(records) // per_page))
+        return {
+            "data": records[(page - 1) * per_page:page * per_page],
+            "cursor": {
+                "pages": {"page": page, "last": last, "next": page + 1 if page < last else None, "perPage": per_page, "totalItems": len(records)},
+                "hrefs": {}
+            }
+        }
+
+
+class MockCapellaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "MockCapellaServer"
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, code: int, body: Union[dict, None] = None, headers: Union[dict, None] = None):
+        data = json.dumps(body).encode() if body is not None else b""
+        if self.command == "GET" and code == 200 and self.server.api.etags:
+            etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+            headers = dict(headers or {}, ETag=etag)
+            if self.headers.get("If-None-Match") == etag:
+                self.server.api.not_modified += 1
+                code, data = 304, b""
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, str(value))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def body(self) -> Union[dict, list, None]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        return json.loads(self.rfile.read(length))
+
+    def dispatch(self, method: str):
+        api = self.server.api
+        url = urlparse(self.path)
+        api.record(method, url.path)
+        if api.latency:
+            time.sleep(api.latency)
+        body = self.body()
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self.reply(401, dict(code=1001, message="Unauthorized"))
+        failure = api.failure()
+        if failure:
+            code, retry_after = failure
+            return self.reply(code, dict(code=code, message="Injected error"), {"Retry-After": retry_after} if retry_after is not None else None)
+        if not url.path.startswith("/v4/"):
+            return self.reply(404, dict(code=404, message="Not Found"))
+
+        collection, record_id = api.state.split(url.path)
+        if method == "GET" and record_id is None:
+            query = parse_qs(url.query)
+            page = int(query.get("page", ["1"])[0])
+            per_page = int(query.get("perPage", ["10"])[0])
+            return self.reply(200, api.state.page(collection, page, per_page))
+        elif method == "GET":
+            record = api.state.find(collection, record_id)
+            return self.reply(200, record) if record else self.reply(404, dict(code=404, message="Not Found"))
+        elif method == "POST" and record_id is None:
+            record = api.state.add(collection, body or {})
+            return self.reply(201, dict(id=record["id"]))
+        elif method in ("PATCH", "PUT") and record_id is not None:
+            record = api.state.update(collection, record_id, body or {})
+            return self.reply(204 if method == "PUT" else 200, None if method == "PUT" else record) if record else self.reply(404, dict(code=404, message="Not Found"))
+        elif method == "DELETE" and record_id is not None:
+            return self.reply(202) if api.state.delete(collection, record_id) else self.reply(404, dict(code=404, message="Not Found"))
+        return self.reply(405, dict(code=405, message="Method Not Allowed"))
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PATCH(self):
+        self.dispatch("PATCH")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+
+
+class MockCapellaServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], api: "MockCapellaAPI"):
+        self.api = api
+        super().__init__(address, MockCapellaHandler)
+
+
+class MockCapellaAPI(object):
+
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: float = 0.0,
+                 error_rate: float = 0.0,
+                 error_code: int = 500,
+                 max_per_page: int = 100,
+                 seed: Union[int, None] = None,
+                 etags: bool = True):
+        self.host = host
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.etags = etags
+        self.not_modified = 0
+        self.state = MockCapellaState(max_per_page=max_per_page)
+        self.requests: Dict[str, int] = {}
+        self._failures: List[Tuple[int, Union[float, None]]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = MockCapellaServer((host, port), self)
+        self._thread: Union[threading.Thread, None] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def request_count(self) -> int:
+        return sum(self.requests.values())
+
+    def record(self, method: str, path: str):
+        with self._lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+
+    def reset_counts(self):
+        with self._lock:
+            self.requests.clear()
+            self.not_modified = 0
+
+    def fail_next(self, count: int = 1, code: int = 429, retry_after: Union[float, None] = None):
+        with self._lock:
+            self._failures.extend([(code, retry_after)] * count)
+
+    def failure(self) -> Union[Tuple[int, Union[float, None]], None]:
+        with self._lock:
+            if self._failures:
+                return self._failures.pop(0)
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_code, None
+        return None
+
+    def start(self) -> "MockCapellaAPI":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="mock-capella-api", daemon=True)
+            self._thread.start()
+            logger.debug(f"mock Capella API listening on {self.url}")
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def populate(self,
+                 organization: str = "mock-org",
+                 email: str = "mock.user@example.com",
+                 projects: int = 1,
+                 databases: int = 1,
+                 columnar: int = 0,
+                 users: int = 1,
+                 allowed_cidrs: int = 0,
+                 credentials: int = 0,
+                 network_peers: int = 0,
+                 app_services: bool = False) -> dict:
+        org = self.state.add("/v4/organizations", dict(name=organization, description="Mock organization", preferences=dict(sessionDuration=7200)))
+        org_endpoint = f"/v4/organizations/{org['id']}"
+        owner = self.state.add(f"{org_endpoint}/users", dict(name="Mock User", email=email, status="verified", organizationRoles=["organizationOwner"]))
+        for n in range(1, users):
+            self.state.add(f"{org_endpoint}/users", dict(name=f"User {n}", email=f"user{n}@example.com", status="verified", organizationRoles=["organizationMember"]))
+        for p in range(projects):
+            project = self.state.add(f"{org_endpoint}/projects", dict(name=f"project-{p}" if p else "default", description="Mock project"))
+            owner["resources"].append(dict(type="project", id=project["id"], roles=["projectOwner"]))
+            project_endpoint = f"{org_endpoint}/projects/{project['id']}"
+            for d in range(databases):
+                database = self.state.add(f"{project_endpoint}/clusters", dict(name=f"database-{d}", description="Mock database", cloudProvider=dict(type="aws", region="us-east-1", cidr=f"10.{d % 256}.0.0/23")))
+                database_endpoint = f"{project_endpoint}/clusters/{database['id']}"
+                for c in range(allowed_cidrs):
+                    self.state.add(f"{database_endpoint}/allowedcidrs", dict(cidr=f"10.{c // 128 % 256}.{c % 128 * 2}.0/24", comment="Mock allowed CIDR"))
+                for c in range(credentials):
+                    self.state.add(f"{database_endpoint}/users", dict(name=f"user-{c}", access=[dict(privileges=["data_reader"])]))
+                for c in range(network_peers):
+                    self.state.add(f"{database_endpoint}/networkPeers", dict(name=f"peer-{c}", providerType="aws", status=dict(state="complete"), commands=[],
+                                                                             providerConfig=dict(providerId=f"pcx-{c}", AWSConfig=dict(accountId="123456789012", vpcId=f"vpc-{c}", region="us-east-1", cidr=f"172.16.{c % 256}.0/24"))))
+                if app_services:
+                    self.state.add(f"{database_endpoint}/appservices", dict(name=f"appservice-{d}", nodes=2))
+            for c in range(columnar):
+                self.state.add(f"{project_endpoint}/analyticsClusters", dict(name=f"columnar-{c}", description="Mock columnar", cloudProvider="aws", region="us-east-1"))
+        return dict(organization_id=org["id"], account_email=email, account_id=owner["id"])
+
+    def config(self, token: str = "mock-token", **kwargs) -> dict:
+        result = dict(api_host=self.host, api_port=self.port, use_ssl=False, token=token)
+        result.update(kwargs)
+        return result
@@ -0,0 +1,194 @@
+##
+##
+
+import os
+import bisect
+import logging
+import ipaddress
+from typing import Iterator, List, Set, Tuple, Union
+from libcapella.codec import get_backend
+
+logger = logging.getLogger('libcapella.network_allocator')
+logger.addHandler(logging.NullHandler())
+
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+Block = Tuple[int, int]
+
+
+class NetworkAllocator(object):
+
+    def __init__(self, supernet: str = "10.0.0.0/8"):
+        self.supernet: Network = ipaddress.ip_network(supernet)
+        self.version = self.supernet.version
+        self.bits = self.supernet.max_prefixlen
+        self.base = int(self.supernet.network_address)
+        self.prefix = self.supernet.prefixlen
+        self._free: List[List[int]] = [[] for _ in range(self.bits + 1)]
+        self._reserved: Set[Block] = set()
+        self._starts: List[Block] = []
+        self._free[self.prefix].append(self.base)
+
+    def size(self, prefix: int) -> int:
+        return 1 << (self.bits - prefix)
+
+    def block(self, cidr: Union[str, Network]) -> Block:
+        network = ipaddress.ip_network(cidr) if isinstance(cidr, str) else cidr
+        if network.version != self.version:
+            raise ValueError(f"{network} is not an IPv{self.version} network")
+        return int(network.network_address), network.prefixlen
+
+    def network(self, block: Block) -> Network:
+        return type(self.supernet)((block[0], block[1]))
+
+    def _is_free(self, start: int, prefix: int) -> bool:
+        free = self._free[prefix]
+        n = bisect.bisect_left(free, start)
+        return n < len(free) and free[n] == start
+
+    def _take(self, start: int, prefix: int):
+        free = self._free[prefix]
+        del free[bisect.bisect_left(free, start)]
+
+    def _put(self, start: int, prefix: int):
+        while prefix > self.prefix:
+            buddy = start ^ self.size(prefix)
+            if not self._is_free(buddy, prefix):
+                break
+            self._take(buddy, prefix)
+            start = min(start, buddy)
+            prefix -= 1
+        bisect.insort(self._free[prefix], start)
+
+    def _split(self, start: int, prefix: int, target: int, target_prefix: int):
+        self._take(start, prefix)
+        while prefix < target_prefix:
+            prefix += 1
+            half = self.size(prefix)
+            if target >= start + half:
+                bisect.insort(self._free[prefix], start)
+                start += half
+            else:
+                bisect.insort(self._free[prefix], start + half)
+
+    def _carve(self, start: int, prefix: int):
+        for level in range(self.prefix, prefix + 1):
+            ancestor = start & ~(self.size(level) - 1)
+            if self._is_free(ancestor, level):
+                self._split(ancestor, level, start, prefix)
+                return
+        end = start + self.size(prefix)
+        for level in range(prefix + 1, self.bits + 1):
+            free = self._free[level]
+            del free[bisect.bisect_left(free, start):bisect.bisect_left(free, end)]
+
+    def _clip(self, start: int, prefix: int) -> Union[Block, None]:
+        if prefix <= self.prefix:
+            return (self.base, self.prefix) if start == self.base & ~(self.size(prefix) - 1) else None
+        if start & ~(self.size(self.prefix) - 1) != self.base:
+            return None
+        return start, prefix
+
+    def _contained(self, start: int, prefix: int) -> bool:
+        for level in range(prefix - 1, -1, -1):
+            if (start & ~(self.size(level) - 1), level) in self._reserved:
+                return True
+        return False
+
+    def reserve(self, cidr: Union[str, Network]) -> bool:
+        start, prefix = self.block(cidr)
+        if (start, prefix) in self._reserved:
+            return False
+        self._reserved.add((start, prefix))
+        bisect.insort(self._starts, (start, prefix))
+        clipped = self._clip(start, prefix)
+        if clipped is not None:
+            self._carve(*clipped)
+        return True
+
+    def allocate(self, prefix: int = 16) -> Union[str, None]:
+        if not self.prefix <= prefix <= self.bits:
+            raise ValueError(f"prefix /{prefix} does not fit in {self.supernet}")
+        best = None
+        for level in range(self.prefix, prefix + 1):
+            free = self._free[level]
+            if free and (best is None or free[0] < best[0]):
+                best = (free[0], level)
+        if best is None:
+            return None
+        self._split(best[0], best[1], best[0], prefix)
+        self._reserved.add((best[0], prefix))
+        bisect.insort(self._starts, (best[0], prefix))
+        return self.network((best[0], prefix)).exploded
+
+    def release(self, cidr: Union[str, Network]) -> bool:
+        start, prefix = self.block(cidr)
+        if (start, prefix) not in self._reserved:
+            return False
+        self._reserved.discard((start, prefix))
+        del self._starts[bisect.bisect_left(self._starts, (start, prefix))]
+        clipped = self._clip(start, prefix)
+        if clipped is None or self._contained(start, prefix):
+            return True
+        start, prefix = clipped
+        end = start + self.size(prefix)
+        position = start
+        n = bisect.bisect_left(self._starts, (start, 0))
+        while n < len(self._starts) and self._starts[n][0] < end:
+            child_start, child_prefix = self._starts[n]
+            child_end = child_start + self.size(child_prefix)
+            if child_start >= position:
+                self._free_range(position, child_start)
+                position = child_end
+            n += 1
+        self._free_range(position, end)
+        return True
+
+    def _free_range(self, start: int, end: int):
+        while start < end:
+            prefix = self.bits - min((start & -start).bit_length() - 1 if start else self.bits, (end - start).bit_length() - 1)
+            prefix = max(prefix, self.prefix)
+            self._put(start, prefix)
+            start += self.size(prefix)
+
+    def is_free(self, cidr: Union[str, Network]) -> bool:
+        start, prefix = self.block(cidr)
+        if self._clip(start, prefix) != (start, prefix):
+            return False
+        for level in range(self.prefix, prefix + 1):
+            if self._is_free(start & ~(self.size(level) - 1), level):
+                return True
+        return False
+
+    def free_blocks(self) -> Iterator[str]:
+        blocks = sorted((start, prefix) for prefix, free in enumerate(self._free) for start in free)
+        for block in blocks:
+            yield self.network(block).exploded
+
+    @property
+    def reserved(self) -> List[str]:
+        return [self.network(block).exploded for block in self._starts]
+
+    @property
+    def available(self) -> int:
+        return sum(len(free) * self.size(prefix) for prefix, free in enumerate(self._free))
+
+    def as_dict(self) -> dict:
+        return dict(supernet=self.supernet.exploded, reserved=self.reserved)
+
+    @classmethod
+    def create(cls, data: dict) -> "NetworkAllocator":
+        allocator = cls(data.get("supernet", "10.0.0.0/8"))
+        for cidr in data.get("reserved") or ():
+            allocator.reserve(cidr)
+        return allocator
+
+    def save(self, filename: str, json_backend: Union[str, None] = None):
+        temp_file = f"{filename}.tmp"
+        with open(temp_file, "wb") as state_file:
+            state_file.write(get_backend(json_backend).dumps(self.as_dict()))
+        os.replace(temp_file, filename)
+
+    @classmethod
+    def load(cls, filename: str, json_backend: Union[str, None] = None) -> "NetworkAllocator":
+        with open(filename, "rb") as state_file:
+            return cls.create(get_backend(json_backend).loads(state_file.read()))
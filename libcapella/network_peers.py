@@ -3,10 +3,12 @@
 
 import re
 import logging
-from typing import List, Union
+from typing import List, Union, Iterator
 from restfull.restapi import NotFoundError
 from libcapella.logic.network_peers import NetworkPeers
 from libcapella.database import CapellaDatabase
+from libcapella.paging import CapellaPager
+from libcapella.cache import resolution_cache
 
 logger = logging.getLogger('libcapella.network_peers')
 logger.addHandler(logging.NullHandler())
@@ -17,6 +19,7 @@ class CapellaNetworkPeers(object):
     def __init__(self, database: CapellaDatabase, name: str = "NetworkPeer"):
         self._endpoint = f"{database.endpoint}/{database.id}/networkPeers"
         self.rest = database.rest
+        self.api_host = database.api_host
         self.name = name
         self.network_peer = self.get_by_name(self.name)
 
@@ -62,15 +65,13 @@ class CapellaNetworkPeers(object):
         self.network_peer = self.get(self.network_peer.id)
 
     def list(self) -> List[NetworkPeers]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().json_list()
-        logger.debug(f"network peer list: found {result.size}")
-        return [NetworkPeers.create(a) for a in result.as_list]
+        result = CapellaPager(self.rest, self._endpoint, per_page=100).fetch_all()
+        logger.debug(f"network peer list: found {len(result)}")
+        return [NetworkPeers.create(a) for a in result]
+
+    def iter_network_peers(self, prefetch: bool = False) -> Iterator[NetworkPeers]:
+        for record in CapellaPager(self.rest, self._endpoint, per_page=100, prefetch=prefetch).records():
+            yield NetworkPeers.create(record)
 
     def get(self, peer_id: str) -> Union[NetworkPeers, None]:
         endpoint = f"{self._endpoint}/{peer_id}"
@@ -78,26 +79,31 @@ class CapellaNetworkPeers(object):
             result = self.rest.get(endpoint).validate().as_json().json_object()
             return NetworkPeers.create(result.as_dict)
         except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, peer_id)
             return None
 
     def get_by_name(self, name: str) -> Union[NetworkPeers, None]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().filter("name", name).list_item(0)
+        key = resolution_cache.key(self.api_host, self._endpoint, name)
+        network_peer_id = resolution_cache.get(key)
+        if network_peer_id is not None:
+            network_peer = self.get(network_peer_id)
+            if network_peer is not None and network_peer.name == name:
+                return network_peer
+            resolution_cache.invalidate(key)
+        result = CapellaPager(self.rest, self._endpoint, per_page=100).find("name", name)
         if not result:
             return None
+        resolution_cache.put(key, self._endpoint, result.get("id"))
         return NetworkPeers.create(result)
 
     def create(self, network_peer: NetworkPeers):
         network_peer_id = self.rest.post(self._endpoint, network_peer.as_dict_striped).validate().as_json().json_key("id")
         network_peer.id = network_peer_id
+        resolution_cache.invalidate(resolution_cache.key(self.api_host, self._endpoint, network_peer.name))
         self.network_peer = network_peer
 
     def delete(self):
         if self.network_peer.id:
             endpoint = f"{self._endpoint}/{self.network_peer.id}"
             self.rest.delete(endpoint)
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, self.network_peer.id)
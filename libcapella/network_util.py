@@ -6,6 +6,7 @@ import ipaddress
 from ipaddress import IPv4Network
 from typing import Union
 from libcapella.random import FastRandom
+from libcapella.network_allocator import NetworkAllocator
 
 
 class NetworkDriver(object):
@@ -14,6 +15,8 @@ class NetworkDriver(object):
         self.ip_space = []
         self.active_network: IPv4Network = ipaddress.ip_network("10.1.0.0/16")
         self.super_net: IPv4Network = ipaddress.ip_network("10.0.0.0/8")
+        self._allocator = None
+        self._synced = 0
 
     def set_active_network(self, cidr: str):
         self.active_network: IPv4Network = ipaddress.ip_network(cidr)
@@ -26,26 +29,23 @@ class NetworkDriver(object):
         for subnet in self.active_network.subnets(new_prefix=prefix):
             yield subnet.exploded
 
-    def get_next_network(self) -> Union[str, None]:
-        candidates = list(self.super_net.subnets(new_prefix=16))
-
-        for network in self.ip_space:
-            available = []
-            for n, candidate in enumerate(candidates):
-                try:
-                    if network.prefixlen < 16:
-                        list(network.address_exclude(candidate))
-                    else:
-                        list(candidate.address_exclude(network))
-                except ValueError:
-                    available.append(candidate)
-            candidates = available
-
-        if len(candidates) == 0:
+    @property
+    def allocator(self) -> NetworkAllocator:
+        if self._allocator is None or self._allocator.supernet != self.super_net:
+            self._allocator = NetworkAllocator(self.super_net.exploded)
+            self._synced = 0
+        for network in self.ip_space[self._synced:]:
+            self._allocator.reserve(network)
+        self._synced = len(self.ip_space)
+        return self._allocator
+
+    def get_next_network(self, prefix: int = 16) -> Union[str, None]:
+        cidr = self.allocator.allocate(prefix)
+        if cidr is None:
             return None
-
-        self.active_network = candidates[0]
+        self.active_network = ipaddress.ip_network(cidr)
         self.ip_space.append(self.active_network)
+        self._synced += 1
         return self.active_network.exploded
 
     @staticmethod
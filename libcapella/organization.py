@@ -2,8 +2,10 @@
 ##
 
 import logging
-from typing import List
+from typing import List, Iterator, Union
+from restfull.restapi import NotFoundError
 from libcapella.base import CouchbaseCapella
+from libcapella.cache import resolution_cache
 from libcapella.exceptions import CapellaNotFoundError
 from libcapella.logic.organization import Organization
 
@@ -16,15 +18,39 @@ class CapellaOrganization(CouchbaseCapella):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._endpoint = "/v4/organizations"
-        if self.config.organization_name is not None:
+        self._organization = None
+        self._organization_id = self.config.organization_id if self.config.lazy else None
+        if not self.config.lazy:
+            self.resolve()
+
+    def resolve(self):
+        if self._organization_id is not None:
+            logger.debug(f"resolving organization id {self._organization_id}")
+            self._organization = self.get(self._organization_id)
+        elif self.config.organization_name is not None:
             logger.debug(f"using organization name {self.config.organization_name}")
-            self.organization = self.get_by_name(self.config.organization_name)
+            self._organization = self.get_by_name(self.config.organization_name)
         elif self.config.organization_id is not None:
             logger.debug(f"using organization id {self.config.organization_id}")
-            self.organization = self.get(self.config.organization_id)
+            self._organization = self.get(self.config.organization_id)
         else:
             logger.debug("locating the default organization")
-            self.organization = self.get_default()
+            self._organization = self.get_default()
+        return self
+
+    @property
+    def resolved(self) -> bool:
+        return self._organization is not None
+
+    @property
+    def organization(self) -> Organization:
+        if self._organization is None:
+            self.resolve()
+        return self._organization
+
+    @organization.setter
+    def organization(self, organization: Organization):
+        self._organization = organization
 
     @property
     def endpoint(self):
@@ -36,6 +62,8 @@ class CapellaOrganization(CouchbaseCapella):
 
     @property
     def id(self):
+        if self._organization is None and self._organization_id is not None:
+            return self._organization_id
         if not self.organization:
             return None
         return self.organization.id
@@ -45,21 +73,49 @@ class CapellaOrganization(CouchbaseCapella):
         logger.debug(f"organization list: found {result.size}")
         return [Organization.create(r) for r in result.as_list]
 
+    def iter_organizations(self) -> Iterator[Organization]:
+        for record in self.rest.get(self._endpoint).validate().as_json("data").json_list().as_list:
+            yield Organization.create(record)
+
     def get(self, org_id: str) -> Organization:
         endpoint = self._endpoint + f"/{org_id}"
-        result = self.rest.get(endpoint).validate().as_json().json_object()
+        try:
+            result = self.rest.get(endpoint).validate().as_json().json_object()
+        except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, org_id)
+            raise
         logger.debug(f"organization get:\n{result.formatted}")
         return Organization.create(result.as_dict)
 
+    def get_cached(self, key) -> Union[Organization, None]:
+        org_id = resolution_cache.get(key)
+        if org_id is None:
+            return None
+        try:
+            return self.get(org_id)
+        except NotFoundError:
+            resolution_cache.invalidate(key)
+            return None
+
     def get_by_name(self, name: str) -> Organization:
-        result = self.list()
-        for org in result:
-            if org.name == name:
-                return org
-        raise CapellaNotFoundError(f"Organization {name} not found")
+        key = resolution_cache.key(self.api_host, self._endpoint, name, field=f"name:{self.tenant}")
+        organization = self.get_cached(key)
+        if organization is not None and organization.name == name:
+            return organization
+        record = self.rest.get(self._endpoint).validate().as_json("data").filter("name", name).list_item(0)
+        if not record:
+            resolution_cache.invalidate(key)
+            raise CapellaNotFoundError(f"Organization {name} not found")
+        resolution_cache.put(key, self._endpoint, record.get("id"))
+        return Organization.create(record)
 
     def get_default(self) -> Organization:
-        result = self.list()
-        if not len(result) >= 1:
+        key = resolution_cache.key(self.api_host, self._endpoint, None, field=f"default:{self.tenant}")
+        organization = self.get_cached(key)
+        if organization is not None:
+            return organization
+        record = self.rest.get(self._endpoint).validate().as_json("data").list_item(0)
+        if not record:
             raise RuntimeError("No organizations found")
-        return result[0]
+        resolution_cache.put(key, self._endpoint, record.get("id"))
+        return Organization.create(record)
@@ -0,0 +1,100 @@
+##
+##
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Union
+from restfull.restapi import RestAPI
+from libcapella.base import clone_rest
+
+logger = logging.getLogger('libcapella.paging')
+logger.addHandler(logging.NullHandler())
+
+
+class CapellaPager(object):
+
+    def __init__(self, rest: RestAPI, endpoint: str, per_page: int = 50, params: Union[dict, None] = None, prefetch: bool = False):
+        self.rest = rest
+        self.endpoint = endpoint
+        self.per_page = per_page
+        self.params = params if params else {}
+        self.prefetch = prefetch
+        self.total_items = None
+        self.total_pages = None
+        self.pages_fetched = 0
+        self._lock = threading.Lock()
+
+    def page_endpoint(self, page: int) -> str:
+        endpoint = self.rest.paged_endpoint(self.endpoint, "page", page, "perPage", self.per_page)
+        for key, value in self.params.items():
+            endpoint += f"&{key}={value}"
+        return endpoint
+
+    def fetch(self, page: int, rest: Union[RestAPI, None] = None) -> List[dict]:
+        rest = rest if rest else self.rest
+        total, pages, data = rest.get(self.page_endpoint(page)).validate().as_json().page_count("totalItems", "last", "data", "cursor", "pages")
+        with self._lock:
+            self.pages_fetched += 1
+            self.total_items = total
+            self.total_pages = pages if pages else 1
+        logger.debug(f"{self.endpoint}: page {page} of {self.total_pages}")
+        return data if data else []
+
+    def pages(self) -> Iterator[List[dict]]:
+        if self.prefetch:
+            yield from self._prefetch_pages()
+            return
+        page = 1
+        while True:
+            yield self.fetch(page)
+            if page >= self.total_pages:
+                break
+            page += 1
+
+    def _prefetch_pages(self) -> Iterator[List[dict]]:
+        rest = clone_rest(self.rest)
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            data = self.fetch(1)
+            page = 1
+            while True:
+                future = executor.submit(self.fetch, page + 1, rest) if page < self.total_pages else None
+                yield data
+                if future is None:
+                    break
+                data = future.result()
+                page += 1
+        finally:
+            executor.shutdown(wait=False)
+
+    def fetch_all(self, workers: int = 8) -> List[dict]:
+        result = list(self.fetch(1))
+        last = self.total_pages
+        if last <= 1:
+            return result
+        if workers <= 1:
+            for page in range(2, last + 1):
+                result.extend(self.fetch(page))
+            return result
+        local = threading.local()
+
+        def fetch(page: int) -> List[dict]:
+            if not hasattr(local, "rest"):
+                local.rest = clone_rest(self.rest)
+            return self.fetch(page, local.rest)
+
+        with ThreadPoolExecutor(max_workers=min(workers, last - 1)) as executor:
+            for data in executor.map(fetch, range(2, last + 1)):
+                result.extend(data)
+        logger.debug(f"{self.endpoint}: fetched {len(result)} items from {last} pages with {min(workers, last - 1)} workers")
+        return result
+
+    def records(self) -> Iterator[dict]:
+        for data in self.pages():
+            yield from data
+
+    def find(self, key: str, value: str) -> Union[dict, None]:
+        result = next((r for r in self.records() if r.get(key) == value), None)
+        logger.debug(f"{self.endpoint}: lookup {key}={value} fetched {self.pages_fetched} of {self.total_pages} pages")
+        return result
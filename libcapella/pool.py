@@ -0,0 +1,212 @@
+##
+##
+
+import logging
+import threading
+import requests
+from typing import Dict, Tuple, Union
+from requests.adapters import HTTPAdapter, Retry
+from libcapella.rate_limit import RateLimiter
+from libcapella.response_cache import ResponseCache, CacheKey
+
+logger = logging.getLogger('libcapella.pool')
+logger.addHandler(logging.NullHandler())
+
+PoolKey = Tuple[str, str, Union[CacheKey, None]]
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+
+    def __init__(self,
+                 max_connections: int = 32,
+                 limiter: Union[RateLimiter, None] = None,
+                 cache: Union[ResponseCache, None] = None,
+                 cache_scope: str = "",
+                 **kwargs):
+        self.max_connections = max_connections
+        self.limiter = limiter
+        self.cache = cache
+        self.cache_scope = cache_scope
+        self.active = 0
+        self._active_lock = threading.Lock()
+        kwargs.setdefault("max_retries", Retry(total=10, backoff_factor=0.01, respect_retry_after_header=limiter is None))
+        super().__init__(pool_connections=max_connections, pool_maxsize=max_connections, **kwargs)
+
+    def resize(self, max_connections: int):
+        if max_connections <= self.max_connections:
+            return
+        previous = self.poolmanager
+        self.max_connections = max_connections
+        self.init_poolmanager(max_connections, max_connections, block=self._pool_block)
+        previous.clear()
+        if self.limiter is not None:
+            self.limiter.concurrency.grow(max_connections)
+
+    def _send(self, request, **kwargs):
+        with self._active_lock:
+            self.active += 1
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            with self._active_lock:
+                self.active -= 1
+
+    def send(self, request, **kwargs):
+        cache = self.cache
+        if cache is None:
+            return self._limited_send(request, **kwargs)
+        if request.method != "GET":
+            response = self._limited_send(request, **kwargs)
+            if response.status_code < 400:
+                cache.invalidate(self.cache_scope, request.url)
+            return response
+        entry = cache.get(self.cache_scope, request.url)
+        if entry is not None:
+            if entry.fresh(cache.max_age) and "no-cache" not in request.headers.get("Cache-Control", ""):
+                cache.hits += 1
+                return entry.response(request)
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+        response = self._limited_send(request, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"GET {request.url} not modified")
+            cache.revalidated += 1
+            cache.touch(self.cache_scope, request.url)
+            response.close()
+            return entry.response(request)
+        if response.status_code == 200:
+            cache.put(self.cache_scope, request.url, response)
+        return response
+
+    def _limited_send(self, request, **kwargs):
+        if self.limiter is None:
+            return self._send(request, **kwargs)
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            try:
+                response = self._send(request, **kwargs)
+            finally:
+                self.limiter.release()
+            wait = self.limiter.record(response.status_code, response.headers.get("Retry-After"), attempt)
+            if response.status_code != 429 or attempt >= self.limiter.retry_count:
+                return response
+            logger.debug(f"{request.method} {request.url} rate limited, retrying after {wait:.2f} seconds")
+            response.close()
+            attempt += 1
+
+    @property
+    def stats(self) -> dict:
+        idle = 0
+        connections = 0
+        requests_sent = 0
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            idle += sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+            connections += pool.num_connections
+            requests_sent += pool.num_requests
+        return dict(active=self.active,
+                    idle=idle,
+                    connections=connections,
+                    requests=requests_sent,
+                    reused=max(0, requests_sent - connections))
+
+
+class SessionPool(object):
+
+    def __init__(self):
+        self._sessions: Dict[PoolKey, requests.Session] = {}
+        self._limiters: Dict[Tuple[str, str], RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(api_host: str, token: Union[str, None], cache: Union[ResponseCache, None] = None) -> PoolKey:
+        return api_host, token or "", cache.key if cache is not None else None
+
+    def session(self,
+                api_host: str,
+                token: Union[str, None],
+                max_connections: int = 32,
+                rate_limit: float = 0.0,
+                rate_burst: float = 10.0,
+                cache: Union[ResponseCache, None] = None) -> requests.Session:
+        key = self.key(api_host, token, cache)
+        with self._lock:
+            limiter = self._limiters.get(key[:2])
+            if limiter is None:
+                limiter = RateLimiter(rate=rate_limit, burst=rate_burst, concurrency=max_connections, max_concurrency=max_connections)
+                self._limiters[key[:2]] = limiter
+            else:
+                if (rate_limit, rate_burst) != (limiter.bucket.rate, limiter.bucket.capacity):
+                    logger.warning(f"session pool for {api_host}: ignoring rate_limit {rate_limit} burst {rate_burst}, "
+                                   f"the token already uses rate_limit {limiter.bucket.rate} burst {limiter.bucket.capacity}")
+                if max_connections > limiter.concurrency.maximum:
+                    logger.warning(f"session pool for {api_host}: raising pool size from {limiter.concurrency.maximum} to {max_connections} connections")
+                    limiter.concurrency.grow(max_connections)
+            max_connections = max(max_connections, limiter.concurrency.maximum)
+            session = self._sessions.get(key)
+            if session is None:
+                logger.debug(f"creating session pool for {api_host} with {max_connections} connections")
+                session = requests.Session()
+                adapter = PooledHTTPAdapter(max_connections=max_connections, limiter=limiter, cache=cache, cache_scope=ResponseCache.scope(api_host, token))
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[key] = session
+            else:
+                adapter = self.adapter(session)
+                if adapter is not None:
+                    adapter.resize(max_connections)
+            return session
+
+    @staticmethod
+    def adapter(session: requests.Session) -> Union[PooledHTTPAdapter, None]:
+        adapter = session.get_adapter('https://')
+        return adapter if isinstance(adapter, PooledHTTPAdapter) else None
+
+    def stats(self, api_host: Union[str, None] = None, token: Union[str, None] = None) -> Dict[str, dict]:
+        with self._lock:
+            sessions = list(self._sessions.items())
+        result = {}
+        limiters = set()
+        for (host, session_token, _), session in sessions:
+            if api_host is not None and host != api_host:
+                continue
+            if token is not None and session_token != token:
+                continue
+            adapter = self.adapter(session)
+            if adapter is not None:
+                stats = result.setdefault(host, dict(active=0, idle=0, connections=0, requests=0, reused=0, throttled=0))
+                for name, value in adapter.stats.items():
+                    stats[name] += value
+                if adapter.limiter is not None and id(adapter.limiter) not in limiters:
+                    limiters.add(id(adapter.limiter))
+                    stats["throttled"] += adapter.limiter.throttled
+        return result
+
+    def discard(self, api_host: str, token: Union[str, None]):
+        scope = self.key(api_host, token)[:2]
+        with self._lock:
+            sessions = [self._sessions.pop(key) for key in [k for k in self._sessions if k[:2] == scope]]
+            self._limiters.pop(scope, None)
+        for session in sessions:
+            session.close()
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._limiters.clear()
+        for session in sessions:
+            session.close()
+
+    @property
+    def size(self) -> int:
+        return len(self._sessions)
+
+
+session_pool = SessionPool()
@@ -2,10 +2,12 @@
 ##
 
 import logging
-from typing import List, Union
+from typing import List, Union, Dict, Iterator
 from restfull.restapi import NotFoundError
 from libcapella.exceptions import CapellaNotFoundError
 from libcapella.organization import CapellaOrganization
+from libcapella.cache import resolution_cache
+from libcapella.paging import CapellaPager
 from libcapella.logic.project import Project
 from libcapella.logic.project import CapellaProjectBuilder
 from libcapella.user import CapellaUser
@@ -16,27 +18,60 @@ logger.addHandler(logging.NullHandler())
 
 class CapellaProject(object):
 
-    def __init__(self, org: CapellaOrganization, project: str = None, email: str = None):
+    def __init__(self, org: CapellaOrganization, project: str = None, email: str = None, project_id: str = None):
         self._endpoint = f"{org.endpoint}/{org.id}/projects"
         self.rest = org.rest
-        self.user = CapellaUser(org, email)
+        self.api_host = org.api_host
         self.org = org
+        self.email = email
         self.project_name = project if project else org.config.project_name if org.config.project_name is not None else "default"
-        self.project = None
+        self._project_arg = project
+        self._project_id = project_id if project_id else org.config.project_id if org.config.lazy and project is None else None
+        self._project = None
+        self._user = None
+        if not org.config.lazy and project_id is None:
+            self._user = CapellaUser(org, email)
+            self.resolve()
+
+    def resolve(self):
+        self._project = None
         try:
-            if project is not None:
-                self.project = self.get_by_name(project)
-            elif org.config.project_name is not None:
-                self.project = self.get_by_name(org.config.project_name)
-            elif org.config.project_id is not None:
-                self.project = self.get(org.config.project_id)
+            if self._project_id is not None:
+                self._project = self.get(self._project_id)
+            elif self._project_arg is not None:
+                self._project = self.get_by_name(self._project_arg)
+            elif self.org.config.project_name is not None:
+                self._project = self.get_by_name(self.org.config.project_name)
+            elif self.org.config.project_id is not None:
+                self._project = self.get(self.org.config.project_id)
         except CapellaNotFoundError:
             pass
 
-        if not self.project:
+        if not self._project:
             builder = CapellaProjectBuilder()
             builder = builder.name(self.project_name)
-            self.project = builder.build()
+            self._project = builder.build()
+        return self
+
+    @property
+    def resolved(self) -> bool:
+        return self._project is not None
+
+    @property
+    def user(self) -> CapellaUser:
+        if self._user is None:
+            self._user = CapellaUser(self.org, self.email)
+        return self._user
+
+    @property
+    def project(self) -> Project:
+        if self._project is None:
+            self.resolve()
+        return self._project
+
+    @project.setter
+    def project(self, project: Project):
+        self._project = project
 
     @property
     def endpoint(self):
@@ -44,42 +79,60 @@ class CapellaProject(object):
 
     @property
     def id(self):
+        if self._project is None and self._project_id is not None:
+            return self._project_id
         if not self.project:
             return None
         return self.project.id
 
     def list(self) -> List[Project]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=50,
-                                     cursor="cursor",
-                                     category="pages").validate().json_list()
-        logger.debug(f"project list: found {result.size}")
-        return [Project.create(r) for r in result.as_list]
+        result = CapellaPager(self.rest, self._endpoint, per_page=50).fetch_all()
+        logger.debug(f"project list: found {len(result)}")
+        return [Project.create(r) for r in result]
+
+    def iter_projects(self, prefetch: bool = False) -> Iterator[Project]:
+        for record in CapellaPager(self.rest, self._endpoint, per_page=50, prefetch=prefetch).records():
+            yield Project.create(record)
 
     def owned_by_user(self, project_id: str) -> bool:
-        user_projects = self.user.projects_by_owner()
-        return project_id in user_projects
+        return self.user.owns_project(project_id)
+
+    def owned_projects(self) -> Dict[str, List[Project]]:
+        result: Dict[str, List[Project]] = {}
+        if not self.user.owned_projects:
+            return result
+        for record in CapellaPager(self.rest, self._endpoint, per_page=50).records():
+            if self.user.owns_project(record.get("id")):
+                result.setdefault(record.get("name"), []).append(Project.create(record))
+        return result
 
     def get(self, project_id: str) -> Union[Project, None]:
         endpoint = self._endpoint + f"/{project_id}"
         try:
-            result = self.rest.get(endpoint).validate().as_json().json_object()
-            return Project.create(result.as_dict)
+            record = self.rest.get(endpoint).validate().as_json().json_object().as_dict
         except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, project_id)
             return None
+        return Project.create(record)
 
     def get_by_name(self, name: str) -> Project:
-        result = self.list()
-        for p in result:
-            if p.name == name and self.owned_by_user(p.id):
-                return p
+        key = resolution_cache.key(self.api_host, self._endpoint, name, field=f"owner={self.user.id}")
+        project_id = resolution_cache.get(key)
+        if project_id is not None:
+            project = self.get(project_id)
+            if project is not None and project.name == name:
+                return project
+            resolution_cache.invalidate(key)
+        if self.user.owned_projects:
+            for record in CapellaPager(self.rest, self._endpoint, per_page=50).records():
+                if record.get("name") == name and self.user.owns_project(record.get("id")):
+                    resolution_cache.put(key, self._endpoint, record.get("id"))
+                    return Project.create(record)
         raise CapellaNotFoundError(f"Project {name} not found")
 
     def create(self, project: Project):
         project_id = self.rest.post(self._endpoint, project.as_dict_striped).validate().as_json().json_key("id")
+        resolution_cache.invalidate(resolution_cache.key(self.api_host, self._endpoint, project.name, field=f"owner={self.user.id}"))
         self.user.set_project_owner(project_id)
         project.id = project_id
         self.project = project
@@ -0,0 +1,158 @@
+##
+##
+
+import time
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Union
+
+logger = logging.getLogger('libcapella.rate_limit')
+logger.addHandler(logging.NullHandler())
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket(object):
+
+    def __init__(self, rate: float = 10.0, capacity: float = 10.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    delay = self.paused_until - now
+                elif self.rate <= 0:
+                    return waited
+                else:
+                    self._refill(now)
+                    if self.tokens >= tokens:
+                        self.tokens -= tokens
+                        return waited
+                    delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float):
+        with self._lock:
+            now = time.monotonic()
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = 0.0
+            self.updated = now
+        logger.debug(f"rate limited, pausing requests for {seconds:.2f} seconds")
+
+
+class AdaptiveConcurrency(object):
+
+    def __init__(self, limit: int = 8, minimum: int = 1, maximum: int = 32, decrease: float = 0.5):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(limit, self.minimum), self.maximum))
+        self.decrease = decrease
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def on_success(self):
+        with self._condition:
+            if self.limit < self.maximum:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+                self._condition.notify_all()
+
+    def grow(self, maximum: int):
+        with self._condition:
+            if maximum > self.maximum:
+                self.maximum = maximum
+                self._condition.notify_all()
+
+    def on_throttle(self):
+        with self._condition:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+        logger.debug(f"concurrency limit reduced to {self.current}")
+
+
+class RateLimiter(object):
+
+    def __init__(self,
+                 rate: float = 0.0,
+                 burst: float = 10.0,
+                 concurrency: int = 8,
+                 max_concurrency: int = 32,
+                 retry_count: int = 5,
+                 factor: float = 0.5):
+        self.bucket = TokenBucket(rate=rate, capacity=burst)
+        self.concurrency = AdaptiveConcurrency(limit=concurrency, maximum=max_concurrency)
+        self.retry_count = retry_count
+        self.factor = factor
+        self.throttled = 0
+        self.requests = 0
+
+    def acquire(self):
+        self.bucket.acquire()
+        self.concurrency.acquire()
+
+    def release(self):
+        self.concurrency.release()
+
+    def record(self, status_code: int, retry_after: Union[str, None] = None, attempt: int = 0) -> Union[float, None]:
+        self.requests += 1
+        if status_code == 429 or status_code == 503:
+            self.throttled += 1
+            self.concurrency.on_throttle()
+            wait = parse_retry_after(retry_after)
+            if wait is None:
+                wait = self.factor * (2 ** attempt)
+            self.bucket.pause(wait)
+            return wait
+        elif status_code >= 500:
+            self.concurrency.on_throttle()
+        else:
+            self.concurrency.on_success()
+        return None
+
+    @property
+    def stats(self) -> dict:
+        return dict(requests=self.requests, throttled=self.throttled, concurrency=self.concurrency.current, rate=self.bucket.rate)
@@ -0,0 +1,146 @@
+##
+##
+
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Union
+from libcapella.config import CapellaConfig
+from libcapella.config_data import CapellaConfigData
+from libcapella.config_profile import CapellaProfileConfig
+from libcapella.organization import CapellaOrganization
+from libcapella.pool import session_pool
+from libcapella.logic.registry import TenantResult
+
+logger = logging.getLogger('libcapella.registry')
+logger.addHandler(logging.NullHandler())
+
+
+class CapellaTenant(object):
+
+    def __init__(self, name: str, config: CapellaConfig):
+        self.name = name
+        self.config = config
+        self.lock = threading.RLock()
+        self._organization = None
+
+    @property
+    def organization(self) -> CapellaOrganization:
+        with self.lock:
+            if self._organization is None:
+                logger.debug(f"tenant {self.name}: connecting to {self.config.config.api_host}")
+                self._organization = CapellaOrganization(self.config)
+            return self._organization
+
+    @property
+    def connected(self) -> bool:
+        return self._organization is not None
+
+    @property
+    def organization_id(self) -> Union[str, None]:
+        if self._organization is not None:
+            return self._organization.id
+        return self.config.config.organization_id
+
+    def close(self):
+        with self.lock:
+            if self._organization is not None:
+                session_pool.discard(self._organization.api_host, self._organization.auth_token)
+            self._organization = None
+
+
+class CapellaClientRegistry(object):
+
+    def __init__(self, workers: int = 8):
+        self.workers = workers
+        self._tenants: Dict[str, CapellaTenant] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, config: Union[CapellaConfig, CapellaConfigData, dict]) -> CapellaTenant:
+        if isinstance(config, dict):
+            config = CapellaConfig(config_dict=config)
+        elif isinstance(config, CapellaConfigData):
+            config = CapellaConfig(config_data=config)
+        tenant = CapellaTenant(name, config)
+        with self._lock:
+            if name in self._tenants:
+                raise ValueError(f"tenant {name} is already registered")
+            self._tenants[name] = tenant
+        return tenant
+
+    def add_profiles(self, filename: Union[str, None] = None, profiles: Union[Iterable[str], None] = None) -> List[CapellaTenant]:
+        names = list(profiles) if profiles is not None else CapellaProfileConfig.profiles(filename)
+        return [self.add(name, CapellaProfileConfig(filename, name)) for name in names]
+
+    def remove(self, name: str) -> CapellaTenant:
+        with self._lock:
+            tenant = self._tenants.pop(name)
+        tenant.close()
+        return tenant
+
+    def get(self, name: str) -> Union[CapellaTenant, None]:
+        return self._tenants.get(name)
+
+    def by_organization(self, organization_id: str) -> Union[CapellaTenant, None]:
+        for tenant in self:
+            if tenant.organization_id == organization_id:
+                return tenant
+        return None
+
+    def organization(self, name: str) -> CapellaOrganization:
+        return self[name].organization
+
+    @property
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._tenants)
+
+    def map(self, function: Callable[[CapellaOrganization], Any], names: Union[Iterable[str], None] = None) -> Dict[str, TenantResult]:
+        tenants = [self[name] for name in names] if names is not None else list(self)
+
+        def run(tenant: CapellaTenant) -> TenantResult:
+            tenant_result = TenantResult(tenant.name)
+            start = time.perf_counter()
+            try:
+                with tenant.lock:
+                    tenant_result.result = function(tenant.organization)
+            except Exception as err:
+                logger.debug(f"tenant {tenant.name}: {err}")
+                tenant_result.error = err
+            tenant_result.elapsed = time.perf_counter() - start
+            return tenant_result
+
+        if not tenants:
+            return {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(tenants)))) as executor:
+            return {r.name: r for r in executor.map(run, tenants)}
+
+    def stats(self) -> Dict[str, dict]:
+        return {tenant.name: tenant.organization.pool_stats for tenant in self if tenant.connected}
+
+    def close(self):
+        with self._lock:
+            tenants = list(self._tenants.values())
+            self._tenants.clear()
+        for tenant in tenants:
+            tenant.close()
+
+    def __getitem__(self, name: str) -> CapellaTenant:
+        return self._tenants[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tenants
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __iter__(self) -> Iterator[CapellaTenant]:
+        with self._lock:
+            return iter(list(self._tenants.values()))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,229 @@
+##
+##
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import Dict, List, Tuple, Union
+from requests import Response, PreparedRequest
+from requests.structures import CaseInsensitiveDict
+from libcapella.codec import get_backend
+
+logger = logging.getLogger('libcapella.response_cache')
+logger.addHandler(logging.NullHandler())
+
+default_directory = os.path.join(Path.home(), '.capella', 'cache')
+default_filename = os.path.join(default_directory, 'responses.db')
+stored_headers = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+org_collections = frozenset(("appservices",))
+
+CacheKey = Tuple[str, int, float]
+
+schema = """
+CREATE TABLE IF NOT EXISTS responses (
+    scope TEXT NOT NULL,
+    url TEXT NOT NULL,
+    path TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT,
+    body BLOB,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (scope, url)
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_path ON responses (scope, path);
+"""
+
+
+def org_listings(path: str) -> List[str]:
+    parts = path.split("/")
+    if "organizations" not in parts:
+        return []
+    n = parts.index("organizations") + 2
+    return ["/".join(parts[:n] + [part]) for part in parts[n + 1:] if part in org_collections]
+
+
+class CachedResponse(object):
+    __slots__ = ("url", "etag", "last_modified", "headers", "body", "stored_at")
+
+    def __init__(self, url: str, etag: Union[str, None], last_modified: Union[str, None], headers: dict, body: bytes, stored_at: float):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    def fresh(self, max_age: float) -> bool:
+        return max_age > 0 and time.time() - self.stored_at < max_age
+
+    def response(self, request: PreparedRequest) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = self.url
+        response.request = request
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.encoding = "utf-8"
+        return response
+
+
+class ResponseCache(object):
+
+    def __init__(self, filename: Union[str, None] = None, max_bytes: int = 64 * 1024 * 1024, max_age: float = 0.0):
+        self.filename = filename if filename else default_filename
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        self._codec = get_backend()
+        self._db = self.connect()
+        self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def connect(self) -> "sqlite3.Connection":
+        import sqlite3
+        if self.filename != ":memory:":
+            directory = os.path.dirname(os.path.abspath(self.filename))
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            if not os.path.exists(self.filename):
+                os.close(os.open(self.filename, os.O_CREAT | os.O_WRONLY, 0o600))
+        db = sqlite3.connect(self.filename, check_same_thread=False, isolation_level=None, timeout=10)
+        if self.filename != ":memory:":
+            db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(schema)
+        return db
+
+    @property
+    def key(self) -> CacheKey:
+        return self.filename, self.max_bytes, self.max_age
+
+    @staticmethod
+    def scope(api_host: str, token: Union[str, None]) -> str:
+        return hashlib.sha256(f"{api_host}:{token or ''}".encode()).hexdigest()[:32]
+
+    def get(self, scope: str, url: str) -> Union[CachedResponse, None]:
+        with self._lock:
+            row = self._db.execute("SELECT etag, last_modified, headers, body, stored_at FROM responses WHERE scope = ? AND url = ?", (scope, url)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE scope = ? AND url = ?", (time.time(), scope, url))
+        etag, last_modified, headers, body, stored_at = row
+        return CachedResponse(url, etag, last_modified, self._codec.loads(headers) if headers else {}, body, stored_at)
+
+    def put(self, scope: str, url: str, response: Response) -> bool:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified and self.max_age <= 0:
+            return False
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return False
+        body = response.content
+        headers = self._codec.dumps({k: response.headers[k] for k in stored_headers if k in response.headers}).decode()
+        size = len(body) + len(url) + len(headers)
+        if size > self.max_bytes:
+            return False
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute("SELECT size FROM responses WHERE scope = ? AND url = ?", (scope, url)).fetchone()
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                             (scope, url, urlsplit(url).path, etag, last_modified, headers, body, size, now, now))
+            self._bytes += size - (previous[0] if previous else 0)
+            if self._bytes > self.max_bytes:
+                self.evict()
+        return True
+
+    def touch(self, scope: str, url: str):
+        now = time.time()
+        with self._lock:
+            self._db.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE scope = ? AND url = ?", (now, now, scope, url))
+
+    def invalidate(self, scope: str, url: str):
+        path = urlsplit(url).path.rstrip("/")
+        parent = path.rsplit("/", 1)[0]
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE scope = ? AND (path = ? OR path = ? OR substr(path, 1, ?) = ?)",
+                             (scope, path, parent, len(path) + 1, path + "/"))
+            for listing in org_listings(path):
+                self._db.execute("DELETE FROM responses WHERE scope = ? AND path = ?", (scope, listing))
+            self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def evict(self):
+        with self._lock:
+            self._bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if self._bytes <= self.max_bytes:
+                return
+            excess = self._bytes - self.max_bytes
+            victims = []
+            for scope, url, size in self._db.execute("SELECT scope, url, size FROM responses ORDER BY accessed_at"):
+                victims.append((scope, url))
+                excess -= size
+                self._bytes -= size
+                if excess <= 0:
+                    break
+            self._db.executemany("DELETE FROM responses WHERE scope = ? AND url = ?", victims)
+            self.evictions += len(victims)
+            logger.debug(f"response cache: evicted {len(victims)} entries, {self._bytes} bytes in use")
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.revalidated = 0
+            self.evictions = 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    @property
+    def size(self) -> int:
+        return self._bytes
+
+    @property
+    def entries(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def stats(self) -> dict:
+        return dict(hits=self.hits, misses=self.misses, revalidated=self.revalidated, evictions=self.evictions, entries=self.entries, bytes=self.size)
+
+
+@contextmanager
+def revalidate(rest):
+    previous = getattr(rest, "cache_control", None)
+    rest.cache_control = "no-cache"
+    try:
+        yield rest
+    finally:
+        rest.cache_control = previous
+
+
+_caches: Dict[CacheKey, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def open_cache(filename: Union[str, None] = None, max_bytes: int = 64 * 1024 * 1024, max_age: float = 0.0) -> ResponseCache:
+    key = (os.path.abspath(filename) if filename else default_filename, max_bytes, max_age)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ResponseCache(*key)
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,95 @@
+##
+##
+
+import logging
+from typing import Union
+from restfull.base_auth import RestAuthBase
+from restfull.restapi import RestAPI
+from libcapella.codec import JsonBackend, get_backend
+
+logger = logging.getLogger('libcapella.rest')
+logger.addHandler(logging.NullHandler())
+
+json_headers = {"Content-Type": "application/json"}
+
+
+class CapellaRestAPI(RestAPI):
+
+    def __init__(self,
+                 auth_class: RestAuthBase,
+                 hostname: str = '127.0.0.1',
+                 use_ssl: bool = True,
+                 verify: bool = True,
+                 port: Union[int, None] = None,
+                 json_backend: Union[str, JsonBackend, None] = None):
+        self.codec = json_backend if isinstance(json_backend, JsonBackend) else get_backend(json_backend)
+        self._response_text = None
+        self._response_body = None
+        self.cache_control = None
+        super().__init__(auth_class, hostname, use_ssl, verify, port)
+
+    @property
+    def response_text(self) -> Union[str, None]:
+        if self._response_text is None and self._response_body is not None:
+            self._response_text = self._response_body.decode("utf-8", errors="replace")
+        return self._response_text
+
+    @response_text.setter
+    def response_text(self, text: Union[str, None]):
+        self._response_text = text
+        self._response_body = None
+
+    def request(self, method: str, endpoint: str, body: Union[dict, list, None] = None):
+        url = self.build_url(endpoint)
+        self.reset()
+        logger.debug(f"{method} {url}")
+        headers = {"Cache-Control": self.cache_control} if self.cache_control else None
+        if body is None:
+            response = self.session.request(method, url, auth=self.auth_class, headers=headers, verify=self.verify)
+        else:
+            response = self.session.request(method, url, auth=self.auth_class, data=self.codec.dumps(body), headers=dict(json_headers, **headers) if headers else json_headers, verify=self.verify)
+        self._response_text = None
+        self._response_body = response.content
+        self.response_code = response.status_code
+        return self
+
+    def get(self, endpoint: str):
+        return self.request("GET", endpoint)
+
+    def get_by_page(self, endpoint: str, page_tag: str = "page", page: int = 1, per_page_tag: Union[str, None] = None, per_page: int = 10):
+        return self.request("GET", self.paged_endpoint(endpoint, page_tag, page, per_page_tag, per_page))
+
+    def post(self, endpoint: str, body: Union[dict, list]):
+        return self.request("POST", endpoint, body)
+
+    def patch(self, endpoint: str, body: Union[dict, list]):
+        return self.request("PATCH", endpoint, body)
+
+    def put(self, endpoint: str, body: Union[dict, list]):
+        return self.request("PUT", endpoint, body)
+
+    def delete(self, endpoint: str):
+        return self.request("DELETE", endpoint)
+
+    def validate(self, code: int = None, text: str = None):
+        check_code = code if code is not None else self.response_code
+        if text is None and self.success_start <= check_code < self.success_end:
+            return self
+        return super().validate(code, text)
+
+    def decode(self, data_key: Union[str, None] = None) -> Union[dict, list]:
+        payload = self._response_body if self._response_text is None else self._response_text
+        if not payload:
+            return {}
+        try:
+            data = self.codec.loads(payload)
+            return data if data_key is None else data.get(data_key)
+        except self.codec.errors + (AttributeError,):
+            return {}
+
+    def json(self, data_key: Union[str, None] = None):
+        return self.decode(data_key)
+
+    def as_json(self, data_key: Union[str, None] = None):
+        self.response_dict = self.decode(data_key)
+        return self
@@ -2,10 +2,13 @@
 ##
 
 import logging
-from typing import List, Union
+from typing import List, Union, FrozenSet, Iterator
 from restfull.restapi import NotFoundError
 from libcapella.organization import CapellaOrganization
-from libcapella.logic.user import User, ProjectOwnership
+from libcapella.paging import CapellaPager
+from libcapella.cache import resolution_cache
+from libcapella.user_directory import CapellaUserDirectory
+from libcapella.logic.user import User, Resources, ProjectOwnership, UserTable
 
 logger = logging.getLogger('libcapella.user')
 logger.addHandler(logging.NullHandler())
@@ -16,6 +19,10 @@ class CapellaUser(object):
     def __init__(self, org: CapellaOrganization, email: Union[str, None] = None):
         self._endpoint = f"{org.endpoint}/{org.id}/users"
         self.rest = org.rest
+        self.api_host = org.api_host
+        self.directory = CapellaUserDirectory.for_org(self.rest, self.api_host, self._endpoint, org.tenant)
+        self._user_record = None
+        self._owned_projects = frozenset()
         if email is not None:
             self.user_record = self.get_by_email(email)
         elif org.config.account_email is not None:
@@ -29,37 +36,69 @@ class CapellaUser(object):
     def endpoint(self):
         return self._endpoint
 
+    @property
+    def user_record(self) -> Union[User, None]:
+        return self._user_record
+
+    @user_record.setter
+    def user_record(self, user: Union[User, None]):
+        self._user_record = user
+        if user:
+            self._owned_projects = frozenset(resource.id for resource in user.resources if resource.type == "project")
+        else:
+            self._owned_projects = frozenset()
+
     @property
     def id(self):
         if not self.user_record:
             return None
         return self.user_record.id
 
+    @property
+    def owned_projects(self) -> FrozenSet[str]:
+        return self._owned_projects
+
+    def owns_project(self, project_id: str) -> bool:
+        return project_id in self._owned_projects
+
     def list(self):
-        return [User.create(r) for r in self.get_all_users()]
+        users = [User.create(r) for r in self.get_all_users()]
+        self.directory.load(users)
+        return users
+
+    def iter_users(self, prefetch: bool = False) -> Iterator[User]:
+        for record in CapellaPager(self.rest, self._endpoint, per_page=100, prefetch=prefetch).records():
+            user = User.create(record)
+            self.directory.add(user)
+            yield user
+
+    def table(self, prefetch: bool = True) -> UserTable:
+        return UserTable.from_records(CapellaPager(self.rest, self._endpoint, per_page=100, prefetch=prefetch).records())
 
     def get_all_users(self) -> List[dict]:
-        result = self.rest.get_paged(self._endpoint,
-                                     total_tag="totalItems",
-                                     pages_tag="last",
-                                     per_page_tag="perPage",
-                                     per_page=100,
-                                     cursor="cursor",
-                                     category="pages").validate().json_list()
-        return result.as_list
+        return CapellaPager(self.rest, self._endpoint, per_page=100).fetch_all()
 
     def get(self, user_id: str) -> Union[User, None]:
         endpoint = self._endpoint + f"/{user_id}"
         try:
-            result = self.rest.get(endpoint).validate().as_json().json_object()
-            return User.create(result.as_dict)
+            record = self.rest.get(endpoint).validate().as_json().json_object().as_dict
         except NotFoundError:
+            resolution_cache.invalidate_scope(self.api_host, self._endpoint, user_id)
+            self.directory.discard(user_id)
             return None
+        return User.create(record)
 
     def get_by_email(self, email: str) -> Union[User, None]:
-        user = next((u for u in self.list() if u.email == email), None)
-        while not user:
-            user = next((u for u in self.list() if u.email == email), None)
+        key = resolution_cache.key(self.api_host, self._endpoint, email, field="email")
+        user_id = resolution_cache.get(key)
+        if user_id is not None:
+            user = self.get(user_id)
+            if user is not None and user.email == email:
+                return user
+            resolution_cache.invalidate(key)
+        user = self.directory.lookup(email, self.rest)
+        if user is not None:
+            resolution_cache.put(key, self._endpoint, user.id)
         return user
 
     def set_project_owner(self, project_id: str):
@@ -68,9 +107,11 @@ class CapellaUser(object):
         user_op = ProjectOwnership()
         user_op.add(project_id)
         self.rest.patch(endpoint, user_op.as_dict).validate()
+        resolution_cache.invalidate_scope(self.api_host, self._endpoint)
+        self.directory.discard(user_id)
+        if self.user_record and project_id not in self._owned_projects:
+            self.user_record.resources.append(Resources("project", project_id, ["projectOwner"]))
+            self._owned_projects = self._owned_projects | {project_id}
 
     def projects_by_owner(self):
-        if self.user_record:
-            return [resource.id for resource in self.user_record.resources if resource.type == "project"]
-        else:
-            return []
+        return list(self._owned_projects)
@@ -0,0 +1,132 @@
+##
+##
+
+import time
+import logging
+import threading
+from typing import Dict, List, Union
+from restfull.restapi import RestAPI
+from libcapella.paging import CapellaPager
+from libcapella.cache import resolution_cache
+from libcapella.logic.user import User
+
+logger = logging.getLogger('libcapella.user_directory')
+logger.addHandler(logging.NullHandler())
+
+
+class CapellaUserDirectory(object):
+    _directories: Dict[tuple, "CapellaUserDirectory"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, rest: RestAPI, endpoint: str, per_page: int = 100, retry_count: int = 0, factor: float = 1.0, ttl: Union[float, None] = None):
+        self.rest = rest
+        self.endpoint = endpoint
+        self.per_page = per_page
+        self.retry_count = retry_count
+        self.factor = factor
+        self.by_email: Dict[str, User] = {}
+        self.by_id: Dict[str, User] = {}
+        self.loaded: Dict[str, float] = {}
+        self.complete = False
+        self.loaded_at = 0.0
+        self._ttl = ttl
+        self.scans = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_org(cls, rest: RestAPI, api_host: str, endpoint: str, tenant: str = "") -> "CapellaUserDirectory":
+        key = (api_host, endpoint, tenant)
+        with cls._registry_lock:
+            directory = cls._directories.get(key)
+            if directory is None:
+                directory = cls(rest, endpoint)
+                cls._directories[key] = directory
+            return directory
+
+    @classmethod
+    def reset(cls):
+        with cls._registry_lock:
+            cls._directories.clear()
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl if self._ttl is not None else resolution_cache.ttl
+
+    def fresh(self, user: Union[User, None]) -> bool:
+        return user is not None and self.loaded.get(user.id, 0.0) + self.ttl > time.time()
+
+    @property
+    def current(self) -> bool:
+        return self.complete and self.loaded_at + self.ttl > time.time()
+
+    @property
+    def users(self) -> List[User]:
+        with self._lock:
+            return list(self.by_id.values())
+
+    def add(self, user: User):
+        with self._lock:
+            previous = self.by_id.get(user.id)
+            if previous is not None and previous.email != user.email:
+                self.by_email.pop(previous.email, None)
+            self.by_id[user.id] = user
+            self.by_email[user.email] = user
+            self.loaded[user.id] = time.time()
+
+    def discard(self, user_id: str):
+        with self._lock:
+            user = self.by_id.pop(user_id, None)
+            if user is not None:
+                self.by_email.pop(user.email, None)
+            self.loaded.pop(user_id, None)
+            self.complete = False
+
+    def load(self, users: List[User]):
+        with self._lock:
+            self.by_id = {u.id: u for u in users}
+            self.by_email = {u.email: u for u in users}
+            now = time.time()
+            self.loaded = {u.id: now for u in users}
+            self.loaded_at = now
+            self.complete = True
+
+    def refresh(self, email: Union[str, None] = None, rest: Union[RestAPI, None] = None) -> Union[User, None]:
+        pager = CapellaPager(rest if rest is not None else self.rest, self.endpoint, per_page=self.per_page)
+        self.scans += 1
+        seen = []
+        for record in pager.records():
+            user = User.create(record)
+            seen.append(user)
+            self.add(user)
+            if email is not None and user.email == email:
+                logger.debug(f"found user {email} after {pager.pages_fetched} of {pager.total_pages} pages")
+                return user
+        self.load(seen)
+        return None
+
+    def get(self, user_id: str) -> Union[User, None]:
+        with self._lock:
+            user = self.by_id.get(user_id)
+            return user if self.fresh(user) else None
+
+    def lookup(self, email: str, rest: Union[RestAPI, None] = None) -> Union[User, None]:
+        with self._lock:
+            user = self.by_email.get(email)
+            if self.fresh(user):
+                return user
+            if user is None and self.current:
+                logger.debug(f"user {email} not in the directory loaded {time.time() - self.loaded_at:.1f} seconds ago")
+                return None
+        if user is not None:
+            logger.debug(f"user {email} is older than {self.ttl} seconds, rescanning")
+        for retry_number in range(self.retry_count + 1):
+            user = self.refresh(email, rest)
+            if user is not None:
+                return user
+            if retry_number == self.retry_count:
+                break
+            wait = self.factor * (2 ** retry_number)
+            logger.debug(f"user {email} not found, retrying in {wait} seconds")
+            time.sleep(wait)
+        logger.debug(f"user {email} not found after {self.retry_count + 1} scans")
+        return None
@@ -0,0 +1,154 @@
+##
+##
+
+import time
+import logging
+from concurrent.futures import Future
+from typing import Iterator, List, Tuple, Union
+from libcapella.paging import CapellaPager
+from libcapella.response_cache import revalidate
+
+logger = logging.getLogger('libcapella.wait')
+logger.addHandler(logging.NullHandler())
+
+wait_intervals = {
+    "deploying": (30.0, 60.0),
+    "scaling": (30.0, 60.0),
+    "rebalancing": (30.0, 60.0),
+    "turningOn": (15.0, 60.0),
+    "turningOff": (15.0, 60.0),
+    "destroying": (10.0, 30.0),
+    "peering": (5.0, 20.0),
+}
+default_interval = (10.0, 30.0)
+backoff_factor = 1.5
+
+
+class WaitTarget(object):
+
+    def __init__(self, resource, state: str, until: bool, deadline: float, now: float):
+        self.resource = resource
+        self.state = state
+        self.until = until
+        self.deadline = deadline
+        self.future = Future()
+        self.observed = None
+        self.interval = 0.0
+        self.next_check = now
+
+    @property
+    def id(self):
+        return self.resource.id
+
+    @property
+    def group(self):
+        return id(self.resource.rest), self.resource.list_endpoint
+
+    def settled(self, current_state: Union[str, None]) -> bool:
+        if current_state is None:
+            return True
+        if self.until:
+            return current_state == self.state
+        return current_state != self.state
+
+
+class CapellaWaitScheduler(object):
+
+    def __init__(self, intervals: Union[dict, None] = None, per_page: int = 100):
+        self.intervals = dict(wait_intervals)
+        if intervals:
+            self.intervals.update(intervals)
+        self.per_page = per_page
+        self.targets: List[WaitTarget] = []
+        self.list_calls = 0
+        self.get_calls = 0
+
+    def add(self, resource, state: str, until: bool = False, timeout: float = 900) -> Future:
+        now = time.monotonic()
+        target = WaitTarget(resource, state, until, now + timeout, now)
+        if not resource.id:
+            target.future.set_result(True)
+        self.targets.append(target)
+        return target.future
+
+    @property
+    def pending(self) -> List[WaitTarget]:
+        return [t for t in self.targets if not t.future.done()]
+
+    def interval_for(self, target: WaitTarget, current_state: str) -> float:
+        initial, ceiling = self.intervals.get(current_state, self.intervals.get("default", default_interval))
+        if current_state != target.observed:
+            target.observed = current_state
+            return initial
+        return min(max(target.interval, initial) * backoff_factor, ceiling)
+
+    def poll(self, targets: List[WaitTarget]) -> dict:
+        resource = targets[0].resource
+        with revalidate(resource.rest):
+            if len(targets) == 1:
+                self.get_calls += 1
+                record = resource.get(resource.id)
+                return {resource.id: record.currentState} if record else {}
+            self.list_calls += 1
+            result = CapellaPager(resource.rest, resource.list_endpoint, per_page=self.per_page).fetch_all()
+        return {r.get("id"): r.get("currentState") for r in result}
+
+    def tick(self) -> List[WaitTarget]:
+        now = time.monotonic()
+        groups = {}
+        for target in self.pending:
+            groups.setdefault(target.group, []).append(target)
+
+        completed = []
+        for group in groups.values():
+            if not any(t.next_check <= now for t in group):
+                continue
+            try:
+                states = self.poll(group)
+            except Exception as err:
+                logger.debug(f"wait poll for {group[0].resource.list_endpoint} failed: {err}")
+                for target in group:
+                    if now >= target.deadline:
+                        target.future.set_exception(err)
+                        completed.append(target)
+                    else:
+                        target.next_check = min(now + self.interval_for(target, target.observed), target.deadline)
+                continue
+            for target in group:
+                current_state = states.get(target.id)
+                logger.debug(f"Checking {target.id} state {current_state} with state {target.state} until {target.until}")
+                if target.settled(current_state):
+                    target.future.set_result(True)
+                    completed.append(target)
+                elif now >= target.deadline:
+                    target.future.set_result(False)
+                    completed.append(target)
+                else:
+                    target.interval = self.interval_for(target, current_state)
+                    target.next_check = min(now + target.interval, target.deadline)
+        return completed
+
+    def as_completed(self) -> Iterator[Tuple[object, Future]]:
+        for target in self.targets:
+            if target.future.done():
+                yield target.resource, target.future
+        while self.pending:
+            for target in self.tick():
+                yield target.resource, target.future
+            pending = self.pending
+            if pending:
+                delay = min(t.next_check for t in pending) - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+    def wait(self) -> List[bool]:
+        for _ in self.as_completed():
+            pass
+        return [t.future.result() for t in self.targets]
+
+
+def wait_for(resource, state: str, until: bool = False, timeout: float = 900) -> bool:
+    scheduler = CapellaWaitScheduler()
+    future = scheduler.add(resource, state, until=until, timeout=timeout)
+    scheduler.wait()
+    return future.result()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import asyncio
+import logging
+import pytest
+import warnings
+import unittest
+from libcapella.config import CapellaConfig
+from libcapella.aio.organization import AsyncCapellaOrganization
+from libcapella.aio.user import AsyncCapellaUser
+from libcapella.aio.project import AsyncCapellaProject
+from libcapella.aio.database import AsyncCapellaDatabase
+from tests.common import get_account_email
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_10')
+logger.addHandler(logging.NullHandler())
+
+
+@pytest.mark.full_test
+@pytest.mark.async_test
+@pytest.mark.order(10)
+class TestAsync(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.project_name = "pytest-project"
+        self.email = get_account_email()
+        if not self.email:
+            raise RuntimeError('account email not set')
+        config = CapellaConfig(profile="pytest")
+        self.org = await AsyncCapellaOrganization(config)
+
+    async def asyncTearDown(self):
+        await self.org.close()
+
+    async def test_1(self):
+        result = await self.org.list()
+        assert len(result) >= 1
+        assert result[0].id is not None
+
+    async def test_2(self):
+        user = await AsyncCapellaUser(self.org, self.email)
+        assert user.id is not None
+        result = await user.get(user.id)
+        assert result.id == user.id
+
+    async def test_3(self):
+        project = await AsyncCapellaProject(self.org, self.project_name, self.email)
+        if not project.id:
+            raise RuntimeError('project does not exist')
+        databases, projects = await asyncio.gather(AsyncCapellaDatabase(project).list(), project.list())
+        assert len(projects) >= 1
+        for database in databases:
+            assert database.id is not None
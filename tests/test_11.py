@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+import logging
+import pytest
+import warnings
+import unittest
+from restfull.data import JsonList
+from libcapella.wait import CapellaWaitScheduler
+from libcapella.logic.database import Database
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_11')
+logger.addHandler(logging.NullHandler())
+
+
+class FakeRest(object):
+
+    def __init__(self, states: dict):
+        self.states = states
+        self.ticks = 0
+
+    @staticmethod
+    def paged_endpoint(endpoint: str, *args):
+        return endpoint
+
+    def get(self, endpoint: str):
+        self.ticks += 1
+        return self
+
+    def validate(self):
+        return self
+
+    def as_json(self):
+        return self
+
+    def page_count(self, *args):
+        records = self.json_list().as_list
+        return len(records), 1, records
+
+    def json_list(self):
+        records = []
+        for resource_id, sequence in self.states.items():
+            state = sequence[min(self.ticks, len(sequence)) - 1]
+            if state is not None:
+                records.append(dict(id=resource_id, currentState=state))
+        return JsonList(records)
+
+    def record(self, resource_id: str):
+        self.ticks += 1
+        return next((Database.create(r) for r in self.json_list().as_list if r.get("id") == resource_id), None)
+
+
+class FakeResource(object):
+
+    def __init__(self, rest: FakeRest, resource_id: str):
+        self.rest = rest
+        self.id = resource_id
+        self.list_endpoint = "/v4/organizations/org/projects/project/clusters"
+
+    def get(self, resource_id: str):
+        return self.rest.record(resource_id)
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(11)
+class TestWaitScheduler(unittest.TestCase):
+
+    def test_1(self):
+        rest = FakeRest({
+            "db1": ["deploying", "healthy"],
+            "db2": ["deploying", "deploying", "deploying", "healthy"],
+            "db3": ["destroying", None],
+        })
+        scheduler = CapellaWaitScheduler(intervals={"deploying": (0.01, 0.02), "destroying": (0.01, 0.02)})
+        scheduler.add(FakeResource(rest, "db1"), "deploying")
+        scheduler.add(FakeResource(rest, "db2"), "deploying")
+        scheduler.add(FakeResource(rest, "db3"), "destroying")
+        order = [resource.id for resource, future in scheduler.as_completed() if future.result()]
+        assert order[2] == "db2"
+        assert sorted(order) == ["db1", "db2", "db3"]
+        assert scheduler.list_calls + scheduler.get_calls == rest.ticks
+        assert scheduler.get_calls == 2
+
+    def test_2(self):
+        rest = FakeRest({
+            "app1": ["deploying", "deploying", "healthy"],
+            "app2": ["deploying"],
+        })
+        scheduler = CapellaWaitScheduler(intervals={"deploying": (0.01, 0.01)})
+        first = scheduler.add(FakeResource(rest, "app1"), "healthy", until=True, timeout=5)
+        second = scheduler.add(FakeResource(rest, "app2"), "healthy", until=True, timeout=0.05)
+        assert scheduler.wait() == [True, False]
+        assert first.result() is True
+        assert second.result() is False
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import os
+import time
+import logging
+import pytest
+import warnings
+import unittest
+import tempfile
+from libcapella.cache import ResolutionCache
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_12')
+logger.addHandler(logging.NullHandler())
+
+host = "cloudapi.cloud.couchbase.com"
+clusters = "/v4/organizations/org1/projects/proj1/clusters"
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(12)
+class TestResolutionCache(unittest.TestCase):
+
+    def test_1(self):
+        assert ResolutionCache.key(host, "/v4/organizations", "acme") == (host, None, None, "organizations", "acme")
+        assert ResolutionCache.key(host, "/v4/organizations/org1/users", "a@b.c", field="email") == (host, "org1", None, "users@email", "a@b.c")
+        assert ResolutionCache.key(host, clusters, "db") == (host, "org1", "proj1", "clusters", "db")
+        assert ResolutionCache.key(host, f"{clusters}/c1/users", "dev") == (host, "org1", "proj1", "clusters/c1/users", "dev")
+
+    def test_2(self):
+        cache = ResolutionCache(ttl=0.05, max_entries=2)
+        first = cache.key(host, clusters, "db1")
+        second = cache.key(host, clusters, "db2")
+        third = cache.key(host, clusters, "db3")
+        assert cache.get(first) is None
+        cache.put(first, clusters, "c1")
+        cache.put(second, clusters, "c2")
+        assert cache.get(first) == "c1"
+        cache.put(third, clusters, "c3")
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.stats == dict(hits=2, misses=2, evictions=1, size=2)
+        time.sleep(0.06)
+        assert cache.get(first) is None
+
+    def test_3(self):
+        cache = ResolutionCache()
+        cache.put(cache.key(host, clusters, "db1"), clusters, "c1")
+        cache.put(cache.key(host, clusters, "db10"), clusters, "c10")
+        cache.put(cache.key(host, f"{clusters}/c1/users", "dev"), f"{clusters}/c1/users", "u1")
+        cache.put(cache.key(host, f"{clusters}/c10/users", "dev"), f"{clusters}/c10/users", "u2")
+        cache.invalidate_scope(host, clusters, "c1")
+        assert cache.size == 2
+        assert cache.get(cache.key(host, clusters, "db10")) is not None
+
+    def test_4(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "cache", "resolve.json")
+            cache = ResolutionCache(filename=filename)
+            cache.put(cache.key(host, clusters, "db1"), clusters, "c1")
+            cache.save()
+            restored = ResolutionCache(filename=filename)
+            assert restored.get(restored.key(host, clusters, "db1")) == "c1"
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+import json
+import time
+import logging
+import pytest
+import warnings
+import unittest
+from urllib.parse import urlparse, parse_qs
+from restfull.restapi import RestAPI
+from restfull.bearer_auth import BearerAuth
+from libcapella.user import CapellaUser
+from libcapella.user_directory import CapellaUserDirectory
+from libcapella.logic.user import User
+from libcapella.cache import resolution_cache
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_13')
+logger.addHandler(logging.NullHandler())
+
+
+class MemoryRestAPI(RestAPI):
+
+    def __init__(self, collection: list):
+        super().__init__(BearerAuth("test"), "localhost")
+        self.collection = collection
+        self.requests = 0
+        self.patches = []
+
+    def get(self, endpoint: str):
+        query = parse_qs(urlparse(endpoint).query)
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("perPage", ["10"])[0])
+        last = max(1, -(-len(self.collection) // per_page))
+        self.requests += 1
+        self.reset()
+        self.response_code = 200
+        self.response_text = json.dumps({
+            "data": self.collection[(page - 1) * per_page:page * per_page],
+            "cursor": {"pages": {"page": page, "last": last, "perPage": per_page, "totalItems": len(self.collection)}}
+        })
+        return self
+
+    def patch(self, endpoint: str, body: dict):
+        self.patches.append((endpoint, body))
+        self.reset()
+        self.response_code = 200
+        self.response_text = "{}"
+        return self
+
+
+class MemoryOrg(object):
+
+    def __init__(self, rest: MemoryRestAPI, email: str):
+        self.endpoint = "/v4/organizations"
+        self.id = "org"
+        self.rest = rest
+        self.api_host = "api.example.com"
+        self.tenant = "memory"
+        self.config = type("Config", (object,), dict(account_email=email, account_id=None))()
+
+
+def users(count: int) -> list:
+    return [dict(id=f"user-{n}", email=f"user{n}@example.com", resources=[]) for n in range(count)]
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(13)
+class TestUserDirectory(unittest.TestCase):
+
+    def test_1(self):
+        rest = MemoryRestAPI(users(250))
+        directory = CapellaUserDirectory(rest, "/v4/organizations/org/users", per_page=100)
+        user = directory.lookup("user120@example.com")
+        assert user.id == "user-120"
+        assert rest.requests == 2
+        assert directory.lookup("user5@example.com").id == "user-5"
+        assert rest.requests == 2
+
+    def test_2(self):
+        rest = MemoryRestAPI(users(250))
+        directory = CapellaUserDirectory(rest, "/v4/organizations/org/users", per_page=100, retry_count=2, factor=0.001)
+        assert directory.lookup("nobody@example.com") is None
+        assert directory.scans == 3
+        assert rest.requests == 9
+        assert directory.complete is True
+        assert len(directory.users) == 250
+
+    def test_3(self):
+        CapellaUserDirectory.reset()
+        rest = MemoryRestAPI(users(10))
+        first = CapellaUserDirectory.for_org(rest, "api.example.com", "/v4/organizations/org/users")
+        second = CapellaUserDirectory.for_org(rest, "api.example.com", "/v4/organizations/org/users")
+        other = CapellaUserDirectory.for_org(rest, "api.example.com", "/v4/organizations/other/users")
+        assert first is second
+        assert first is not other
+        CapellaUserDirectory.reset()
+
+    def test_4(self):
+        CapellaUserDirectory.reset()
+        resolution_cache.clear()
+        collection = users(3)
+        collection[1]["resources"] = [dict(type="project", id="p1", roles=["projectOwner"]), dict(type="cluster", id="c1", roles=[])]
+        rest = MemoryRestAPI(collection)
+        user = CapellaUser(MemoryOrg(rest, "user1@example.com"))
+        assert user.owned_projects == {"p1"}
+        assert user.owns_project("p1") and not user.owns_project("c1")
+        requests = rest.requests
+        user.set_project_owner("p2")
+        user.set_project_owner("p3")
+        assert rest.requests == requests
+        assert sorted(user.projects_by_owner()) == ["p1", "p2", "p3"]
+        assert [len(body) for _, body in rest.patches] == [1, 1]
+        CapellaUserDirectory.reset()
+        resolution_cache.clear()
+
+    def test_5(self):
+        CapellaUserDirectory.reset()
+        resolution_cache.clear()
+        rest = MemoryRestAPI(users(250))
+        user = CapellaUser(MemoryOrg(rest, None))
+        stream = user.iter_users(prefetch=True)
+        assert next(stream).id == "user-0"
+        stream.close()
+        assert [u.id for u in user.iter_users(prefetch=True)] == [f"user-{n}" for n in range(250)]
+        assert [u.id for u in user.iter_users()] == [f"user-{n}" for n in range(250)]
+        assert len(user.directory.users) == 250
+        CapellaUserDirectory.reset()
+
+    def test_6(self):
+        collection = users(250)
+        collection[7]["resources"] = [dict(type="project", id="p1", roles=["projectOwner"])]
+        collection[7]["audit"] = dict(createdBy="admin", createdAt="2024-01-01T00:00:00Z", modifiedBy="admin", modifiedAt="2024-01-01T00:00:00Z", version=2)
+        rest = MemoryRestAPI(collection)
+        table = CapellaUser(MemoryOrg(rest, None)).table()
+        assert len(table) == 250
+        assert table.column("id")[:2] == ["user-0", "user-1"]
+        assert table.find("user7@example.com") == User.create(collection[7])
+        assert table.find("nobody@example.com") is None
+        assert table.row(7)["resources"] == collection[7]["resources"]
+        assert table.row(7)["audit"] == collection[7]["audit"]
+        assert table.column("resources")[0] is table.column("resources")[1]
+        assert [u.id for u in table] == [f"user-{n}" for n in range(250)]
+
+    def test_7(self):
+        collection = users(3)
+        collection[0].update(inactive=True, enableNotifications=False)
+        collection[0]["audit"] = dict(createdBy="admin", createdAt="2024-01-01T00:00:00Z", modifiedBy="admin", modifiedAt="2024-01-01T00:00:00Z", version=1)
+        collection[1].update(inactive=False, enableNotifications=True)
+        collection[1]["audit"] = dict(collection[0]["audit"], version=0)
+        rest = MemoryRestAPI(collection)
+        table = CapellaUser(MemoryOrg(rest, None)).table()
+        assert table[0].inactive is True
+        assert table[1].enableNotifications is True
+        assert type(table[0].audit.version) is int and table[0].audit.version == 1
+        assert type(table[1].audit.version) is int and table[1].audit.version == 0
+        assert type(table.row(0)["audit"]["version"]) is int
+        assert table.row(1)["audit"] == collection[1]["audit"]
+
+    def test_8(self):
+        collection = users(250)
+        rest = MemoryRestAPI(collection)
+        directory = CapellaUserDirectory(rest, "/v4/organizations/org/users", per_page=100, ttl=0.05)
+        assert directory.lookup("user120@example.com").resources == []
+        collection[120]["resources"] = [dict(type="project", id="p1", roles=["projectOwner"])]
+        assert directory.lookup("user120@example.com").resources == []
+        assert rest.requests == 2
+        time.sleep(0.06)
+        assert directory.get("user-120") is None
+        assert directory.lookup("user120@example.com").resources[0].id == "p1"
+        assert rest.requests == 4
+        assert directory.scans == 2
+
+    def test_9(self):
+        rest = MemoryRestAPI(users(250))
+        directory = CapellaUserDirectory(rest, "/v4/organizations/org/users", per_page=100, ttl=0.05)
+        assert directory.lookup("nobody@example.com") is None
+        assert directory.scans == 1 and rest.requests == 3
+        assert directory.lookup("typo@example.com") is None
+        assert rest.requests == 3
+        other = MemoryRestAPI(users(250))
+        time.sleep(0.06)
+        assert directory.lookup("nobody@example.com", other) is None
+        assert directory.scans == 2
+        assert rest.requests == 3 and other.requests == 3
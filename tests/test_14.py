@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+import json
+import time
+import logging
+import pytest
+import warnings
+import unittest
+import threading
+from restfull.restapi import RestAPI, BadRequestError, RetryableError
+from restfull.bearer_auth import BearerAuth
+from libcapella.batch import run_batch
+from libcapella.rate_limit import TokenBucket
+from libcapella.pool import SessionPool
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_14')
+logger.addHandler(logging.NullHandler())
+
+
+class LimitedRestAPI(RestAPI):
+
+    def __init__(self, limit_every: int = 3):
+        super().__init__(BearerAuth("test"), "localhost")
+        self.limit_every = limit_every
+        self.posts = []
+        self.created = []
+        self.lock = threading.Lock()
+
+    def post(self, endpoint: str, body: dict):
+        self.reset()
+        with self.lock:
+            self.posts.append(body.get("name"))
+            limited = len(self.posts) % self.limit_every == 0
+            if not limited and body.get("name") != "invalid":
+                self.created.append(body.get("name"))
+        if limited:
+            self.response_code = 429
+            self.response_text = "{}"
+        elif body.get("name") == "invalid":
+            self.response_code = 400
+            self.response_text = "{}"
+        elif body.get("name") == "taken":
+            self.response_code = 409
+            self.response_text = "{}"
+        elif body.get("name") == "flaky" and self.posts.count("flaky") == 1:
+            self.response_code = 503
+            self.response_text = "{}"
+        else:
+            self.response_code = 201
+            self.response_text = json.dumps(dict(id=f"id-{body.get('name')}"))
+        return self
+
+
+def create(rest: RestAPI, name: str) -> str:
+    return rest.post("/users", dict(name=name)).validate().as_json().json_key("id")
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(14)
+class TestBatch(unittest.TestCase):
+
+    def test_1(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        start = time.monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_2(self):
+        rest = LimitedRestAPI()
+        names = [f"user{n}" for n in range(12)] + ["invalid"]
+        results = run_batch(rest, names, create, concurrency=4, bucket=TokenBucket(rate=1000, capacity=4), factor=0.001)
+        assert [r.index for r in results] == list(range(13))
+        assert all(r.ok for r in results[:12])
+        assert [r.result for r in results[:12]] == [f"id-user{n}" for n in range(12)]
+        assert isinstance(results[12].error, BadRequestError)
+        assert sorted(rest.created) == sorted(names[:12])
+        assert sum(r.attempts for r in results) == len(rest.posts)
+        assert len(rest.posts) > 13
+
+    def test_3(self):
+        rest = LimitedRestAPI(limit_every=1000)
+        rest.retry_server_errors()
+        results = run_batch(rest, ["taken", "flaky", "user0"], create, concurrency=2, bucket=TokenBucket(rate=1000, capacity=4), factor=0.001)
+        assert isinstance(results[0].error, RetryableError) and results[0].attempts == 1
+        assert results[1].ok and results[1].attempts == 2
+        assert results[2].ok and results[2].attempts == 1
+        assert rest.posts.count("taken") == 1
+
+    def test_4(self):
+        pool = SessionPool()
+        rest = LimitedRestAPI(limit_every=2)
+        rest.session = pool.session("batch.example.com", "token", max_connections=4)
+        limiter = pool.adapter(rest.session).limiter
+        results = run_batch(rest, ["user0", "user1"], create, concurrency=1, factor=0.001)
+        assert all(r.ok for r in results)
+        assert limiter.bucket.paused_until > 0
+        pool.close()
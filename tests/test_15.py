@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import pytest
+import warnings
+import unittest
+import threading
+from restfull.restapi import RestAPI
+from restfull.bearer_auth import BearerAuth
+from libcapella.logic.allowed_cidr import AllowedCIDR
+from libcapella.allowed_cidr_sync import collapse_cidrs, plan_cidr_sync, apply_cidr_sync
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_15')
+logger.addHandler(logging.NullHandler())
+
+
+class RecordingRestAPI(RestAPI):
+
+    def __init__(self):
+        super().__init__(BearerAuth("test"), "localhost")
+        self.calls = []
+        self.failing = set()
+        self.lock = threading.Lock()
+
+    def post(self, endpoint: str, body: dict):
+        with self.lock:
+            self.calls.append(("POST", body.get("cidr")))
+        self.reset()
+        if body.get("cidr") in self.failing:
+            self.response_code = 400
+            self.response_text = json.dumps(dict(message="invalid"))
+            return self
+        self.response_code = 201
+        self.response_text = json.dumps(dict(id=f"id-{body.get('cidr')}"))
+        return self
+
+    def delete(self, endpoint: str):
+        with self.lock:
+            self.calls.append(("DELETE", endpoint.rsplit("/", 1)[-1]))
+        self.reset()
+        self.response_code = 204
+        self.response_text = ""
+        return self
+
+
+def entry(cidr_id: str, cidr: str) -> AllowedCIDR:
+    return AllowedCIDR.create(dict(id=cidr_id, cidr=cidr))
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(15)
+class TestAllowedCIDRSync(unittest.TestCase):
+
+    def test_1(self):
+        result = collapse_cidrs(["10.0.0.0/24", "10.0.1.0/24", "10.0.0.128/25", "2001:db8::/33", "2001:db8:8000::/33", "192.168.1.7/24"])
+        assert [str(n) for n in result] == ["10.0.0.0/23", "192.168.1.0/24", "2001:db8::/32"]
+
+    def test_2(self):
+        current = [entry("a", "10.0.0.0/23"), entry("b", "172.16.0.0/24"), entry("c", "192.168.1.0/24"), entry("d", "192.168.1.5/24")]
+        plan = plan_cidr_sync(current, ["10.0.0.0/24", "10.0.1.0/24", "192.168.1.0/24", "203.0.113.0/24"])
+        assert [e.id for e in plan.keep] == ["a", "c"]
+        assert [e.id for e in plan.remove] == ["b", "d"]
+        assert plan.add == ["203.0.113.0/24"]
+        assert [e.id for e in plan_cidr_sync(current, [], prune=False).keep] == ["a", "b", "c", "d"]
+
+    def test_3(self):
+        rest = RecordingRestAPI()
+        current = [entry(f"id-{n}", f"10.{n // 100}.{n % 100 * 2}.0/24") for n in range(500)]
+        desired = [f"10.{n // 100}.{n % 100 * 2}.0/24" for n in range(1, 500)] + ["198.51.100.0/24"]
+        plan = apply_cidr_sync(rest, "/allowedcidrs", plan_cidr_sync(current, desired))
+        assert plan.ok
+        assert sorted(rest.calls) == [("DELETE", "id-0"), ("POST", "198.51.100.0/24")]
+        assert plan.results[0].result.id == "id-198.51.100.0/24"
+
+    def test_4(self):
+        rest = RecordingRestAPI()
+        current = [entry("a", "10.0.0.0/24"), entry("b", "10.0.1.0/24")]
+        plan = apply_cidr_sync(rest, "/allowedcidrs", plan_cidr_sync(current, ["10.0.0.0/23"]))
+        assert plan.ok
+        assert rest.calls[0] == ("POST", "10.0.0.0/23")
+        assert sorted(rest.calls[1:]) == [("DELETE", "a"), ("DELETE", "b")]
+        rest = RecordingRestAPI()
+        rest.failing.add("10.0.0.0/23")
+        plan = apply_cidr_sync(rest, "/allowedcidrs", plan_cidr_sync(current, ["10.0.0.0/23"]))
+        assert not plan.ok
+        assert rest.calls == [("POST", "10.0.0.0/23")]
+        assert len(plan.results) == 1
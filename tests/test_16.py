@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import logging
+import pytest
+import warnings
+import unittest
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from libcapella.config import CapellaConfig
+from libcapella.base import CouchbaseCapella
+from libcapella.pool import SessionPool
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_16')
+logger.addHandler(logging.NullHandler())
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"data": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(16)
+class TestSessionPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/v4/organizations"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_1(self):
+        pool = SessionPool()
+        first = pool.session("api.example.com", "token-a", max_connections=4)
+        assert pool.session("api.example.com", "token-a", max_connections=4) is first
+        assert pool.session("api.example.com", "token-b") is not first
+        assert pool.size == 2
+        assert pool.adapter(first).max_connections == 4
+        for _ in range(5):
+            first.get(self.url).raise_for_status()
+        stats = pool.stats("api.example.com", "token-a")["api.example.com"]
+        assert stats == dict(active=0, idle=1, connections=1, requests=5, reused=4, throttled=0)
+        pool.close()
+        assert pool.size == 0
+
+    def test_2(self):
+        config = dict(api_host="pool.example.com", token="token", max_connections=8)
+        first = CouchbaseCapella(CapellaConfig(config_dict=config))
+        second = CouchbaseCapella(CapellaConfig(config_dict=config))
+        assert first.rest is not second.rest
+        assert first.rest.session is second.rest.session
+        assert first.pool_stats == dict(active=0, idle=0, connections=0, requests=0, reused=0, throttled=0)
+
+    def test_3(self):
+        pool = SessionPool()
+        first = pool.session("api.example.com", "token", max_connections=4, rate_limit=5.0)
+        limiter = pool.adapter(first).limiter
+        with self.assertLogs("libcapella.pool", level="WARNING") as captured:
+            second = pool.session("api.example.com", "token", max_connections=16, rate_limit=50.0)
+        assert second is first
+        assert pool.adapter(first).max_connections == 16
+        assert pool.adapter(first).poolmanager.connection_pool_kw["maxsize"] == 16
+        assert limiter.concurrency.maximum == 16 and limiter.bucket.rate == 5.0
+        assert len(captured.records) == 2
+        assert pool.session("api.example.com", "token", max_connections=8, rate_limit=5.0) is first
+        assert pool.adapter(first).max_connections == 16
+        for _ in range(3):
+            first.get(self.url).raise_for_status()
+        pool.close()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+import time
+import logging
+import pytest
+import warnings
+import unittest
+import threading
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from libcapella.pool import SessionPool
+from libcapella.rate_limit import AdaptiveConcurrency, RateLimiter, TokenBucket, parse_retry_after
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_17')
+logger.addHandler(logging.NullHandler())
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    throttle = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            limited = ThrottlingHandler.throttle > 0
+            ThrottlingHandler.throttle -= 1
+        body = b'{"id": "ok"}'
+        self.send_response(429 if limited else 200)
+        if limited:
+            self.send_header("Retry-After", "0.05")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(17)
+class TestRateLimit(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ThrottlingHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/v4/organizations"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_1(self):
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+        bucket = TokenBucket(rate=0)
+        bucket.pause(0.05)
+        assert bucket.acquire() >= 0.04
+        assert bucket.acquire() == 0
+
+    def test_2(self):
+        concurrency = AdaptiveConcurrency(limit=8, maximum=8)
+        concurrency.on_throttle()
+        assert concurrency.current == 4
+        for _ in range(40):
+            concurrency.on_success()
+        assert concurrency.current == 8
+        for _ in range(10):
+            concurrency.on_throttle()
+        assert concurrency.current == 1
+        limiter = RateLimiter(concurrency=4, max_concurrency=4, factor=0.01)
+        assert limiter.record(500) is None and limiter.concurrency.current == 2
+        assert limiter.record(429, "0") == 0.0 and limiter.throttled == 1
+
+    def test_3(self):
+        pool = SessionPool()
+        session = pool.session("api.example.com", "token", max_connections=4)
+        ThrottlingHandler.throttle = 2
+        start = time.monotonic()
+        response = session.get(self.url)
+        assert response.status_code == 200
+        assert time.monotonic() - start >= 0.1
+        limiter = pool.adapter(session).limiter
+        assert limiter.stats == dict(requests=3, throttled=2, concurrency=2, rate=0.0)
+        assert pool.stats()["api.example.com"]["throttled"] == 2
+        ThrottlingHandler.throttle = 10
+        assert session.get(self.url).status_code == 429
+        assert limiter.throttled == 8
+        pool.close()
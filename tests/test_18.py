@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import json
+import time
+import random
+import logging
+import pytest
+import warnings
+import unittest
+import threading
+from urllib.parse import urlparse, parse_qs
+from restfull.restapi import RestAPI
+from restfull.bearer_auth import BearerAuth
+from libcapella.paging import CapellaPager
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_18')
+logger.addHandler(logging.NullHandler())
+
+
+class SlowRestAPI(RestAPI):
+
+    def __init__(self, count: int, latency: float = 0.01):
+        super().__init__(BearerAuth("test"), "localhost")
+        self.collection = [dict(id=f"id-{n}", name=f"name-{n}") for n in range(count)]
+        self.latency = latency
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def get(self, endpoint: str):
+        query = parse_qs(urlparse(endpoint).query)
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("perPage", ["10"])[0])
+        last = max(1, -(-len(self.collection) // per_page))
+        with self.lock:
+            self.threads.add(threading.get_ident())
+        time.sleep(self.latency * random.uniform(0.5, 1.5))
+        self.reset()
+        self.response_code = 200
+        self.response_text = json.dumps({
+            "data": self.collection[(page - 1) * per_page:page * per_page],
+            "cursor": {"pages": {"page": page, "last": last, "perPage": per_page, "totalItems": len(self.collection)}}
+        })
+        return self
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(18)
+class TestPager(unittest.TestCase):
+
+    def test_1(self):
+        rest = SlowRestAPI(1234)
+        pager = CapellaPager(rest, "/clusters", per_page=50)
+        result = pager.fetch_all(workers=8)
+        assert result == rest.collection
+        assert pager.pages_fetched == 25
+        assert len(rest.threads) > 1
+        assert CapellaPager(rest, "/clusters", per_page=50).fetch_all(workers=1) == rest.collection
+
+    def test_2(self):
+        rest = SlowRestAPI(30)
+        assert CapellaPager(rest, "/clusters", per_page=50).fetch_all() == rest.collection
+        assert CapellaPager(SlowRestAPI(0), "/clusters").fetch_all() == []
+        assert list(CapellaPager(rest, "/clusters", per_page=7, prefetch=True).records()) == rest.collection
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import logging
+import pytest
+import warnings
+import unittest
+from libcapella.mock_api import MockCapellaAPI
+from libcapella.config import CapellaConfig
+from libcapella.organization import CapellaOrganization
+from libcapella.project import CapellaProject
+from libcapella.database import CapellaDatabase
+from libcapella.columnar import CapellaColumnar
+from libcapella.database_credentials import CapellaDatabaseCredentials
+from libcapella.database_allowed_cidr import CapellaAllowedCIDR
+from libcapella.logic.project import CapellaProjectBuilder
+from libcapella.logic.credentials import DatabaseCredentialsBuilder
+from libcapella.user_directory import CapellaUserDirectory
+from libcapella.cache import resolution_cache
+from libcapella.pool import session_pool
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_19')
+logger.addHandler(logging.NullHandler())
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(19)
+class TestMockAPI(unittest.TestCase):
+
+    def setUp(self):
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        session_pool.close()
+        self.api = MockCapellaAPI().start()
+        self.ids = self.api.populate(projects=3, databases=2, columnar=1, users=120, allowed_cidrs=250, credentials=5)
+        self.config = CapellaConfig(config_dict=self.api.config(account_email=self.ids["account_email"], database_name="database-1", project_name="project-2"))
+
+    def tearDown(self):
+        self.api.stop()
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        session_pool.close()
+
+    def test_1(self):
+        org = CapellaOrganization(self.config)
+        assert org.id == self.ids["organization_id"]
+        project = CapellaProject(org)
+        assert project.project.name == "project-2"
+        assert project.user.id == self.ids["account_id"]
+        database = CapellaDatabase(project)
+        assert database.database.name == "database-1"
+        assert database.database.currentState == "healthy"
+        assert len(database.list()) == 2
+        assert len(CapellaColumnar(project).list()) == 1
+        assert len(project.user.list()) == 120
+        cidrs = CapellaAllowedCIDR(database)
+        assert len(cidrs.list()) == 250
+        assert [c.cidr for c in cidrs.iter_allowed_cidrs(prefetch=True)] == [c.cidr for c in cidrs.list()]
+
+    def test_2(self):
+        org = CapellaOrganization(self.config)
+        project = CapellaProject(org, "new-project")
+        assert project.id is None
+        project.create(CapellaProjectBuilder().name("new-project").build())
+        assert project.user.owns_project(project.id)
+        assert CapellaProject(org, "new-project").id == project.id
+        database = CapellaDatabase(project, "database-0")
+        assert database.id is None
+
+    def test_3(self):
+        org = CapellaOrganization(self.config)
+        database = CapellaDatabase(CapellaProject(org))
+        credentials = CapellaDatabaseCredentials(database)
+        self.api.fail_next(3, 429, 0.01)
+        results = credentials.create_many([DatabaseCredentialsBuilder(f"app-{n}").build() for n in range(10)], concurrency=4)
+        assert all(r.ok for r in results)
+        assert len(credentials.list()) == 15
+        assert org.rate_limiter.throttled == 3
+        cidrs = CapellaAllowedCIDR(database)
+        plan = cidrs.sync([c.cidr for c in cidrs.list()][1:] + ["203.0.113.0/24"])
+        assert plan.ok and plan.changes == 2
+        assert len(cidrs.list()) == 250
+
+    def test_4(self):
+        self.api.error_rate = 1.0
+        self.api.error_code = 404
+        with pytest.raises(Exception):
+            CapellaOrganization(self.config)
+
+    def test_5(self):
+        org = CapellaOrganization(self.config)
+        database = CapellaDatabase(CapellaProject(org))
+        database_id = database.id
+        self.api.state.update(database.endpoint, database_id, dict(currentState="turnedOff"))
+        project = CapellaProject(org)
+        self.api.reset_counts()
+        rebuilt = CapellaDatabase(project)
+        assert self.api.request_count == 1
+        assert rebuilt.id == database_id
+        assert rebuilt.database.currentState == "turnedOff"
+        self.api.state.delete(database.endpoint, database_id)
+        assert CapellaDatabase(project).id is None
+        assert resolution_cache.get(resolution_cache.key(org.api_host, database.endpoint, "database-1")) is None
+        self.api.state.add(database.endpoint, dict(name="database-1"))
+        assert CapellaDatabase(project).id not in (None, database_id)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import json
+import attrs
+import logging
+import pytest
+import warnings
+import unittest
+from libcapella.logic.common import not_none, serialize, serialize_bytes, no_audit
+from libcapella.logic.database import CapellaDatabaseBuilder
+from libcapella.logic.credentials import DatabaseCredentialsBuilder
+from libcapella.logic.network_peers import NetworkPeerBuilder
+from libcapella.logic.user import User
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_20')
+logger.addHandler(logging.NullHandler())
+
+
+def stripped(model) -> dict:
+    result = not_none(attrs.asdict(model))
+    result.pop("audit", None)
+    return result
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(20)
+class TestSerializer(unittest.TestCase):
+
+    def test_1(self):
+        database = CapellaDatabaseBuilder("aws").service_group("4x16", 3, 256).build()
+        result = database.as_dict_striped
+        assert result == stripped(database)
+        assert list(result) == list(stripped(database))
+        assert "id" not in result and "audit" not in result
+        assert json.loads(serialize_bytes(database, filter=no_audit)) == json.loads(json.dumps(result))
+
+    def test_2(self):
+        builder = DatabaseCredentialsBuilder("developer", "P@ssw0rd!")
+        builder.data_read_write()
+        credentials = builder.build()
+        assert "resources" not in credentials.as_dict_striped["access"][0]
+        peer = NetworkPeerBuilder().provider_type("aws").account_id("123456789012").vpc_id("vpc-1").region("us-east-1").cidr("10.1.0.0/23").build()
+        result = peer.as_dict_striped
+        assert "status" not in result and "commands" not in result
+        assert result["providerConfig"]["vpcId"] == "vpc-1"
+
+    def test_3(self):
+        user = User.create(dict(id="u1", email="user@example.com", organizationRoles=["organizationMember"], resources=[dict(type="project", id="p1", roles=["projectOwner"])],
+                                audit=dict(createdBy="admin", version=1)))
+        assert serialize(user) == not_none(attrs.asdict(user))
+        result = serialize(user, filter=lambda a, v: a.name in ("email", "resources", "type", "roles"))
+        assert result == dict(email="user@example.com", resources=[dict(type="project", roles=["projectOwner"])])
+        assert serialize([user, None, user])[1]["audit"] == dict(createdBy="admin", version=1)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+import logging
+import pytest
+import warnings
+import unittest
+from restfull.bearer_auth import BearerAuth
+from libcapella.codec import JsonBackend, get_backend, register_backend, stdlib_backend
+from libcapella.rest import CapellaRestAPI
+from libcapella.base import clone_rest
+from libcapella.mock_api import MockCapellaAPI
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_21')
+logger.addHandler(logging.NullHandler())
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(21)
+class TestJsonBackend(unittest.TestCase):
+
+    def test_1(self):
+        assert get_backend("json").name == "json"
+        assert get_backend() is get_backend("auto")
+        assert get_backend().loads(get_backend().dumps(dict(a=[1, "b"]))) == dict(a=[1, "b"])
+        register_backend("custom", lambda: JsonBackend("custom", stdlib_backend().loads, stdlib_backend().dumps))
+        assert get_backend("custom").name == "custom"
+        with self.assertRaises(ValueError):
+            get_backend("unknown")
+
+    def test_2(self):
+        with MockCapellaAPI() as api:
+            rest = CapellaRestAPI(BearerAuth("token"), api.host, use_ssl=False, port=api.port, json_backend="json")
+            endpoint = "/v4/organizations/org/projects"
+            record_id = rest.post(endpoint, dict(name="project", description="Ünïcode")).validate().as_json().json_key("id")
+            record = rest.get(f"{endpoint}/{record_id}").validate().as_json().record()
+            assert record["description"] == "Ünïcode"
+            assert record_id in rest.response_text
+            assert rest.delete(f"{endpoint}/{record_id}").validate().as_json().is_empty
+            clone = clone_rest(rest)
+            assert clone.response_text is None and clone.json() == {}
+            assert clone.get(f"{endpoint}?page=1&perPage=10").validate().json("data") == []
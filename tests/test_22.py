@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import os
+import logging
+import pytest
+import warnings
+import unittest
+import tempfile
+from libcapella.mock_api import MockCapellaAPI
+from libcapella.config import CapellaConfig
+from libcapella.organization import CapellaOrganization
+from libcapella.inventory import CapellaInventory
+from libcapella.logic.inventory import InventorySnapshot, ChangeSet
+from libcapella.logic.project import Project
+from libcapella.user_directory import CapellaUserDirectory
+from libcapella.cache import resolution_cache
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_22')
+logger.addHandler(logging.NullHandler())
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(22)
+class TestInventory(unittest.TestCase):
+
+    def setUp(self):
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        self.api = MockCapellaAPI().start()
+        self.ids = self.api.populate(projects=2, databases=2, columnar=1, users=3, allowed_cidrs=2, credentials=1, network_peers=1, app_services=True)
+        self.org = CapellaOrganization(CapellaConfig(config_dict=self.api.config(account_email=self.ids["account_email"])))
+
+    def tearDown(self):
+        self.api.stop()
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+
+    def test_1(self):
+        self.api.reset_counts()
+        snapshot = CapellaInventory(self.org, workers=4).crawl()
+        assert snapshot.counts == dict(project=2, database=4, columnar=2, app_service=4, allowed_cidr=8, credentials=4, network_peer=4, user=3)
+        assert snapshot.requests == self.api.request_count == 21
+        assert not snapshot.errors
+        database = snapshot.databases[0]
+        assert len(snapshot.children(database.id, "allowed_cidr")) == 2
+        app_service = next(i for i in snapshot.items if i.kind == "app_service")
+        assert app_service.project_id == snapshot.get("database", app_service.parent).project_id
+
+    def test_2(self):
+        self.api.reset_counts()
+        snapshot = CapellaInventory(self.org, include=["credentials"]).crawl()
+        assert snapshot.counts == dict(credentials=4)
+        assert self.api.request_count == 7
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "inventory.jsonl")
+            snapshot.to_jsonl(filename)
+            assert InventorySnapshot.from_jsonl(filename) == snapshot
+        with self.assertRaises(ValueError):
+            CapellaInventory(self.org, include=["clusters"])
+
+    def test_3(self):
+        self.api.fail_next(1, code=403)
+        snapshot = CapellaInventory(self.org, workers=1, include=["project", "user"]).crawl()
+        assert len(snapshot.errors) == 1
+        assert snapshot.errors[0].endpoint.endswith("/projects")
+        assert snapshot.counts == dict(user=3)
+
+    def test_4(self):
+        inventory = CapellaInventory(self.org)
+        previous = inventory.crawl()
+        database = previous.get("database", previous.databases[0].id)
+        peer = previous.children(database.id, "network_peer")[0]
+        self.api.state.add(f"{database.endpoint}/{database.id}/allowedcidrs", dict(cidr="192.168.0.0/24"))
+        self.api.state.update(peer.endpoint, peer.id, dict(name="renamed"))
+        self.api.state.find(database.endpoint, database.id)["currentState"] = "turnedOff"
+        self.api.reset_counts()
+        snapshot, changes = inventory.refresh(previous)
+        reused = len(previous.databases) * 3
+        assert snapshot.requests == self.api.request_count == previous.requests - reused
+        assert snapshot.get("database", database.id).resource.currentState == "turnedOff"
+        assert [new.id for old, new in changes.modified] == [database.id]
+        assert not changes.added and not changes.removed
+        self.api.state.update(database.endpoint, database.id, dict(description="changed"))
+        self.api.reset_counts()
+        snapshot, changes = inventory.refresh(snapshot)
+        assert self.api.request_count == previous.requests - reused + 3
+        assert [item.kind for item in changes.added] == ["allowed_cidr"]
+        assert sorted(new.kind for old, new in changes.modified) == ["database", "network_peer"]
+        full = CapellaInventory(self.org, max_age=0)
+        self.api.reset_counts()
+        current, changes = full.refresh(snapshot)
+        assert self.api.request_count == current.requests == previous.requests
+        assert changes.empty and changes.unchanged == len(current.items)
+
+    def test_5(self):
+        first = [Project.create(dict(id="p1", name="one", audit=dict(version=1))), Project.create(dict(id="p2", name="two", audit=dict(version=1)))]
+        second = [Project.create(dict(id="p2", name="two", audit=dict(version=2))), Project.create(dict(id="p3", name="three", audit=dict(version=1)))]
+        changes = ChangeSet.compare(first, second)
+        assert [p.id for p in changes.added] == ["p3"]
+        assert [p.id for p in changes.removed] == ["p1"]
+        assert [(o.audit.version, n.audit.version) for o, n in changes.modified] == [(1, 2)]
+        assert changes.changes == 3 and changes.unchanged == 0
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+import os
+import logging
+import pytest
+import warnings
+import unittest
+import tempfile
+import requests
+from libcapella.mock_api import MockCapellaAPI
+from libcapella.config import CapellaConfig
+from libcapella.organization import CapellaOrganization
+from libcapella.response_cache import ResponseCache, revalidate
+from libcapella.user_directory import CapellaUserDirectory
+from libcapella.cache import resolution_cache
+from libcapella.pool import session_pool
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_23')
+logger.addHandler(logging.NullHandler())
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(23)
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        session_pool.close()
+        self.directory = tempfile.TemporaryDirectory()
+        self.api = MockCapellaAPI().start()
+        self.ids = self.api.populate(projects=3, databases=1, users=2)
+
+    def tearDown(self):
+        self.api.stop()
+        self.directory.cleanup()
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        session_pool.close()
+
+    def organization(self, max_age: float = 0.0) -> CapellaOrganization:
+        config = self.api.config(account_email=self.ids["account_email"],
+                                 cache_responses=True,
+                                 cache_path=os.path.join(self.directory.name, "responses.db"),
+                                 cache_max_age=max_age)
+        return CapellaOrganization(CapellaConfig(config_dict=config))
+
+    def test_1(self):
+        org = self.organization()
+        endpoint = f"{org.id_endpoint}/projects"
+        first = org.rest.get(endpoint).validate().json()
+        self.api.reset_counts()
+        second = org.rest.get(endpoint).validate().json()
+        assert first == second
+        assert self.api.request_count == 1
+        assert self.api.not_modified == 1
+        assert org.response_cache.revalidated == 1
+        assert org.response_cache.hits == 0
+
+    def test_2(self):
+        org = self.organization(max_age=300)
+        endpoint = f"{org.id_endpoint}/projects"
+        org.rest.get(endpoint).validate()
+        self.api.reset_counts()
+        assert len(org.rest.get(endpoint).validate().json()["data"]) == 3
+        assert self.api.request_count == 0
+        assert org.response_cache.hits == 1
+        with revalidate(org.rest):
+            org.rest.get(endpoint).validate()
+        assert org.rest.cache_control is None
+        assert self.api.request_count == 1
+        assert self.api.not_modified == 1
+        org.rest.post(endpoint, dict(name="project-new")).validate()
+        assert len(org.rest.get(endpoint).validate().json()["data"]) == 4
+        assert self.api.request_count == 3
+
+    def test_3(self):
+        cache = ResponseCache(":memory:", max_bytes=2048)
+        scope = ResponseCache.scope("api.example.com", "token")
+        assert scope != ResponseCache.scope("api.example.com", "other")
+        for n in range(4):
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["ETag"] = f'"{n}"'
+            response._content = b"x" * 600
+            assert cache.put(scope, f"https://api.example.com/v4/items/{n}", response)
+        assert cache.evictions == 1
+        assert cache.entries == 3
+        assert cache.size <= 2048
+        assert cache.get(scope, "https://api.example.com/v4/items/0") is None
+        assert cache.get(scope, "https://api.example.com/v4/items/3").etag == '"3"'
+        cache.invalidate(scope, "https://api.example.com/v4/items")
+        assert cache.entries == 0
+        cache.close()
+
+    def test_4(self):
+        cached = self.organization(max_age=300)
+        endpoint = f"{cached.id_endpoint}/projects"
+        cached.rest.get(endpoint).validate()
+        plain = CapellaOrganization(CapellaConfig(config_dict=self.api.config(account_email=self.ids["account_email"])))
+        assert plain.response_cache is None
+        assert plain.rest.session is not cached.rest.session
+        revalidating = self.organization(max_age=0)
+        self.api.reset_counts()
+        plain.rest.get(endpoint).validate()
+        plain.rest.get(endpoint).validate()
+        assert self.api.request_count == 2
+        cached.rest.get(endpoint).validate()
+        assert self.api.request_count == 2
+        assert revalidating.response_cache is not cached.response_cache
+        assert cached.response_cache.max_age == 300
+        revalidating.rest.get(endpoint).validate()
+        assert self.api.request_count == 3 and self.api.not_modified == 1
+        assert cached.rate_limiter is plain.rate_limiter
+
+    def test_5(self):
+        org = self.organization(max_age=300)
+        listing = f"{org.id_endpoint}/appservices"
+        for project in org.rest.get(f"{org.id_endpoint}/projects").validate().json()["data"]:
+            clusters = f"{org.id_endpoint}/projects/{project['id']}/clusters"
+            for database in org.rest.get(clusters).validate().json()["data"]:
+                self.api.state.add(f"{clusters}/{database['id']}/appservices", dict(name=f"appservice-{project['name']}", nodes=2))
+        apps = org.rest.get(listing).validate().json()["data"]
+        assert len(apps) == 3
+        self.api.reset_counts()
+        org.rest.get(listing).validate()
+        assert self.api.request_count == 0
+        app = next(a for a in apps if a["clusterId"] == database["id"])
+        org.rest.delete(f"{clusters}/{database['id']}/appservices/{app['id']}").validate()
+        assert len(org.rest.get(listing).validate().json()["data"]) == 2
+        assert self.api.request_count == 2
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import logging
+import pytest
+import warnings
+import unittest
+from libcapella.mock_api import MockCapellaAPI
+from libcapella.config import CapellaConfig
+from libcapella.organization import CapellaOrganization
+from libcapella.project import CapellaProject
+from libcapella.database import CapellaDatabase
+from libcapella.columnar import CapellaColumnar
+from libcapella.database_allowed_cidr import CapellaAllowedCIDR
+from libcapella.user_directory import CapellaUserDirectory
+from libcapella.cache import resolution_cache
+from libcapella.pool import session_pool
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_24')
+logger.addHandler(logging.NullHandler())
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(24)
+class TestLazyHandles(unittest.TestCase):
+
+    def setUp(self):
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        session_pool.close()
+        self.api = MockCapellaAPI().start()
+        self.ids = self.api.populate(projects=2, databases=2, columnar=1, users=50, allowed_cidrs=3)
+        org = CapellaOrganization(CapellaConfig(config_dict=self.api.config(account_email=self.ids["account_email"], project_name="project-1")))
+        project = CapellaProject(org)
+        self.project_id = project.id
+        self.database_id = CapellaDatabase(project, "database-1").id
+        self.columnar_id = CapellaColumnar(project, "columnar-0").id
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        self.api.reset_counts()
+
+    def tearDown(self):
+        self.api.stop()
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        session_pool.close()
+
+    def test_1(self):
+        config = CapellaConfig(config_dict=self.api.config(organization_id=self.ids["organization_id"],
+                                                           project_id=self.project_id,
+                                                           database_id=self.database_id,
+                                                           lazy=True))
+        org = CapellaOrganization(config)
+        project = CapellaProject(org)
+        database = CapellaDatabase(project)
+        columnar = CapellaColumnar(project, cluster_id=self.columnar_id)
+        cidrs = CapellaAllowedCIDR(database)
+        assert self.api.request_count == 0
+        assert database.id == self.database_id
+        assert columnar.id == self.columnar_id
+        assert not database.resolved and not project.resolved and not org.resolved
+        assert len(cidrs.list()) == 3
+        assert self.api.request_count == 1
+        assert database.database.name == "database-1"
+        assert columnar.cluster.name == "columnar-0"
+        assert self.api.request_count == 3
+        assert project.project.name == "project-1"
+        assert org.organization.id == self.ids["organization_id"]
+        assert self.api.request_count == 5
+
+    def test_2(self):
+        config = CapellaConfig(config_dict=self.api.config(account_email=self.ids["account_email"], project_name="project-1", lazy=True))
+        org = CapellaOrganization(config)
+        assert self.api.request_count == 0
+        project = CapellaProject(org)
+        assert self.api.request_count == 1
+        database = CapellaDatabase(project, "database-0")
+        assert self.api.request_count == 3
+        assert database.database.name == "database-0"
+        assert database.id == database.database.id
+        assert project.user.id == self.ids["account_id"]
+        assert project.project.name == "project-1"
+
+    def test_3(self):
+        org = CapellaOrganization(CapellaConfig(config_dict=self.api.config(account_email=self.ids["account_email"])))
+        self.api.reset_counts()
+        project = CapellaProject(org, project_id=self.project_id)
+        database = CapellaDatabase(project, database_id=self.database_id)
+        assert self.api.request_count == 0
+        assert database.database.name == "database-1"
+        assert self.api.request_count == 1
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import logging
+import pytest
+import warnings
+import unittest
+import subprocess
+import libcapella
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_25')
+logger.addHandler(logging.NullHandler())
+
+root = os.path.dirname(libcapella._ROOT)
+network = {"restfull", "requests", "aiohttp", "urllib3"}
+
+
+def imported(statement: str) -> set:
+    code = f"import sys\nbefore = set(sys.modules)\n{statement}\nprint('\\n'.join(set(sys.modules) - before))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root)
+    return set(result.stdout.split())
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(25)
+class TestImportTime(unittest.TestCase):
+
+    def test_1(self):
+        modules = imported("import libcapella")
+        assert modules == {"libcapella"}
+        modules = imported("import libcapella\nlibcapella.CapellaConfig")
+        assert "libcapella.config" in modules
+        assert not modules & network
+        assert "attr" not in modules
+
+    def test_2(self):
+        modules = imported("from libcapella.config import CapellaConfig\nCapellaConfig(config_dict=dict(token='token'))")
+        assert not modules & network
+        assert not modules & {"attr", "tomllib", "tomli", "sqlite3"}
+        modules = imported("import libcapella.logic.database\nimport libcapella.logic.inventory")
+        assert not modules & network
+        assert "libcapella.network_util" not in modules
+
+    def test_3(self):
+        modules = imported("import libcapella.organization")
+        assert "sqlite3" not in modules
+        assert libcapella.CapellaDatabase.__module__ == "libcapella.database"
+        assert libcapella.logic.__name__ == "libcapella.logic"
+        assert "CapellaInventory" in dir(libcapella)
+        with self.assertRaises(AttributeError):
+            getattr(libcapella, "NoSuchThing")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+import os
+import logging
+import pytest
+import warnings
+import unittest
+import tempfile
+from unittest import mock
+from libcapella.config import CapellaConfig
+from libcapella.config_cache import config_cache
+from libcapella.config_data import map_toml, map_ini
+from libcapella.config_profile import CapellaProfileConfig
+from libcapella.config_toml import CapellaTomlConfig
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_26')
+logger.addHandler(logging.NullHandler())
+
+credentials = """[default]
+token_file = test-token.txt
+account_email = user@example.com
+
+[alpha]
+project = alpha
+lazy = true
+database_id = 1234
+
+[beta]
+api_host = api.example.com
+api_port = 8443
+use_ssl = false
+rate_limit = 5
+"""
+
+toml = """[capella]
+token = "toml-token"
+lazy = false
+
+[capella.api]
+host = "api.example.com"
+ssl = false
+max_connections = 4
+
+[capella.project]
+name = "project-1"
+
+[capella.cache]
+enabled = true
+max_age = 30
+"""
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(26)
+class TestConfigCache(unittest.TestCase):
+
+    def setUp(self):
+        config_cache.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.home = mock.patch.dict(os.environ, {"HOME": self.directory.name})
+        self.home.start()
+        os.mkdir(os.path.join(self.directory.name, ".capella"))
+        self.credentials = os.path.join(self.directory.name, ".capella", "credentials")
+        with open(self.credentials, "w") as config_file:
+            config_file.write(credentials)
+        with open(os.path.join(self.directory.name, ".capella", "test-token.txt"), "w") as token_file:
+            token_file.write("APIKeyId: id\nAPIKeyToken: secret\n")
+
+    def tearDown(self):
+        self.home.stop()
+        self.directory.cleanup()
+        config_cache.clear()
+
+    def test_1(self):
+        profiles = CapellaProfileConfig.load_all()
+        assert list(profiles) == ["default", "alpha", "beta"]
+        assert config_cache.misses == 2
+        alpha = profiles["alpha"]
+        assert alpha.token == "secret"
+        assert alpha.account_email == "user@example.com"
+        assert alpha.project_name == "alpha"
+        assert alpha.lazy is True
+        assert alpha.database_id == "1234"
+        beta = profiles["beta"]
+        assert beta.api_host == "api.example.com"
+        assert beta.api_port == 8443
+        assert beta.use_ssl is False
+        assert beta.rate_limit == 5.0
+        assert profiles["default"].project_name is None
+        for n in range(10):
+            assert CapellaConfig(profile="alpha").config.project_name == "alpha"
+        assert config_cache.misses == 2
+        with self.assertRaises(RuntimeError):
+            CapellaProfileConfig(profile="gamma")
+
+    def test_2(self):
+        assert CapellaProfileConfig(profile="alpha").project_name == "alpha"
+        with open(self.credentials, "w") as config_file:
+            config_file.write(credentials.replace("project = alpha", "project = renamed"))
+        assert CapellaProfileConfig(profile="alpha").project_name == "renamed"
+        assert config_cache.misses == 3
+
+    def test_3(self):
+        filename = os.path.join(self.directory.name, "config.toml")
+        with open(filename, "w") as toml_file:
+            toml_file.write(toml)
+        first = CapellaTomlConfig(filename)
+        second = CapellaTomlConfig(filename)
+        assert config_cache.misses == 1
+        assert str(first) == str(second)
+        assert first.token == "toml-token"
+        assert first.api_host == "api.example.com"
+        assert first.use_ssl is False
+        assert first.lazy is False
+        assert first.max_connections == 4
+        assert first.project_name == "project-1"
+        assert first.cache_responses is True
+        assert first.cache_max_age == 30.0
+        assert map_toml(dict(capella=dict(api=dict(port=0, host="")))) == {}
+        assert map_ini(dict(use_ssl="", unknown="x", organization="org")) == dict(_organization_name="org")
+        with self.assertRaises(ValueError):
+            map_ini(dict(lazy="maybe"))
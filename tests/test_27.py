@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import logging
+import pytest
+import warnings
+import unittest
+from libcapella.mock_api import MockCapellaAPI
+from libcapella.config import CapellaConfig
+from libcapella.config_data import CapellaConfigData
+from libcapella.project import CapellaProject
+from libcapella.registry import CapellaClientRegistry
+from libcapella.user_directory import CapellaUserDirectory
+from libcapella.cache import resolution_cache
+from libcapella.pool import session_pool
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_27')
+logger.addHandler(logging.NullHandler())
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(27)
+class TestClientRegistry(unittest.TestCase):
+
+    def setUp(self):
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        session_pool.close()
+        self.apis = [MockCapellaAPI().start() for _ in range(3)]
+        self.ids = [api.populate(projects=n + 1, users=5) for n, api in enumerate(self.apis)]
+        self.registry = CapellaClientRegistry(workers=3)
+        for n, api in enumerate(self.apis):
+            self.registry.add(f"tenant-{n}", api.config(token=f"token-{n}", account_email=self.ids[n]["account_email"]))
+
+    def tearDown(self):
+        self.registry.close()
+        for api in self.apis:
+            api.stop()
+        resolution_cache.clear()
+        CapellaUserDirectory.reset()
+        session_pool.close()
+
+    def test_1(self):
+        results = self.registry.map(lambda org: (org.id, len(CapellaProject(org).list())))
+        assert list(results) == ["tenant-0", "tenant-1", "tenant-2"]
+        for n in range(3):
+            assert results[f"tenant-{n}"].ok
+            assert results[f"tenant-{n}"].result == (self.ids[n]["organization_id"], n + 1)
+        assert self.registry.by_organization(self.ids[1]["organization_id"]).name == "tenant-1"
+        assert session_pool.size == 3
+        assert set(self.registry.stats()) == {"tenant-0", "tenant-1", "tenant-2"}
+
+    def test_2(self):
+        self.registry.organization("tenant-0")
+        self.apis[1].fail_next(1, code=403)
+        results = self.registry.map(lambda org: org.id, names=["tenant-1", "tenant-2"])
+        assert not results["tenant-1"].ok
+        assert results["tenant-2"].result == self.ids[2]["organization_id"]
+        assert self.registry.map(lambda org: org.id, names=["tenant-1"])["tenant-1"].ok
+        with self.assertRaises(ValueError):
+            self.registry.add("tenant-0", dict(token="other"))
+        self.registry.remove("tenant-0")
+        assert "tenant-0" not in self.registry
+        assert len(self.registry) == 2
+
+    def test_3(self):
+        first = CapellaConfig(config_dict=dict(token="first"))
+        second = CapellaConfig(token="second")
+        assert first.config is not second.config
+        assert first.config.token == "first"
+        assert second.config.token == "second"
+        data = CapellaConfigData()
+        data.from_dict(dict(token="shared"))
+        assert CapellaConfig(config_data=data).config is data
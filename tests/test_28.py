@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import os
+import random
+import logging
+import pytest
+import warnings
+import unittest
+import tempfile
+import ipaddress
+from libcapella.network_util import NetworkDriver
+from libcapella.network_allocator import NetworkAllocator
+
+warnings.filterwarnings("ignore")
+logger = logging.getLogger('tests.test_28')
+logger.addHandler(logging.NullHandler())
+
+
+def legacy_next_network(ip_space: list, super_net: ipaddress.IPv4Network):
+    candidates = list(super_net.subnets(new_prefix=16))
+    for network in ip_space:
+        available = []
+        for candidate in candidates:
+            try:
+                if network.prefixlen < 16:
+                    list(network.address_exclude(candidate))
+                else:
+                    list(candidate.address_exclude(network))
+            except ValueError:
+                available.append(candidate)
+        candidates = available
+    return candidates[0].exploded if candidates else None
+
+
+@pytest.mark.unit_test
+@pytest.mark.order(28)
+class TestNetworkAllocator(unittest.TestCase):
+
+    def test_1(self):
+        allocator = NetworkAllocator("10.0.0.0/8")
+        assert allocator.reserve("10.0.0.0/16")
+        assert not allocator.reserve("10.0.0.0/16")
+        assert allocator.reserve("10.1.128.0/24")
+        assert allocator.reserve("172.16.0.0/12")
+        assert allocator.allocate(16) == "10.2.0.0/16"
+        assert allocator.allocate(24) == "10.1.0.0/24"
+        assert not allocator.is_free("10.1.128.0/25")
+        assert allocator.is_free("10.1.129.0/24")
+        assert allocator.release("10.0.0.0/16")
+        assert allocator.allocate(16) == "10.0.0.0/16"
+        assert not allocator.release("10.200.0.0/16")
+        with self.assertRaises(ValueError):
+            allocator.allocate(7)
+        small = NetworkAllocator("192.168.0.0/30")
+        assert [small.allocate(32) for _ in range(5)] == ["192.168.0.0/32", "192.168.0.1/32", "192.168.0.2/32", "192.168.0.3/32", None]
+        assert small.reserve("192.168.0.0/16")
+        for n in range(4):
+            small.release(f"192.168.0.{n}/32")
+        assert small.available == 0
+        small.release("192.168.0.0/16")
+        assert list(small.free_blocks()) == ["192.168.0.0/30"]
+
+    def test_2(self):
+        rng = random.Random(7)
+        for trial in range(25):
+            driver = NetworkDriver()
+            ip_space = []
+            for n in range(rng.randint(0, 20)):
+                address = (rng.choice((10, 10, 11)) << 24) | rng.getrandbits(24)
+                network = ipaddress.ip_network((address, rng.choice((7, 8, 12, 16, 17, 24))), strict=False)
+                ip_space.append(network)
+                driver.add_network(network.exploded)
+            for n in range(2):
+                expected = legacy_next_network(ip_space, driver.super_net)
+                assert driver.get_next_network() == expected
+                if expected:
+                    ip_space.append(ipaddress.ip_network(expected))
+        driver = NetworkDriver()
+        driver.ip_space.append(ipaddress.ip_network("10.0.0.0/16"))
+        assert driver.get_next_network() == "10.1.0.0/16"
+        assert driver.active_network == ipaddress.ip_network("10.1.0.0/16")
+        assert driver.get_next_network(prefix=24) == "10.2.0.0/24"
+
+    def test_3(self):
+        allocator = NetworkAllocator("fd00::/48")
+        assert allocator.allocate(64) == "fd00:0000:0000:0000:0000:0000:0000:0000/64"
+        allocator.reserve("fd00:0:0:1::/64")
+        assert allocator.allocate(56) == "fd00:0000:0000:0100:0000:0000:0000:0000/56"
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "networks.json")
+            allocator.save(filename)
+            restored = NetworkAllocator.load(filename)
+        assert restored.reserved == allocator.reserved
+        assert restored.available == allocator.available
+        assert list(restored.free_blocks()) == list(allocator.free_blocks())
+        with self.assertRaises(ValueError):
+            allocator.reserve("10.0.0.0/8")